@@ -13,6 +13,7 @@ import hashlib
 import secrets
 import os
 from pathlib import Path
+from types import MappingProxyType
 import uuid
 
 # Set page configuration
@@ -859,30 +860,40 @@ def get_historical_return_stats():
     return stats
 
 
+# 2024 federal brackets as (lower, upper, rate), shared by every tax calculation
+FEDERAL_TAX_BRACKETS = MappingProxyType({
+    "married_jointly": (
+        (0, 23200, 0.10),
+        (23200, 94300, 0.12),
+        (94300, 201050, 0.22),
+        (201050, 383900, 0.24),
+        (383900, 487450, 0.32),
+        (487450, 731200, 0.35),
+        (731200, float('inf'), 0.37)
+    ),
+    "single": (
+        (0, 11600, 0.10),
+        (11600, 47150, 0.12),
+        (47150, 100525, 0.22),
+        (100525, 191950, 0.24),
+        (191950, 243725, 0.32),
+        (243725, 609350, 0.35),
+        (609350, float('inf'), 0.37)
+    ),
+})
+
+# 2024 standard deductions
+STANDARD_DEDUCTIONS = MappingProxyType({"married_jointly": 29200, "single": 14600})
+
+
 def calculate_federal_income_tax(taxable_income, filing_status="married_jointly", year=2024):
     """Calculate federal income tax based on tax brackets"""
 
-    # 2024 tax brackets for married filing jointly
-    if filing_status == "married_jointly":
-        brackets = [
-            (0, 23200, 0.10),
-            (23200, 94300, 0.12),
-            (94300, 201050, 0.22),
-            (201050, 383900, 0.24),
-            (383900, 487450, 0.32),
-            (487450, 731200, 0.35),
-            (731200, float('inf'), 0.37)
-        ]
-    else:  # single
-        brackets = [
-            (0, 11600, 0.10),
-            (11600, 47150, 0.12),
-            (47150, 100525, 0.22),
-            (100525, 191950, 0.24),
-            (191950, 243725, 0.32),
-            (243725, 609350, 0.35),
-            (609350, float('inf'), 0.37)
-        ]
+    # Nothing to tax (e.g. income under the standard deduction)
+    if taxable_income <= 0:
+        return 0
+
+    brackets = FEDERAL_TAX_BRACKETS["married_jointly" if filing_status == "married_jointly" else "single"]
 
     tax = 0
     for i, (lower, upper, rate) in enumerate(brackets):
@@ -902,7 +913,7 @@ def calculate_annual_taxes(gross_income, pretax_deductions=0, state_tax_rate=0.0
     """Calculate total annual taxes including federal, state, and FICA"""
 
     # Standard deduction for 2024
-    standard_deduction = 29200 if filing_status == "married_jointly" else 14600
+    standard_deduction = STANDARD_DEDUCTIONS["married_jointly" if filing_status == "married_jointly" else "single"]
 
     # Calculate adjusted gross income
     adjusted_gross_income = max(0, gross_income - pretax_deductions)
@@ -914,7 +925,7 @@ def calculate_annual_taxes(gross_income, pretax_deductions=0, state_tax_rate=0.0
     federal_tax = calculate_federal_income_tax(taxable_income, filing_status)
 
     # State income tax (on AGI)
-    state_tax = adjusted_gross_income * state_tax_rate
+    state_tax = adjusted_gross_income * state_tax_rate if adjusted_gross_income > 0 else 0
 
     # FICA taxes (on gross income, up to limits)
     # Social Security: 6.2% up to $160,200 (2024)
@@ -972,23 +983,20 @@ def timeline_tab():
     years = list(range(start_year, end_year + 1))
 
     # Parent career timelines
-    for year in years:
+    parentX_incomes = get_income_for_years(
+        st.session_state.parentX_income, st.session_state.parentX_raise,
+        st.session_state.parentX_job_changes, st.session_state.current_year, years)
+    parentY_incomes = get_income_for_years(
+        st.session_state.parentY_income, st.session_state.parentY_raise,
+        st.session_state.parentY_job_changes, st.session_state.current_year, years)
+    for year, parentX_income, parentY_income in zip(years, parentX_incomes, parentY_incomes):
         parentX_age = st.session_state.parentX_age + (year - st.session_state.current_year)
         parentY_age = st.session_state.parentY_age + (year - st.session_state.current_year)
 
         # Parent X career
         if parentX_age >= 18 and parentX_age < st.session_state.parentX_retirement_age:
-            # Calculate income with raises and job changes
-            base_income = st.session_state.parentX_income
-            years_elapsed = year - st.session_state.current_year
-            current_income = base_income * ((1 + st.session_state.parentX_raise / 100) ** years_elapsed)
-
-            # Apply job changes
-            for _, job_change in st.session_state.parentX_job_changes.iterrows():
-                if year >= job_change['Year']:
-                    years_since_change = year - job_change['Year']
-                    current_income = job_change['New Income'] * (
-                            (1 + st.session_state.parentX_raise / 100) ** years_since_change)
+            # Income with raises and job changes
+            current_income = float(parentX_income)
 
             timeline_data.append({
                 'Year': year,
@@ -1008,17 +1016,8 @@ def timeline_tab():
 
         # Parent Y career
         if parentY_age >= 18 and parentY_age < st.session_state.parentY_retirement_age:
-            # Calculate income with raises and job changes
-            base_income = st.session_state.parentY_income
-            years_elapsed = year - st.session_state.current_year
-            current_income = base_income * ((1 + st.session_state.parentY_raise / 100) ** years_elapsed)
-
-            # Apply job changes
-            for _, job_change in st.session_state.parentY_job_changes.iterrows():
-                if year >= job_change['Year']:
-                    years_since_change = year - job_change['Year']
-                    current_income = job_change['New Income'] * (
-                            (1 + st.session_state.parentY_raise / 100) ** years_since_change)
+            # Income with raises and job changes
+            current_income = float(parentY_income)
 
             timeline_data.append({
                 'Year': year,
@@ -2242,18 +2241,13 @@ def children_tab():
     # Prepare display dataframe
     display_df = st.session_state.children_expenses.copy()
 
+    # Assume expenses are for when child reaches that age: one inflation multiplier per row
+    inflation_multiplier = np.power(1 + inflation_rate, display_df['Age'].to_numpy())
+    expense_columns = [col for col in display_df.columns if col != 'Age']
+
     if not st.session_state.children_today_dollars:
         # Apply inflation to display values
-        base_year = st.session_state.current_year
-        for index, row in display_df.iterrows():
-            age = row['Age']
-            # Assume expenses are for when child reaches that age
-            future_year = base_year + age
-            inflation_multiplier = (1 + inflation_rate) ** age
-
-            for col in display_df.columns:
-                if col != 'Age':
-                    display_df.at[index, col] = row[col] * inflation_multiplier
+        display_df[expense_columns] = display_df[expense_columns].mul(inflation_multiplier, axis=0)
 
     st.write("**Annual expenses for children by age (0-30 years)**")
     st.write("Edit the values below to customize expenses for each age and category.")
@@ -2351,19 +2345,15 @@ def children_tab():
         key="children_expenses_editor"
     )
 
-    # Convert back to today's dollars if needed and update session state
-    if not st.session_state.children_today_dollars:
-        # Convert back to today's dollars for storage
-        base_year = st.session_state.current_year
-        for index, row in edited_df.iterrows():
-            age = row['Age']
-            inflation_multiplier = (1 + inflation_rate) ** age
-
-            for col in edited_df.columns:
-                if col != 'Age':
-                    st.session_state.children_expenses.at[index, col] = row[col] / inflation_multiplier
-    else:
-        st.session_state.children_expenses = edited_df
+    # Convert back to today's dollars if needed and update session state. Only write when the
+    # table was actually edited, so an untouched table isn't rewritten (and round-tripped
+    # through the inflation multipliers) on every rerun
+    if not edited_df.equals(display_df):
+        if not st.session_state.children_today_dollars:
+            # Convert back to today's dollars for storage
+            st.session_state.children_expenses[expense_columns] = edited_df[expense_columns].div(inflation_multiplier, axis=0)
+        else:
+            st.session_state.children_expenses = edited_df
 
     # Calculate and display summary statistics
     st.subheader("📊 Children Expenses Summary")
@@ -2465,6 +2455,24 @@ def calculate_monthly_house_payment(house):
     return monthly_payment + monthly_property_tax + monthly_insurance
 
 
+def calculate_major_purchase_annual_payment(purchase):
+    """Annual payment for a major purchase (full amount if paid cash, amortized if financed)"""
+    if purchase.financing_years == 0:
+        return purchase.amount
+
+    monthly_rate = purchase.interest_rate / 12
+    num_payments = purchase.financing_years * 12
+
+    if monthly_rate > 0:
+        monthly_payment = purchase.amount * (
+                monthly_rate * (1 + monthly_rate) ** num_payments
+        ) / ((1 + monthly_rate) ** num_payments - 1)
+    else:
+        monthly_payment = purchase.amount / num_payments
+
+    return monthly_payment * 12
+
+
 def house_tab():
     """Enhanced House and Real Estate tab with ownership tracking"""
     st.header("🏠 House Portfolio & Real Estate Planning")
@@ -3105,7 +3113,63 @@ def retirement_tab():
     st.info(strategy_tips)
 
 
-def run_comprehensive_simulation():
+def get_income_for_years(base_income, raise_rate, job_changes_df, base_year, target_years):
+    """Income for each of target_years: base_income raised from base_year, restarted by job changes.
+
+    raise_rate is a percentage. When several job changes have started by a year, the one
+    furthest down the table wins, as when the table was walked row by row. The changes are
+    held as year-sorted arrays with, for each prefix, the latest table row among them, so
+    every year's change is found with one searchsorted.
+    """
+    target_years = np.asarray(target_years, dtype=float)
+    growth = 1 + raise_rate / 100
+    income = base_income * growth ** (target_years - base_year)
+
+    change_years = job_changes_df['Year'].to_numpy(dtype=float)
+    if len(change_years) == 0:
+        return income
+    change_incomes = job_changes_df['New Income'].to_numpy(dtype=float)
+    order = np.argsort(change_years, kind='stable')
+    latest_row = np.maximum.accumulate(order)
+
+    started = np.searchsorted(change_years[order], target_years, side='right')
+    row = latest_row[np.maximum(started - 1, 0)]
+    return np.where(started > 0, change_incomes[row] * growth ** (target_years - change_years[row]), income)
+
+
+def draw_variability_multipliers(rng, size, symmetric, variability, negative_variability, positive_variability):
+    """Random multipliers around 1: normal noise if symmetric, otherwise a coin flip picks a downward or upward half-normal swing (percent inputs)"""
+    if symmetric:
+        return 1 + rng.normal(0, variability / 100, size)
+    magnitude = np.abs(rng.standard_normal(size))
+    return np.where(rng.random(size) < 0.5,
+                    1 - magnitude * (negative_variability / 100),
+                    1 + magnitude * (positive_variability / 100))
+
+
+# Yearly breakdown columns collected per simulation, in storage order: (field, table label)
+BREAKDOWN_COLUMNS = [
+    ('gross_income', 'Gross Income'),
+    ('taxes', 'Taxes'),
+    ('after_tax_income', 'After-Tax Income'),
+    ('rental_income', 'Rental Income'),
+    ('total_income', 'Total Income'),
+    ('family_expenses', 'Family Expenses'),
+    ('children_expenses', 'Children Expenses'),
+    ('house_expenses', 'House Expenses'),
+    ('major_purchases', 'Major Purchases'),
+    ('recurring_expenses', 'Recurring Expenses'),
+    ('total_expenses', 'Total Expenses'),
+    ('net_income', 'Net Income'),
+    ('investment_return', 'Investment Return'),
+    ('net_worth', 'Net Worth'),
+    ('parent1_net_worth', 'Parent1 Net Worth'),
+    ('parent2_net_worth', 'Parent2 Net Worth'),
+    ('family_net_worth', 'Family Net Worth'),
+]
+
+
+def run_comprehensive_simulation(seed=None):
     """Enhanced Monte Carlo simulation with historical returns option, taxes, house ownership tracking, and detailed breakdown by parent"""
     try:
         # Get parameters
@@ -3152,33 +3216,93 @@ def run_comprehensive_simulation():
         parent2_results[:, 0] = initial_parent2_net_worth
         family_results[:, 0] = initial_family_net_worth
 
-        # Store detailed data for all simulations to calculate medians
-        all_simulation_data = []
-        for year_idx in range(years):
-            all_simulation_data.append({
-                'gross_income': [],
-                'taxes': [],
-                'after_tax_income': [],
-                'rental_income': [],
-                'total_income': [],
-                'family_expenses': [],
-                'children_expenses': [],
-                'house_expenses': [],
-                'major_purchases': [],
-                'recurring_expenses': [],
-                'total_expenses': [],
-                'net_income': [],
-                'investment_return': [],
-                'net_worth': [],
-                'parent1_net_worth': [],
-                'parent2_net_worth': [],
-                'family_net_worth': []
-            })
+        # Store detailed data for all simulations to calculate medians:
+        # one row of BREAKDOWN_COLUMNS values per simulation and year
+        all_simulation_data = np.empty((simulations, years, len(BREAKDOWN_COLUMNS)))
 
         # Prepare historical returns if using historical mode
         if use_historical:
             historical_returns = np.array(HISTORICAL_STOCK_RETURNS)
 
+        # Purchase payments don't vary between simulations: amortize each purchase once
+        purchase_payments = {id(purchase): calculate_major_purchase_annual_payment(purchase)
+                             for purchase in st.session_state.major_purchases}
+
+        # Draw every simulation's random variability up front (one RNG call per series)
+        rng = np.random.default_rng(seed)
+        income_multipliers = draw_variability_multipliers(
+            rng, (simulations, years), use_historical, st.session_state.mc_income_variability,
+            st.session_state.mc_income_variability_negative, st.session_state.mc_income_variability_positive)
+        expense_multipliers = draw_variability_multipliers(
+            rng, (simulations, years), use_historical, st.session_state.mc_expense_variability,
+            st.session_state.mc_expense_variability_negative, st.session_state.mc_expense_variability_positive)
+        if use_historical:
+            sampled_returns = rng.choice(historical_returns, (simulations, years))
+        else:
+            return_multipliers = draw_variability_multipliers(
+                rng, (simulations, years), False, 0,
+                st.session_state.mc_return_variability_negative, st.session_state.mc_return_variability_positive)
+
+        # Plan inputs are constant across simulations and years: read them once here
+        # instead of going through session state / scenario attributes in the loop
+        parentX_age = st.session_state.parentX_age
+        parentY_age = st.session_state.parentY_age
+        parentX_retirement_age = st.session_state.parentX_retirement_age
+        parentY_retirement_age = st.session_state.parentY_retirement_age
+        parentX_ss_income = st.session_state.parentX_ss_benefit * 12
+        parentY_ss_income = st.session_state.parentY_ss_benefit * 12
+        if st.session_state.ss_insolvency_enabled:
+            ss_factor = 1 - st.session_state.ss_shortfall_percentage / 100
+            parentX_ss_income = parentX_ss_income * ss_factor
+            parentY_ss_income = parentY_ss_income * ss_factor
+        pretax_401k = st.session_state.pretax_401k
+        state_tax_rate = st.session_state.state_tax_rate
+        children_list = st.session_state.children_list
+        children_expenses = st.session_state.children_expenses
+        houses = st.session_state.houses
+        major_purchases = st.session_state.major_purchases
+        recurring_expenses = st.session_state.recurring_expenses
+        inflation_rate = scenario.inflation_rate
+        expense_growth_rate = scenario.expense_growth_rate
+        healthcare_inflation_rate = scenario.healthcare_inflation_rate
+        investment_return = scenario.investment_return
+
+        # Income with raises and job changes depends only on the year, so project it once
+        # here rather than walking the job change tables in every simulation
+        sim_years = range(start_year, start_year + years)
+        parentX_income_by_year = get_income_for_years(
+            st.session_state.parentX_income, st.session_state.parentX_raise,
+            st.session_state.parentX_job_changes, start_year, sim_years).tolist()
+        parentY_income_by_year = get_income_for_years(
+            st.session_state.parentY_income, st.session_state.parentY_raise,
+            st.session_state.parentY_job_changes, start_year, sim_years).tolist()
+
+        # Compounding factors depend only on the year index, so build them once
+        # rather than recomputing the same powers in every simulation and row
+        inflation_growth = [(1 + inflation_rate) ** i for i in range(years)]
+        expense_growth = [(1 + expense_growth_rate) ** i for i in range(years)]
+        healthcare_growth = [(1 + healthcare_inflation_rate) ** i for i in range(years)]
+
+        # Children expenses don't vary between simulations either: total them per year
+        # here so the expenses table isn't indexed inside every simulation
+        children_expenses_by_year = []
+        for year in range(1, years + 1):
+            current_sim_year = start_year + year - 1
+            annual_children_expenses = 0
+            for child in children_list:
+                child_age_in_year = current_sim_year - child['birth_year']
+                if 0 <= child_age_in_year < len(children_expenses):
+                    child_row = children_expenses.iloc[child_age_in_year]
+                    for col in child_row.index:
+                        if col != 'Age':
+                            # Use healthcare inflation for Healthcare column
+                            if col == 'Healthcare':
+                                inflated_expense = child_row[col] * healthcare_growth[year - 1]
+                            else:
+                                inflated_expense = child_row[col] * inflation_growth[year - 1]
+                            annual_children_expenses += inflated_expense
+            children_expenses_by_year.append(annual_children_expenses)
+
         # Run simulations
         for sim in range(simulations):
             total_net_worth = initial_total_net_worth
@@ -3190,74 +3314,43 @@ def run_comprehensive_simulation():
                 current_sim_year = start_year + year - 1
 
                 # Calculate parent ages for this year
-                parentX_age_in_year = st.session_state.parentX_age + year - 1
-                parentY_age_in_year = st.session_state.parentY_age + year - 1
+                parentX_age_in_year = parentX_age + year - 1
+                parentY_age_in_year = parentY_age + year - 1
+                inflation_factor = inflation_growth[year - 1]
 
                 # === INCOME CALCULATIONS ===
-                # Base income with raises
-                parentX_raise_rate = st.session_state.parentX_raise / 100
-                parentY_raise_rate = st.session_state.parentY_raise / 100
-
-                parentX_income = st.session_state.parentX_income * ((1 + parentX_raise_rate) ** (year - 1))
-                parentY_income = st.session_state.parentY_income * ((1 + parentY_raise_rate) ** (year - 1))
-
-                # Apply job changes
-                for _, job_change in st.session_state.parentX_job_changes.iterrows():
-                    if current_sim_year >= job_change['Year']:
-                        parentX_income = job_change['New Income'] * (
-                                (1 + parentX_raise_rate) ** max(0, current_sim_year - job_change['Year']))
-
-                for _, job_change in st.session_state.parentY_job_changes.iterrows():
-                    if current_sim_year >= job_change['Year']:
-                        parentY_income = job_change['New Income'] * (
-                                (1 + parentY_raise_rate) ** max(0, current_sim_year - job_change['Year']))
+                # Income with raises and job changes
+                parentX_income = parentX_income_by_year[year - 1]
+                parentY_income = parentY_income_by_year[year - 1]
 
                 # Social Security benefits and retirement with insolvency adjustment
                 ss_income = 0
-                if parentX_age_in_year >= st.session_state.parentX_retirement_age:
-                    base_ss_x = st.session_state.parentX_ss_benefit * 12
-                    if st.session_state.ss_insolvency_enabled:
-                        ss_income += base_ss_x * (1 - st.session_state.ss_shortfall_percentage / 100)
-                    else:
-                        ss_income += base_ss_x
+                if parentX_age_in_year >= parentX_retirement_age:
+                    ss_income += parentX_ss_income
                     parentX_income = 0  # Retired
 
-                if parentY_age_in_year >= st.session_state.parentY_retirement_age:
-                    base_ss_y = st.session_state.parentY_ss_benefit * 12
-                    if st.session_state.ss_insolvency_enabled:
-                        ss_income += base_ss_y * (1 - st.session_state.ss_shortfall_percentage / 100)
-                    else:
-                        ss_income += base_ss_y
+                if parentY_age_in_year >= parentY_retirement_age:
+                    ss_income += parentY_ss_income
                     parentY_income = 0  # Retired
 
                 gross_income = parentX_income + parentY_income + ss_income
 
                 # Apply asymmetric income variability to EMPLOYMENT income only (not SS)
+                # (symmetric in historical mode, asymmetric in traditional mode)
                 employment_income = parentX_income + parentY_income
-                if use_historical:
-                    # For historical mode, use symmetric variability for income
-                    income_var = st.session_state.mc_income_variability / 100
-                    income_multiplier = 1 + np.random.normal(0, income_var)
-                else:
-                    # Use asymmetric variability for traditional mode
-                    if np.random.random() < 0.5:  # Negative direction
-                        income_var = st.session_state.mc_income_variability_negative / 100
-                        income_multiplier = 1 - abs(np.random.normal(0, income_var))
-                    else:  # Positive direction
-                        income_var = st.session_state.mc_income_variability_positive / 100
-                        income_multiplier = 1 + abs(np.random.normal(0, income_var))
+                income_multiplier = income_multipliers[sim, year - 1]
 
                 # Variability only affects employment income, SS is fixed
                 gross_income = employment_income * income_multiplier + ss_income
 
                 # === TAX CALCULATIONS ===
                 # Calculate taxes with inflation-adjusted 401k contributions
-                pretax_401k_inflated = st.session_state.pretax_401k * ((1 + scenario.inflation_rate) ** (year - 1))
+                pretax_401k_inflated = pretax_401k * inflation_factor
 
                 tax_info = calculate_annual_taxes(
                     gross_income,
                     pretax_401k_inflated,
-                    st.session_state.state_tax_rate
+                    state_tax_rate
                 )
 
                 after_tax_income = tax_info['after_tax_income']
@@ -3265,43 +3358,19 @@ def run_comprehensive_simulation():
 
                 # === EXPENSE CALCULATIONS ===
                 # Family expenses with growth and asymmetric variability
-                base_family_expenses = initial_family_expenses * (
-                        (1 + scenario.expense_growth_rate) ** (year - 1))
-
-                if use_historical:
-                    expense_var = st.session_state.mc_expense_variability / 100
-                    expense_multiplier = 1 + np.random.normal(0, expense_var)
-                else:
-                    # Use asymmetric variability for traditional mode
-                    if np.random.random() < 0.5:  # Negative direction (lower expenses)
-                        expense_var = st.session_state.mc_expense_variability_negative / 100
-                        expense_multiplier = 1 - abs(np.random.normal(0, expense_var))
-                    else:  # Positive direction (higher expenses)
-                        expense_var = st.session_state.mc_expense_variability_positive / 100
-                        expense_multiplier = 1 + abs(np.random.normal(0, expense_var))
+                base_family_expenses = initial_family_expenses * expense_growth[year - 1]
 
+                expense_multiplier = expense_multipliers[sim, year - 1]
                 annual_family_expenses = base_family_expenses * expense_multiplier
 
                 # Children expenses
-                annual_children_expenses = 0
-                for child in st.session_state.children_list:
-                    child_age_in_year = current_sim_year - child['birth_year']
-                    if 0 <= child_age_in_year < len(st.session_state.children_expenses):
-                        child_row = st.session_state.children_expenses.iloc[child_age_in_year]
-                        for col in child_row.index:
-                            if col != 'Age':
-                                # Use healthcare inflation for Healthcare column
-                                if col == 'Healthcare':
-                                    inflated_expense = child_row[col] * ((1 + scenario.healthcare_inflation_rate) ** (year - 1))
-                                else:
-                                    inflated_expense = child_row[col] * ((1 + scenario.inflation_rate) ** (year - 1))
-                                annual_children_expenses += inflated_expense
+                annual_children_expenses = children_expenses_by_year[year - 1]
 
                 # House-related expenses and rental income
                 annual_house_expenses = 0
                 annual_rental_income = 0
 
-                for house in st.session_state.houses:
+                for house in houses:
                     status, rental_income = house.get_status_for_year(current_sim_year)
 
                     if status in ["Own_Live", "Own_Rent"]:
@@ -3323,17 +3392,17 @@ def run_comprehensive_simulation():
                                 annual_house_expenses += house.mortgage_balance / remaining_mortgage_years
 
                         # Property tax, insurance, maintenance, and upkeep (with inflation)
-                        current_home_value = house.current_value * ((1 + scenario.inflation_rate) ** (year - 1))
+                        current_home_value = house.current_value * inflation_factor
                         annual_property_tax = current_home_value * house.property_tax_rate
-                        annual_insurance = house.home_insurance * ((1 + scenario.inflation_rate) ** (year - 1))
+                        annual_insurance = house.home_insurance * inflation_factor
                         annual_maintenance = current_home_value * house.maintenance_rate  # Percentage-based maintenance
-                        annual_upkeep = house.upkeep_costs * ((1 + scenario.inflation_rate) ** (year - 1))  # Flat upkeep
+                        annual_upkeep = house.upkeep_costs * inflation_factor  # Flat upkeep
 
                         annual_house_expenses += annual_property_tax + annual_insurance + annual_maintenance + annual_upkeep
 
                     if status == "Own_Rent":
                         # Rental income (with inflation)
-                        monthly_rent = rental_income * ((1 + scenario.inflation_rate) ** (year - 1))
+                        monthly_rent = rental_income * inflation_factor
                         annual_rental_income += monthly_rent * 12
 
                     elif status == "Sell":
@@ -3343,7 +3412,7 @@ def run_comprehensive_simulation():
                             current_sim_year - 1) if current_sim_year > start_year else ("Own_Live", 0)
 
                         if prev_year_status != "Sell":  # First year of sale
-                            sale_value = house.current_value * ((1 + scenario.inflation_rate) ** (year - 1))
+                            sale_value = house.current_value * inflation_factor
                             # Simplified: assume mortgage is paid off at sale
                             remaining_mortgage = house.mortgage_balance * max(0, (
                                     1 - (current_sim_year - house.purchase_year) / house.mortgage_years_left))
@@ -3357,53 +3426,26 @@ def run_comprehensive_simulation():
                             else:  # Shared
                                 family_net_worth += sale_proceeds
 
-                # Major one-time purchases
+                # Major one-time purchases (financed ones are paid from the purchase year
+                # through the end of the financing term)
                 annual_major_purchases = 0
-                for purchase in st.session_state.major_purchases:
-                    if purchase.year == current_sim_year:
-                        if purchase.financing_years == 0:
+                for purchase in major_purchases:
+                    if purchase.financing_years == 0:
+                        if purchase.year == current_sim_year:
                             annual_major_purchases += purchase.amount
-                        else:
-                            # Calculate annual payment for financed purchases
-                            monthly_rate = purchase.interest_rate / 12
-                            num_payments = purchase.financing_years * 12
-
-                            if monthly_rate > 0:
-                                monthly_payment = purchase.amount * (
-                                        monthly_rate * (1 + monthly_rate) ** num_payments
-                                ) / ((1 + monthly_rate) ** num_payments - 1)
-                            else:
-                                monthly_payment = purchase.amount / num_payments
-
-                            annual_major_purchases += monthly_payment * 12
-
-                    # Ongoing financing payments
-                    elif (purchase.financing_years > 0 and
-                          current_sim_year > purchase.year and
-                          current_sim_year <= purchase.year + purchase.financing_years):
-
-                        monthly_rate = purchase.interest_rate / 12
-                        num_payments = purchase.financing_years * 12
-
-                        if monthly_rate > 0:
-                            monthly_payment = purchase.amount * (
-                                    monthly_rate * (1 + monthly_rate) ** num_payments
-                            ) / ((1 + monthly_rate) ** num_payments - 1)
-                        else:
-                            monthly_payment = purchase.amount / num_payments
-
-                        annual_major_purchases += monthly_payment * 12
+                    elif purchase.year <= current_sim_year <= purchase.year + purchase.financing_years:
+                        annual_major_purchases += purchase_payments[id(purchase)]
 
                 # Recurring expenses
                 annual_recurring_expenses = 0
-                for expense in st.session_state.recurring_expenses:
+                for expense in recurring_expenses:
                     if (current_sim_year >= expense.start_year and
                             (expense.end_year is None or current_sim_year <= expense.end_year) and
                             (current_sim_year - expense.start_year) % expense.frequency_years == 0):
 
                         if expense.inflation_adjust:
                             inflation_years = current_sim_year - expense.start_year
-                            cost = expense.amount * ((1 + scenario.inflation_rate) ** inflation_years)
+                            cost = expense.amount * ((1 + inflation_rate) ** inflation_years)
                         else:
                             cost = expense.amount
 
@@ -3421,7 +3463,7 @@ def run_comprehensive_simulation():
                 # === INVESTMENT RETURN CALCULATION ===
                 if use_historical:
                     # Use historical returns - randomly sample from historical data
-                    historical_return = np.random.choice(historical_returns)
+                    historical_return = sampled_returns[sim, year - 1]
 
                     # Apply returns proportionally to each owner's net worth
                     parent1_investment_return = parent1_net_worth * historical_return
@@ -3430,17 +3472,12 @@ def run_comprehensive_simulation():
                     total_investment_return = parent1_investment_return + parent2_investment_return + family_investment_return
                 else:
                     # Use traditional method with asymmetric variability
-                    if np.random.random() < 0.5:  # Negative direction
-                        return_var = st.session_state.mc_return_variability_negative / 100
-                        return_multiplier = 1 - abs(np.random.normal(0, return_var))
-                    else:  # Positive direction
-                        return_var = st.session_state.mc_return_variability_positive / 100
-                        return_multiplier = 1 + abs(np.random.normal(0, return_var))
+                    return_multiplier = return_multipliers[sim, year - 1]
 
                     # Apply returns proportionally to each owner's net worth
-                    parent1_investment_return = parent1_net_worth * scenario.investment_return * return_multiplier
-                    parent2_investment_return = parent2_net_worth * scenario.investment_return * return_multiplier
-                    family_investment_return = family_net_worth * scenario.investment_return * return_multiplier
+                    parent1_investment_return = parent1_net_worth * investment_return * return_multiplier
+                    parent2_investment_return = parent2_net_worth * investment_return * return_multiplier
+                    family_investment_return = family_net_worth * investment_return * return_multiplier
                     total_investment_return = parent1_investment_return + parent2_investment_return + family_investment_return
 
                 # Update net worth by owner (simplified allocation of net income to family)
@@ -3456,71 +3493,33 @@ def run_comprehensive_simulation():
                 parent2_net_worth = max(parent2_net_worth, -500000)
                 family_net_worth = max(family_net_worth, -1000000)
 
-                # Store results (normalize to today's dollars if requested)
-                if normalize_to_today:
-                    inflation_factor = (1 + scenario.inflation_rate) ** (year - 1)
-                    total_results[sim, year] = total_net_worth / inflation_factor
-                    parent1_results[sim, year] = parent1_net_worth / inflation_factor
-                    parent2_results[sim, year] = parent2_net_worth / inflation_factor
-                    family_results[sim, year] = family_net_worth / inflation_factor
-                else:
-                    total_results[sim, year] = total_net_worth
-                    parent1_results[sim, year] = parent1_net_worth
-                    parent2_results[sim, year] = parent2_net_worth
-                    family_results[sim, year] = family_net_worth
-
-                # Store data for all simulations to calculate medians later
-                year_idx = year - 1  # Convert to 0-based index
-                all_simulation_data[year_idx]['gross_income'].append(gross_income)
-                all_simulation_data[year_idx]['taxes'].append(annual_taxes)
-                all_simulation_data[year_idx]['after_tax_income'].append(after_tax_income)
-                all_simulation_data[year_idx]['rental_income'].append(annual_rental_income)
-                all_simulation_data[year_idx]['total_income'].append(total_annual_income)
-                all_simulation_data[year_idx]['family_expenses'].append(annual_family_expenses)
-                all_simulation_data[year_idx]['children_expenses'].append(annual_children_expenses)
-                all_simulation_data[year_idx]['house_expenses'].append(annual_house_expenses)
-                all_simulation_data[year_idx]['major_purchases'].append(annual_major_purchases)
-                all_simulation_data[year_idx]['recurring_expenses'].append(annual_recurring_expenses)
-                all_simulation_data[year_idx]['total_expenses'].append(total_annual_expenses)
-                all_simulation_data[year_idx]['net_income'].append(net_annual_income)
-                all_simulation_data[year_idx]['investment_return'].append(total_investment_return)
-                all_simulation_data[year_idx]['net_worth'].append(total_net_worth)
-                all_simulation_data[year_idx]['parent1_net_worth'].append(parent1_net_worth)
-                all_simulation_data[year_idx]['parent2_net_worth'].append(parent2_net_worth)
-                all_simulation_data[year_idx]['family_net_worth'].append(family_net_worth)
-
-        # Calculate median values for yearly breakdown
-        yearly_breakdown = []
-        for year_idx in range(years):
-            current_sim_year = start_year + year_idx
-            year_data = all_simulation_data[year_idx]
-
-            # Apply inflation normalization to breakdown if requested
-            if normalize_to_today:
-                inflation_factor = (1 + scenario.inflation_rate) ** year_idx
-            else:
-                inflation_factor = 1.0
-
-            yearly_breakdown.append({
-                'Year': current_sim_year,
-                'Gross Income': np.median(year_data['gross_income']) / inflation_factor,
-                'Taxes': np.median(year_data['taxes']) / inflation_factor,
-                'After-Tax Income': np.median(year_data['after_tax_income']) / inflation_factor,
-                'Rental Income': np.median(year_data['rental_income']) / inflation_factor,
-                'Total Income': np.median(year_data['total_income']) / inflation_factor,
-                'Family Expenses': np.median(year_data['family_expenses']) / inflation_factor,
-                'Children Expenses': np.median(year_data['children_expenses']) / inflation_factor,
-                'House Expenses': np.median(year_data['house_expenses']) / inflation_factor,
-                'Major Purchases': np.median(year_data['major_purchases']) / inflation_factor,
-                'Recurring Expenses': np.median(year_data['recurring_expenses']) / inflation_factor,
-                'Total Expenses': np.median(year_data['total_expenses']) / inflation_factor,
-                'Net Income': np.median(year_data['net_income']) / inflation_factor,
-                'Investment Return': np.median(year_data['investment_return']) / inflation_factor,
-                'Net Worth': np.median(year_data['net_worth']) / inflation_factor,
-                'Parent1 Net Worth': np.median(year_data['parent1_net_worth']) / inflation_factor,
-                'Parent2 Net Worth': np.median(year_data['parent2_net_worth']) / inflation_factor,
-                'Family Net Worth': np.median(year_data['family_net_worth']) / inflation_factor
-            })
+                # Store results (normalized to today's dollars after the loop if requested)
+                total_results[sim, year] = total_net_worth
+                parent1_results[sim, year] = parent1_net_worth
+                parent2_results[sim, year] = parent2_net_worth
+                family_results[sim, year] = family_net_worth
+
+                # Store data for all simulations to calculate medians later (BREAKDOWN_COLUMNS order)
+                all_simulation_data[sim, year - 1] = (
+                    gross_income, annual_taxes, after_tax_income, annual_rental_income, total_annual_income,
+                    annual_family_expenses, annual_children_expenses, annual_house_expenses,
+                    annual_major_purchases, annual_recurring_expenses, total_annual_expenses,
+                    net_annual_income, total_investment_return,
+                    total_net_worth, parent1_net_worth, parent2_net_worth, family_net_worth)
+
+        # Inflation normalization: one deflator per simulated year, applied to whole arrays
+        if normalize_to_today:
+            deflator = (1 + inflation_rate) ** np.arange(years)
+            for results in (total_results, parent1_results, parent2_results, family_results):
+                results[:, 1:] /= deflator
+        else:
+            deflator = np.ones(years)
+
+        # Calculate median values for yearly breakdown: (years, columns) in one call
+        medians = np.median(all_simulation_data, axis=0)
+        medians /= deflator[:, np.newaxis]
+        yearly_breakdown = pd.DataFrame(medians, columns=[label for _, label in BREAKDOWN_COLUMNS])
+        yearly_breakdown.insert(0, 'Year', np.arange(start_year, start_year + years))
 
         return (total_results, parent1_results, parent2_results, family_results,
                 list(range(start_year, start_year + years + 1)), yearly_breakdown)
@@ -3726,14 +3725,9 @@ def combined_simulation_tab():
             total_results = st.session_state.mc_total_results
             years = st.session_state.mc_years_list
 
-            # Calculate percentiles
-            percentiles = {
-                '95th': np.percentile(total_results, 95, axis=0),
-                '75th': np.percentile(total_results, 75, axis=0),
-                'Median': np.percentile(total_results, 50, axis=0),
-                '25th': np.percentile(total_results, 25, axis=0),
-                '5th': np.percentile(total_results, 5, axis=0)
-            }
+            # Calculate percentiles (one pass over the simulations for all five bands)
+            percentiles = dict(zip(['95th', '75th', 'Median', '25th', '5th'],
+                                   np.percentile(total_results, [95, 75, 50, 25, 5], axis=0)))
 
             # Create plot
             fig = go.Figure()
@@ -3785,13 +3779,13 @@ def combined_simulation_tab():
             col1, col2, col3, col4 = st.columns(4)
 
             with col1:
-                st.metric("Median Final Net Worth", format_currency(np.median(final_year_results), show_thousands=True))
+                st.metric("Median Final Net Worth", format_currency(percentiles['Median'][-1], show_thousands=True))
             with col2:
                 st.metric("25th Percentile",
-                          format_currency(np.percentile(final_year_results, 25), show_thousands=True))
+                          format_currency(percentiles['25th'][-1], show_thousands=True))
             with col3:
                 st.metric("75th Percentile",
-                          format_currency(np.percentile(final_year_results, 75), show_thousands=True))
+                          format_currency(percentiles['75th'][-1], show_thousands=True))
             with col4:
                 probability_positive = np.mean(final_year_results > 0) * 100
                 st.metric("Probability of Positive Net Worth", f"{probability_positive:.1f}%")
@@ -3845,9 +3839,7 @@ def combined_simulation_tab():
             )
 
             # Parent 1 Net Worth
-            parent1_median = np.percentile(parent1_results, 50, axis=0)
-            parent1_75th = np.percentile(parent1_results, 75, axis=0)
-            parent1_25th = np.percentile(parent1_results, 25, axis=0)
+            parent1_median, parent1_75th, parent1_25th = np.percentile(parent1_results, [50, 75, 25], axis=0)
 
             fig.add_trace(
                 go.Scatter(x=years, y=parent1_median, mode='lines', name=f'{st.session_state.parent1_name} Median',
@@ -3860,9 +3852,7 @@ def combined_simulation_tab():
                            line=dict(color='lightblue', width=1)), row=1, col=1)
 
             # Parent 2 Net Worth
-            parent2_median = np.percentile(parent2_results, 50, axis=0)
-            parent2_75th = np.percentile(parent2_results, 75, axis=0)
-            parent2_25th = np.percentile(parent2_results, 25, axis=0)
+            parent2_median, parent2_75th, parent2_25th = np.percentile(parent2_results, [50, 75, 25], axis=0)
 
             fig.add_trace(
                 go.Scatter(x=years, y=parent2_median, mode='lines', name=f'{st.session_state.parent2_name} Median',
@@ -3875,9 +3865,7 @@ def combined_simulation_tab():
                            line=dict(color='lightgreen', width=1)), row=1, col=2)
 
             # Family Net Worth
-            family_median = np.percentile(family_results, 50, axis=0)
-            family_75th = np.percentile(family_results, 75, axis=0)
-            family_25th = np.percentile(family_results, 25, axis=0)
+            family_median, family_75th, family_25th = np.percentile(family_results, [50, 75, 25], axis=0)
 
             fig.add_trace(go.Scatter(x=years, y=family_median, mode='lines', name='Family Median',
                                      line=dict(color='purple', width=3)), row=2, col=1)
@@ -3886,10 +3874,8 @@ def combined_simulation_tab():
             fig.add_trace(go.Scatter(x=years, y=family_25th, mode='lines', name='Family 25th',
                                      line=dict(color='plum', width=1)), row=2, col=1)
 
-            # Total Net Worth
-            total_median = np.percentile(total_results, 50, axis=0)
-            total_75th = np.percentile(total_results, 75, axis=0)
-            total_25th = np.percentile(total_results, 25, axis=0)
+            # Total Net Worth (already computed for the Monte Carlo Results tab)
+            total_median, total_75th, total_25th = percentiles['Median'], percentiles['75th'], percentiles['25th']
 
             fig.add_trace(go.Scatter(x=years, y=total_median, mode='lines', name='Total Median',
                                      line=dict(color='red', width=3)), row=2, col=2)
@@ -3914,29 +3900,26 @@ def combined_simulation_tab():
             # Summary table for final year by owner
             st.subheader("📊 Final Year Net Worth Summary by Owner")
 
-            final_parent1 = parent1_results[:, -1]
-            final_parent2 = parent2_results[:, -1]
-            final_family = family_results[:, -1]
-
+            # The final year's percentiles are the last column of the curves above
             summary_data = {
                 "Owner": [st.session_state.parent1_name, st.session_state.parent2_name, "Family/Shared", "Total"],
                 "Median": [
-                    format_currency(np.median(final_parent1), show_thousands=True),
-                    format_currency(np.median(final_parent2), show_thousands=True),
-                    format_currency(np.median(final_family), show_thousands=True),
-                    format_currency(np.median(final_year_results), show_thousands=True)
+                    format_currency(parent1_median[-1], show_thousands=True),
+                    format_currency(parent2_median[-1], show_thousands=True),
+                    format_currency(family_median[-1], show_thousands=True),
+                    format_currency(total_median[-1], show_thousands=True)
                 ],
                 "25th Percentile": [
-                    format_currency(np.percentile(final_parent1, 25), show_thousands=True),
-                    format_currency(np.percentile(final_parent2, 25), show_thousands=True),
-                    format_currency(np.percentile(final_family, 25), show_thousands=True),
-                    format_currency(np.percentile(final_year_results, 25), show_thousands=True)
+                    format_currency(parent1_25th[-1], show_thousands=True),
+                    format_currency(parent2_25th[-1], show_thousands=True),
+                    format_currency(family_25th[-1], show_thousands=True),
+                    format_currency(total_25th[-1], show_thousands=True)
                 ],
                 "75th Percentile": [
-                    format_currency(np.percentile(final_parent1, 75), show_thousands=True),
-                    format_currency(np.percentile(final_parent2, 75), show_thousands=True),
-                    format_currency(np.percentile(final_family, 75), show_thousands=True),
-                    format_currency(np.percentile(final_year_results, 75), show_thousands=True)
+                    format_currency(parent1_75th[-1], show_thousands=True),
+                    format_currency(parent2_75th[-1], show_thousands=True),
+                    format_currency(family_75th[-1], show_thousands=True),
+                    format_currency(total_75th[-1], show_thousands=True)
                 ]
             }
 
@@ -3945,8 +3928,7 @@ def combined_simulation_tab():
         with yearly_tab:
             st.subheader("📅 Annual Expense Breakdown (Median Values)")
 
-            yearly_data = st.session_state.yearly_breakdown
-            df = pd.DataFrame(yearly_data)
+            df = st.session_state.yearly_breakdown
 
             value_description = "today's purchasing power" if last_normalization else "nominal future values"
             st.info(
@@ -4028,7 +4010,7 @@ def combined_simulation_tab():
                 f"💡 **These values represent the 50th percentile (median) across all simulation runs in {value_description}.**")
 
             # Format the detailed breakdown for display
-            display_df = pd.DataFrame(st.session_state.yearly_breakdown)
+            display_df = st.session_state.yearly_breakdown.copy()
 
             # Format currency columns
             currency_columns = ['Gross Income', 'Taxes', 'After-Tax Income', 'Rental Income', 'Total Income',
@@ -5,7 +5,10 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import json
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 import io
 from dataclasses import dataclass, asdict
 from typing import List, Dict, Optional, Any
@@ -13,10 +16,12 @@ import hashlib
 import hmac
 import secrets
 import os
+import logging
 import shutil
 import base64
 from pathlib import Path
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 # PDF generation imports
 try:
@@ -37,6 +42,20 @@ try:
 except ImportError:
     TKINTER_AVAILABLE = False
 
+# JIT-compiled Monte Carlo kernels (numba; the NumPy versions below are used without it)
+try:
+    import mc_kernels
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Faster JSON parsing/encoding for household files and plan fingerprints (orjson; json is used without it)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Set page configuration
 st.set_page_config(
     page_title="Financial Planning Suite",
@@ -46,7 +65,7 @@ st.set_page_config(
 )
 
 # Professional minimalist styling
-st.markdown("""
+APP_CSS = """
 <style>
     /* Clean typography */
     .stApp { font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; }
@@ -324,7 +343,9 @@ st.markdown("""
         50% { opacity: 1; transform: scale(1.2); }
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+# Style-only HTML is injected directly instead of going through the markdown renderer
+st.html(APP_CSS)
 
 # ══════════════════════════════════════════════════════════════════════════════
 # CHART THEME — single source of truth for all Plotly charts
@@ -347,12 +368,15 @@ COLOR_SEQUENCE = [
     '#3498db', '#9b59b6', '#f5576c', '#95a5a6', '#27ae60',
 ]
 
+# Whole-dollar axis ticks, formatted by Plotly in the browser; shared by every dollar chart
+CURRENCY_AXIS = dict(tickformat="$,.0f")
+
 CHART_LAYOUT = dict(
     height=380,
     margin=dict(l=40, r=20, t=50, b=40),
     hovermode='x unified',
     legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-    yaxis=dict(tickformat="$,.0f"),
+    yaxis=CURRENCY_AXIS,
     font=dict(family="Inter, -apple-system, sans-serif"),
 )
 
@@ -403,6 +427,17 @@ DATA_DIR = Path(os.environ.get('DATA_DIR', './data'))
 HOUSEHOLDS_DIR = DATA_DIR / 'households'
 HOUSEHOLDS_INDEX = DATA_DIR / 'households_index.json'
 
+# Diagnostics use lazy %-style logging so messages are only formatted when the
+# level is enabled. Set LOG_LEVEL=DEBUG to see auto-save and export details on
+# stderr; an unrecognised LOG_LEVEL falls back to INFO.
+logger = logging.getLogger("financial_planner")
+_log_level = os.environ.get('LOG_LEVEL', 'INFO').upper()
+logger.setLevel(_log_level if _log_level in logging.getLevelNamesMapping() else logging.INFO)
+if not logger.handlers:  # Streamlit re-runs this module on every rerun; attach the handler once
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    logger.addHandler(_log_handler)
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # ENCRYPTION: AES-256-CBC with PBKDF2-derived key from passphrase
@@ -473,12 +508,46 @@ def ensure_data_dirs():
             json.dump({}, f)
 
 
+def _parse_json(raw):
+    """Parse a JSON str/bytes, with orjson when it's installed.
+
+    Text written by the stdlib encoder can contain NaN/Infinity, which orjson
+    rejects, so that falls back to json. Raises json.JSONDecodeError like json.loads.
+    Writing stays on json: orjson would silently turn NaN into null.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _read_json_file(path):
+    """Parse a JSON file with _parse_json. Raises json.JSONDecodeError /
+    FileNotFoundError like json.load.
+    """
+    with open(path, 'rb') as f:
+        return _parse_json(f.read())
+
+
+def _json_fingerprint(data) -> str:
+    """SHA-256 of data serialized with sorted keys, for in-session change detection only."""
+    if ORJSON_AVAILABLE:
+        try:
+            encoded = orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                                   | orjson.OPT_SERIALIZE_NUMPY)
+            return hashlib.sha256(encoded).hexdigest()
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
 def load_households_index() -> dict:
     """Load the households index {household_id: {name, members: [emails], created_at}}"""
     ensure_data_dirs()
     try:
-        with open(HOUSEHOLDS_INDEX, 'r') as f:
-            return json.load(f)
+        return _read_json_file(HOUSEHOLDS_INDEX)
     except (json.JSONDecodeError, FileNotFoundError):
         return {}
 
@@ -605,7 +674,7 @@ def get_household_members(household_id: str) -> list:
     return []
 
 
-def save_household_plan(household_id: str, plan_data: str):
+def save_household_plan(household_id: str, plan_data):
     """Save financial plan data to household file.
 
     ╔══════════════════════════════════════════════════════════════════════╗
@@ -621,8 +690,7 @@ def save_household_plan(household_id: str, plan_data: str):
 
     # Load existing household metadata — NEVER discard existing fields
     try:
-        with open(household_file, 'r') as f:
-            household = json.load(f)
+        household = _read_json_file(household_file)
     except (json.JSONDecodeError, FileNotFoundError):
         household = {}
 
@@ -649,18 +717,36 @@ def save_household_plan(household_id: str, plan_data: str):
 
     if is_encrypted and passphrase:
         # Encrypt plan data before storing
-        plan_json = json.dumps(json.loads(plan_data) if isinstance(plan_data, str) else plan_data)
+        plan_json = json.dumps(_parse_json(plan_data) if isinstance(plan_data, str) else plan_data)
         household['plan_data_encrypted'] = _encrypt_data(plan_json, passphrase)
         household.pop('plan_data', None)  # Remove plaintext
     else:
-        household['plan_data'] = json.loads(plan_data) if isinstance(plan_data, str) else plan_data
+        household['plan_data'] = _parse_json(plan_data) if isinstance(plan_data, str) else plan_data
         household.pop('plan_data_encrypted', None)
 
     household['last_saved'] = datetime.now().isoformat()
     household['saved_by'] = st.session_state.get('current_user', 'unknown')
 
+    # Serialize before opening the file so a bad value can't leave it half-written
+    household_json = json.dumps(household, indent=2)
     with open(household_file, 'w') as f:
-        json.dump(household, f, indent=2)
+        f.write(household_json)
+
+
+def autosave_household_plan(household_id: str) -> bool:
+    """Auto-save the current plan, skipping the write if nothing changed since the last auto-save.
+
+    Most reruns don't touch the plan, and a section switch saves and then reruns,
+    so without the check every interaction rewrote the household file and rotated
+    a backup. Returns True if the household file was written.
+    """
+    plan_data = get_plan_data()
+    fingerprint = _json_fingerprint(plan_data)
+    if st.session_state.get('_autosaved_plan') == (household_id, fingerprint):
+        return False
+    save_household_plan(household_id, plan_data)
+    st.session_state._autosaved_plan = (household_id, fingerprint)
+    return True
 
 
 def load_household_plan(household_id: str) -> Optional[str]:
@@ -671,8 +757,7 @@ def load_household_plan(household_id: str) -> Optional[str]:
         return None
 
     try:
-        with open(household_file, 'r') as f:
-            household = json.load(f)
+        household = _read_json_file(household_file)
 
         # Encrypted household
         if 'plan_data_encrypted' in household:
@@ -697,8 +782,7 @@ def get_household_info(household_id: str) -> dict:
     """Get household metadata"""
     household_file = HOUSEHOLDS_DIR / f"{household_id}.json"
     try:
-        with open(household_file, 'r') as f:
-            return json.load(f)
+        return _read_json_file(household_file)
     except (json.JSONDecodeError, FileNotFoundError):
         return {}
 
@@ -711,8 +795,7 @@ def save_household_scenarios(household_id: str, scenarios: dict):
     ensure_data_dirs()
     household_file = HOUSEHOLDS_DIR / f"{household_id}.json"
     try:
-        with open(household_file, 'r') as f:
-            household = json.load(f)
+        household = _read_json_file(household_file)
     except (json.JSONDecodeError, FileNotFoundError):
         household = {}
     household['scenarios'] = scenarios
@@ -724,8 +807,7 @@ def load_household_scenarios(household_id: str) -> dict:
     """Load named scenarios from household file"""
     household_file = HOUSEHOLDS_DIR / f"{household_id}.json"
     try:
-        with open(household_file, 'r') as f:
-            household = json.load(f)
+        household = _read_json_file(household_file)
         return household.get('scenarios', {})
     except (json.JSONDecodeError, FileNotFoundError):
         return {}
@@ -739,8 +821,7 @@ def save_household_actuals(household_id: str, actuals: dict):
     ensure_data_dirs()
     household_file = HOUSEHOLDS_DIR / f"{household_id}.json"
     try:
-        with open(household_file, 'r') as f:
-            household = json.load(f)
+        household = _read_json_file(household_file)
     except (json.JSONDecodeError, FileNotFoundError):
         household = {}
 
@@ -763,15 +844,14 @@ def load_household_actuals(household_id: str) -> dict:
     """Load actuals tracking data from household file. Decrypts if needed."""
     household_file = HOUSEHOLDS_DIR / f"{household_id}.json"
     try:
-        with open(household_file, 'r') as f:
-            household = json.load(f)
+        household = _read_json_file(household_file)
 
         if 'actuals_encrypted' in household:
             passphrase = st.session_state.get('_household_passphrase')
             if passphrase:
                 plaintext = _decrypt_data(household['actuals_encrypted'], passphrase)
                 if plaintext:
-                    return json.loads(plaintext)
+                    return _parse_json(plaintext)
             return {}
 
         return household.get('actuals', {})
@@ -1008,12 +1088,9 @@ def household_picker_page(email: str):
                 initialize_session_state()
                 demo_data = st.session_state.saved_scenarios.get(demo_key)
                 if demo_data:
-                    data_str = json.dumps(demo_data) if isinstance(demo_data, dict) else demo_data
-                    load_data(data_str)
+                    load_data(demo_data)
                 try:
-                    json_data = save_data()
-                    if json_data:
-                        save_household_plan(test_hid, json_data)
+                    save_household_plan(test_hid, get_plan_data())
                 except Exception:
                     pass
 
@@ -4521,8 +4598,20 @@ def get_children_expense_template(location, strategy_name):
     else:
         strategy_level = 'Average'
 
-    # Generate children template from adult
-    return generate_children_template_from_adult(adult_template, strategy_level)
+    # Generate children template from adult (once per distinct adult template and level)
+    return _generated_children_template(tuple(adult_template.items()), strategy_level).copy()
+
+
+@lru_cache(maxsize=64)
+def _generated_children_template(adult_items: tuple, strategy_level: str) -> dict:
+    """
+    Memoized generate_children_template_from_adult, keyed by the adult template's items.
+
+    Projections look a child's template up for every (child, year), and
+    generating it builds all 31 ages of every category. Callers get a shallow
+    copy, the same contract as the built-in templates.
+    """
+    return generate_children_template_from_adult(dict(adult_items), strategy_level)
 
 def migrate_legacy_children_expenses_to_new_structure(legacy_data, child_age):
     """
@@ -6377,22 +6466,21 @@ class House:
 
     def get_status_for_year(self, year: int) -> tuple:
         """Get status and rental income for a specific year"""
-        if not self.timeline:
-            return "Own_Live", 0.0
-
-        sorted_timeline = sorted(self.timeline, key=lambda x: x.year)
-
-        current_status = "Own_Live"
-        current_rental = 0.0
-
-        for entry in sorted_timeline:
-            if entry.year <= year:
-                current_status = entry.status
-                current_rental = entry.rental_income
+        return self.get_statuses_for_years([year])[0]
+
+    def get_statuses_for_years(self, years) -> list:
+        """Status and rental income for each of years (timeline sorted once, then bisected per year)"""
+        sorted_timeline = sorted(self.timeline or [], key=lambda x: x.year)
+        entry_years = [entry.year for entry in sorted_timeline]
+
+        statuses = []
+        for year in years:
+            i = bisect_right(entry_years, year)
+            if i:
+                statuses.append((sorted_timeline[i - 1].status, sorted_timeline[i - 1].rental_income))
             else:
-                break
-
-        return current_status, current_rental
+                statuses.append(("Own_Live", 0.0))
+        return statuses
 
 
 @dataclass
@@ -6437,7 +6525,18 @@ class HealthExpense:
     affected_person: str  # "Parent 1", "Parent 2", "Both"
 
 
-# Currency formatting function with automatic scaling
+# Scale table for format_currency: (lower bound, divisor, suffix, decimals for non-whole values)
+_CURRENCY_SCALES = (
+    (0, 1, "", 0),
+    (1000, 1000, "k", 0),
+    (1000000, 1000000, "M", 1),
+)
+_CURRENCY_SCALE_BOUNDS = [scale[0] for scale in _CURRENCY_SCALES]
+
+
+# Currency formatting function with automatic scaling. It's pure and the same
+# amounts are formatted over and over on every rerun, so results are memoized.
+@lru_cache(maxsize=4096)
 def format_currency(value, force_full=False, context="general"):
     """
     Currency formatting with automatic scaling
@@ -6458,27 +6557,23 @@ def format_currency(value, force_full=False, context="general"):
 
     abs_value = abs(value)
 
-    if abs_value < 1000:
-        return f"${value:,.0f}"
-
     if context == "detailed" and abs_value < 100000:
         return f"${value:,.0f}"
 
-    if abs_value >= 1000000:
-        scaled = value / 1000000
-        if scaled == int(scaled):
-            return f"${scaled:.0f}M"
-        else:
-            return f"${scaled:.1f}M"
-    elif abs_value >= 1000:
-        scaled = value / 1000
-        if scaled == int(scaled):
-            return f"${scaled:.0f}k"
-        else:
-            return f"${scaled:.0f}k"
-    else:
+    _, divisor, suffix, decimals = _CURRENCY_SCALES[bisect_right(_CURRENCY_SCALE_BOUNDS, abs_value) - 1]
+    if divisor == 1:
         return f"${value:,.0f}"
 
+    scaled = value / divisor
+    if scaled == int(scaled):
+        decimals = 0
+    return f"${scaled:.{decimals}f}{suffix}"
+
+
+# Table column for whole-dollar amounts: tables hand the grid raw numbers and
+# let it format the cells it draws, instead of building a string per cell
+CURRENCY_COLUMN = st.column_config.NumberColumn(format="dollar", step=1)
+
 
 def get_save_file_path(default_filename, file_types):
     """
@@ -6646,7 +6741,6 @@ def setup_wizard():
             }]
 
         # Render each phase
-        phases_to_keep = []
         for i, phase in enumerate(career_phases):
             col_name, col_ages, col_sal, col_raise, col_del = st.columns([2, 2, 2, 1, 0.5])
             with col_name:
@@ -6668,29 +6762,30 @@ def setup_wizard():
                     value=phase['annual_raise_pct'], step=0.5, key=f"wiz_p1_cp_raise_{i}"))
             with col_del:
                 st.markdown("")
-                if len(career_phases) > 1 and st.button("✕", key=f"wiz_p1_cp_del_{i}", help="Remove this phase"):
-                    continue  # Skip this phase (don't add to phases_to_keep)
+                if len(career_phases) > 1:
+                    st.button("✕", key=f"wiz_p1_cp_del_{i}", help="Remove this phase",
+                              on_click=_remove_wizard_item, args=("p1_career_phases", i))
             phase['philosophy'] = 'Stable'  # Keep for backward compat with CareerPhase dataclass
-            phases_to_keep.append(phase)
 
-        career_phases = phases_to_keep
         # Warn if any phase extends past retirement
         for i, phase in enumerate(career_phases):
             if phase['end_age'] > p1_retire:
                 st.warning(f"**{phase.get('label', f'Phase {i+1}')}** ends at age {phase['end_age']} "
                            f"but retirement is set to age {p1_retire}. Income after retirement comes from Social Security, not employment.")
 
-        if st.button("＋ Add career phase", key="wiz_p1_add_phase"):
-            prev_end = career_phases[-1]['end_age'] if career_phases else p1_age
-            career_phases.append({
+        def _new_wizard_phase():
+            phases = st.session_state.wizard_data['p1_career_phases']
+            prev_end = phases[-1]['end_age'] if phases else p1_age
+            return {
                 'start_age': prev_end, 'end_age': min(prev_end + 10, p1_retire),
                 'philosophy': 'Stable',
                 'base_salary': float(st.session_state.wizard_data.get('p1_income', 75000)),
                 'annual_raise_pct': float(st.session_state.wizard_data.get('p1_raise', 3.0)),
-                'label': f'Phase {len(career_phases) + 1}',
-            })
-            st.session_state.wizard_data['p1_career_phases'] = career_phases
-            st.rerun()
+                'label': f'Phase {len(phases) + 1}',
+            }
+
+        st.button("＋ Add career phase", key="wiz_p1_add_phase",
+                  on_click=_append_wizard_item, args=("p1_career_phases", _new_wizard_phase))
         st.session_state.wizard_data['p1_career_phases'] = career_phases
 
         if is_couple:
@@ -7204,7 +7299,6 @@ def setup_wizard():
         if not purchases:
             purchases = []
 
-        purchases_to_keep = []
         for i, p in enumerate(purchases):
             col1, col2, col3, col4 = st.columns([2, 1.5, 1, 0.5])
             with col1:
@@ -7218,15 +7312,10 @@ def setup_wizard():
                     value=p.get('year', datetime.now().year + 1), key=f"wiz2_purch_yr_{i}")
             with col4:
                 st.markdown("")
-                if st.button("✕", key=f"wiz2_purch_del_{i}"):
-                    continue
-            purchases_to_keep.append(p)
-        purchases = purchases_to_keep
+                st.button("✕", key=f"wiz2_purch_del_{i}", on_click=_remove_wizard_item, args=("purchases", i))
 
-        if st.button("＋ Add one-time purchase", key="wiz2_add_purchase"):
-            purchases.append({'name': '', 'amount': 20000, 'year': datetime.now().year + 1})
-            wd['purchases'] = purchases
-            st.rerun()
+        st.button("＋ Add one-time purchase", key="wiz2_add_purchase", on_click=_append_wizard_item,
+                  args=("purchases", lambda: {'name': '', 'amount': 20000, 'year': datetime.now().year + 1}))
         wd['purchases'] = purchases
         wd['has_purchases'] = len(purchases) > 0
 
@@ -7235,7 +7324,6 @@ def setup_wizard():
         st.caption("Expenses that repeat on a schedule — new car every 5 years, home renovation every 10, etc.")
         recurring = wd.get('recurring_purchases', [])
 
-        recurring_to_keep = []
         for i, r in enumerate(recurring):
             col1, col2, col3, col4 = st.columns([2, 1.5, 1, 0.5])
             with col1:
@@ -7249,15 +7337,11 @@ def setup_wizard():
                     value=r.get('every_years', 5), key=f"wiz2_recur_freq_{i}")
             with col4:
                 st.markdown("")
-                if st.button("✕", key=f"wiz2_recur_del_{i}"):
-                    continue
-            recurring_to_keep.append(r)
-        recurring = recurring_to_keep
+                st.button("✕", key=f"wiz2_recur_del_{i}", on_click=_remove_wizard_item,
+                          args=("recurring_purchases", i))
 
-        if st.button("＋ Add recurring purchase", key="wiz2_add_recurring"):
-            recurring.append({'name': '', 'amount': 30000, 'every_years': 5})
-            wd['recurring_purchases'] = recurring
-            st.rerun()
+        st.button("＋ Add recurring purchase", key="wiz2_add_recurring", on_click=_append_wizard_item,
+                  args=("recurring_purchases", lambda: {'name': '', 'amount': 30000, 'every_years': 5}))
         wd['recurring_purchases'] = recurring
 
         st.markdown("")
@@ -9154,23 +9238,23 @@ def initialize_session_state():
 
 def get_state_for_year(year: int) -> tuple:
     """Get the state and spending strategy for a given year"""
-    if not st.session_state.state_timeline:
-        return "Seattle", "Average (statistical)"
+    return get_states_for_years([year])[0]
 
-    sorted_timeline = sorted(st.session_state.state_timeline, key=lambda x: x.year)
 
-    current_state = "Seattle"
-    current_strategy = "Average (statistical)"
+def get_states_for_years(years) -> list:
+    """State and spending strategy for each of years (timeline sorted once, then bisected per year)"""
+    sorted_timeline = sorted(st.session_state.state_timeline or [], key=lambda x: x.year)
+    entry_years = [entry.year for entry in sorted_timeline]
 
-    for entry in sorted_timeline:
-        if entry.year <= year:
-            current_state = entry.state
+    states = []
+    for year in years:
+        i = bisect_right(entry_years, year)
+        if i:
             # Normalize the strategy name for backward compatibility
-            current_strategy = normalize_strategy_name(entry.spending_strategy)
+            states.append((sorted_timeline[i - 1].state, normalize_strategy_name(sorted_timeline[i - 1].spending_strategy)))
         else:
-            break
-
-    return current_state, current_strategy
+            states.append(("Seattle", "Average (statistical)"))
+    return states
 
 
 def get_location_display_name(location: str) -> str:
@@ -9196,6 +9280,24 @@ def get_state_based_family_expenses(year: int) -> dict:
         return st.session_state.expenses.copy()
 
 
+def get_default_children_expense_rows() -> list:
+    """
+    The default children expenses table as one dict per age (Age column dropped).
+
+    Templates without per-age 'Food' data fall back to this table for every
+    (child, year) lookup, so it is converted once per table instead of
+    slicing a DataFrame row on each call. Callers must copy a row before
+    modifying it.
+    """
+    table = st.session_state.children_expenses
+    cached = st.session_state.get('_children_expense_rows')
+    if cached is None or cached[0] is not table:
+        rows = table.drop(columns='Age', errors='ignore').to_dict('records')
+        cached = (table, rows)
+        st.session_state._children_expense_rows = cached
+    return cached[1]
+
+
 def get_state_based_children_expenses(year: int, child_age: int) -> dict:
     """Get children expenses for a specific age based on the state for a given year"""
     state, strategy = get_state_for_year(year)
@@ -9214,9 +9316,9 @@ def get_state_based_children_expenses(year: int, child_age: int) -> dict:
 
         return child_expenses
     else:
-        if 0 <= child_age < len(st.session_state.children_expenses):
-            row = st.session_state.children_expenses.iloc[child_age]
-            return {col: row[col] for col in row.index if col != 'Age'}
+        default_rows = get_default_children_expense_rows()
+        if 0 <= child_age < len(default_rows):
+            return dict(default_rows[child_age])
         else:
             return {}
 
@@ -9269,9 +9371,9 @@ def get_child_expenses(child: dict, year: int, current_year: int) -> dict:
                 child_expenses[category] = 0
     else:
         # Fallback to default template
-        if 0 <= child_age < len(st.session_state.children_expenses):
-            row = st.session_state.children_expenses.iloc[child_age]
-            child_expenses = {col: row[col] for col in row.index if col != 'Age'}
+        default_rows = get_default_children_expense_rows()
+        if 0 <= child_age < len(default_rows):
+            child_expenses = dict(default_rows[child_age])
         else:
             child_expenses = {}
 
@@ -9346,39 +9448,59 @@ def get_child_expenses(child: dict, year: int, current_year: int) -> dict:
     return child_expenses
 
 
+def get_children_expense_totals(start_year: int, num_years: int) -> np.ndarray:
+    """
+    Combined expenses of all children for each year of a projection.
+
+    Children only have expenses between ages 0 and 30, so each child is only
+    looked up for the years inside that window.
+
+    Returns:
+        np.ndarray: total children expenses per year, starting at start_year
+    """
+    totals = np.zeros(num_years)
+    current_year = st.session_state.current_year
+    for child in st.session_state.children_list:
+        first_year = max(child['birth_year'], start_year)
+        last_year = min(child['birth_year'] + 30, start_year + num_years - 1)
+        for year in range(first_year, last_year + 1):
+            totals[year - start_year] += sum(get_child_expenses(child, year, current_year).values())
+    return totals
+
+
 def get_income_for_year(base_income: float, raise_rate: float, job_changes_df: pd.DataFrame,
                         current_year: int, target_year: int) -> float:
+    """Income for a single year considering job changes and raises (see get_income_for_years)"""
+    return float(get_income_for_years(base_income, raise_rate, job_changes_df, current_year, [target_year])[0])
+
+
+def get_income_for_years(base_income: float, raise_rate: float, job_changes_df: pd.DataFrame,
+                         current_year: int, target_years) -> np.ndarray:
     """
-    Calculate income for a specific year considering job changes and raises.
+    Vectorized get_income_for_year: income for each of target_years.
 
-    Args:
-        base_income: Starting income (current year)
-        raise_rate: Annual raise percentage
-        job_changes_df: DataFrame with 'Year' and 'New Income' columns
-        current_year: The current year (base year)
-        target_year: The year to calculate income for
+    The job change table is sorted once and each year's most recent change is
+    found with searchsorted, instead of filtering and sorting it per year.
 
     Returns:
-        float: Income for the target year
+        np.ndarray: Income for each target year
     """
-    # Find the most recent job change that applies to target_year
-    applicable_job_changes = job_changes_df[job_changes_df['Year'] <= target_year]
-
-    if len(applicable_job_changes) > 0:
-        # Get the most recent job change
-        most_recent = applicable_job_changes.sort_values('Year').iloc[-1]
-        last_change_year = most_recent['Year']
-        last_change_income = most_recent['New Income']
-
-        # Apply raises from the last job change to target year
-        years_since_change = target_year - last_change_year
-        income = last_change_income * (1 + raise_rate / 100) ** years_since_change
+    target_years = np.asarray(target_years, dtype=float)
+    changes = job_changes_df.sort_values('Year', kind='stable')
+    change_years = changes['Year'].to_numpy(dtype=float)
+    change_incomes = changes['New Income'].to_numpy(dtype=float)
+
+    # Most recent job change at or before each target year (-1: none yet)
+    idx = np.searchsorted(change_years, target_years, side='right') - 1
+    has_change = idx >= 0
+    if len(change_years) > 0:
+        start_years = np.where(has_change, change_years[np.maximum(idx, 0)], current_year)
+        start_incomes = np.where(has_change, change_incomes[np.maximum(idx, 0)], base_income)
     else:
-        # No job changes, apply raises from current year
-        years_from_now = target_year - current_year
-        income = base_income * (1 + raise_rate / 100) ** years_from_now
+        start_years = np.full(len(target_years), float(current_year))
+        start_incomes = np.full(len(target_years), float(base_income))
 
-    return income
+    return start_incomes * (1 + raise_rate / 100) ** (target_years - start_years)
 
 
 def get_career_income_for_year(career_phases, parent_age_current, current_year, target_year):
@@ -9561,7 +9683,7 @@ def plotly_fig_to_image(fig, width=6*inch, height=4*inch):
         return img
     except Exception as e:
         # If kaleido is not installed or conversion fails, return None
-        print(f"Warning: Could not convert chart to image: {e}")
+        logger.warning("Could not convert chart to image: %s", e)
         return None
 
 
@@ -9609,18 +9731,23 @@ def main():
     if st.session_state.get('wizard_manual') or st.session_state.get('wizard_phase2'):
         setup_wizard()
         return
+    plan_data = None
     if not st.session_state.get('wizard_complete') and not st.session_state.get('wizard_skipped'):
-        plan_data = load_household_plan(st.session_state.household_id)
-        if not plan_data:
-            setup_wizard()
-            return
+        # A household opened from the picker never sets either flag, so remember that its saved
+        # plan exists rather than re-reading and parsing the household file on every rerun
+        if st.session_state.get('_household_has_plan') != st.session_state.household_id:
+            plan_data = load_household_plan(st.session_state.household_id)
+            if not plan_data:
+                setup_wizard()
+                return
+            st.session_state._household_has_plan = st.session_state.household_id
 
     # User is authenticated - proceed with app
     was_fresh = 'initialized' not in st.session_state
     initialize_session_state()
     if was_fresh and st.session_state.get('household_id'):
         # Session was just restored from saved data
-        plan_data = load_household_plan(st.session_state.household_id)
+        plan_data = plan_data or load_household_plan(st.session_state.household_id)
         if plan_data:
             load_data(plan_data)
             st.session_state._session_restored = True
@@ -9629,14 +9756,13 @@ def main():
     if 'actuals_data' not in st.session_state:
         st.session_state.actuals_data = {}
 
-    # Auto-save: persist to household storage on every interaction
+    # Auto-save: persist to household storage whenever an interaction changed the plan
     if st.session_state.get('authenticated') and st.session_state.get('household_id') and st.session_state.get('initialized'):
         try:
-            json_data = save_data()
-            if json_data:
-                save_household_plan(st.session_state.household_id, json_data)
+            autosave_household_plan(st.session_state.household_id)
         except Exception:
-            pass  # Silent auto-save - don't interrupt the user
+            # Silent auto-save - don't interrupt the user
+            logger.debug("Auto-save failed for household %s", st.session_state.household_id, exc_info=True)
 
     user_display = st.session_state.user_data.get('display_name', st.session_state.current_user)
     if st.session_state.get('test_mode'):
@@ -9712,11 +9838,9 @@ def main():
         st.session_state.nav_group = selected_group
         if st.session_state.get('authenticated') and st.session_state.get('household_id') and st.session_state.get('initialized'):
             try:
-                json_data = save_data()
-                if json_data:
-                    save_household_plan(st.session_state.household_id, json_data)
+                autosave_household_plan(st.session_state.household_id)
             except Exception:
-                pass
+                logger.debug("Section-switch save failed for household %s", st.session_state.household_id, exc_info=True)
         st.rerun()
 
     # Brief section descriptions (one-liner captions)
@@ -9740,8 +9864,12 @@ def main():
     if enabled:
         tab_names = [n for n, f in enabled]
         tab_functions = [f for n, f in enabled]
-        tabs = st.tabs(tab_names)
+        # Stateful tabs: only the open tab runs its builder, so heavy tabs
+        # (cashflow/tax tables, Monte Carlo charts) aren't built while hidden.
+        tabs = st.tabs(tab_names, key=f"nav_tabs_{selected_group}", on_change="rerun")
         for tab, func in zip(tabs, tab_functions):
+            if tab.open is False:
+                continue
             with tab:
                 func()
     else:
@@ -9766,6 +9894,9 @@ def generate_alerts(cashflow_data: list) -> list:
     current_year = st.session_state.current_year
     is_separate = cashflow_data[0].get('finance_mode') == 'Separate' if cashflow_data else False
 
+    # Net worth as an array, so the scans below are NumPy reductions rather than Python loops
+    net_worth = np.array([row['net_worth'] for row in cashflow_data], dtype=float)
+
     # 1. Find the year net worth goes negative (if ever)
     broke_year = None
 
@@ -9783,26 +9914,23 @@ def generate_alerts(cashflow_data: list) -> list:
                     })
                     break
 
-    for row in cashflow_data:
-        if row['net_worth'] < 0:
-            broke_year = row['year']
-            p1_age = row['parent1_age']
-            alerts.append({
-                'severity': 'critical',
-                'title': f'Combined net worth goes negative in {broke_year}',
-                'detail': f'{st.session_state.parent1_name} will be {p1_age}. '
-                          f'Consider increasing savings or delaying retirement.'
-            })
-            break
+    negative = np.flatnonzero(net_worth < 0)
+    if negative.size:
+        row = cashflow_data[negative[0]]
+        broke_year = row['year']
+        p1_age = row['parent1_age']
+        alerts.append({
+            'severity': 'critical',
+            'title': f'Combined net worth goes negative in {broke_year}',
+            'detail': f'{st.session_state.parent1_name} will be {p1_age}. '
+                      f'Consider increasing savings or delaying retirement.'
+        })
 
     # 2. Peak net worth and when it starts declining
-    peak_nw = max(cashflow_data, key=lambda r: r['net_worth'])
+    peak_nw = cashflow_data[int(net_worth.argmax())]
     if peak_nw['net_worth'] > 0:
-        decline_start = None
-        for i in range(1, len(cashflow_data)):
-            if cashflow_data[i]['net_worth'] < cashflow_data[i-1]['net_worth']:
-                decline_start = cashflow_data[i]['year']
-                break
+        declines = np.flatnonzero(np.diff(net_worth) < 0)
+        decline_start = cashflow_data[declines[0] + 1]['year'] if declines.size else None
         if decline_start and decline_start < peak_nw['year'] + 5:
             alerts.append({
                 'severity': 'warning',
@@ -9901,9 +10029,8 @@ def _plan_completion_pct() -> tuple:
         (sum(st.session_state.family_shared_expenses.values()) > 0, "Review family expenses"),
         (st.session_state.get('state_timeline') and len(st.session_state.state_timeline) > 0, "Set your location"),
     ]
-    completed = sum(1 for ok, _ in checks if ok)
     missing = [msg for ok, msg in checks if not ok]
-    return completed / len(checks), missing
+    return (len(checks) - len(missing)) / len(checks), missing
 
 
 def _empty_state(icon: str, title: str, description: str):
@@ -9918,6 +10045,26 @@ def _empty_state(icon: str, title: str, description: str):
     )
 
 
+def _append_list_item(list_key: str, make_item):
+    """Button callback: append make_item() to a session-state list."""
+    st.session_state[list_key].append(make_item())
+
+
+def _remove_list_item(list_key: str, idx: int):
+    """Button callback: remove the item at idx from a session-state list."""
+    st.session_state[list_key].pop(idx)
+
+
+def _append_wizard_item(list_key: str, make_item):
+    """Button callback: append make_item() to a list in the setup wizard's answers."""
+    st.session_state.wizard_data.setdefault(list_key, []).append(make_item())
+
+
+def _remove_wizard_item(list_key: str, idx: int):
+    """Button callback: remove the item at idx from a list in the setup wizard's answers."""
+    st.session_state.wizard_data[list_key].pop(idx)
+
+
 def _validation_warnings():
     """Check for common data issues and return list of warning strings."""
     warnings = []
@@ -9953,6 +10100,51 @@ WHATS_NEW = [
 # DASHBOARD TAB
 # ══════════════════════════════════════════════════════════════════════════════
 
+def _dashboard_trajectory_chart(cashflow_data: list, is_separate: bool, p1_name: str, p2_name: str,
+                                p1_retire_year: int, years_to_retire: int) -> go.Figure:
+    """Dashboard's lifetime net worth / income / expenses chart for the year-by-year cashflow rows."""
+    years, net_worths, incomes, expenses = _cashflow_columns(
+        cashflow_data, 'year', 'net_worth', 'total_income', 'total_expenses')
+
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+
+    fig.add_trace(go.Scatter(
+        x=years, y=net_worths, name='Net Worth',
+        fill='tozeroy', line=dict(color=COLORS['primary'], width=2),
+        fillcolor='rgba(102,126,234,0.15)'
+    ), secondary_y=False)
+
+    fig.add_trace(go.Scatter(
+        x=years, y=incomes, name='Income',
+        line=dict(color=COLORS['success'], width=1.5, dash='dot')
+    ), secondary_y=True)
+    fig.add_trace(go.Scatter(
+        x=years, y=expenses, name='Expenses',
+        line=dict(color=COLORS['danger'], width=1.5, dash='dot')
+    ), secondary_y=True)
+
+    # Per-person net worth traces (Separate mode only)
+    if is_separate and cashflow_data[0].get('nw_parent1') is not None:
+        fig.add_trace(go.Scatter(
+            x=years, y=[r.get('nw_parent1', 0) for r in cashflow_data],
+            name=f'{p1_name}', line=dict(color=COLORS['purple'], width=1.5, dash='dash')
+        ), secondary_y=False)
+        fig.add_trace(go.Scatter(
+            x=years, y=[r.get('nw_parent2', 0) for r in cashflow_data],
+            name=f'{p2_name}', line=dict(color=COLORS['warning'], width=1.5, dash='dash')
+        ), secondary_y=False)
+
+    # Add retirement marker
+    if years_to_retire > 0:
+        fig.add_vline(x=p1_retire_year, line_dash="dash", line_color="gray", opacity=0.5,
+                      annotation_text="Retirement", annotation_position="top left")
+
+    fig.update_layout(title="Lifetime Financial Trajectory", xaxis_title="Year", **CHART_LAYOUT)
+    fig.update_yaxes(title_text="Net Worth ($)", secondary_y=False)
+    fig.update_yaxes(title_text="Annual Income / Expenses ($)", secondary_y=True)
+    return fig
+
+
 def dashboard_tab():
     """Dashboard — at-a-glance summary of your financial plan."""
     # Show family identity in dashboard header
@@ -9995,12 +10187,10 @@ def dashboard_tab():
     total_nw = st.session_state.parentX_net_worth + st.session_state.parentY_net_worth
 
     # Find key milestones from cashflow
-    peak_nw_row = max(cashflow_data, key=lambda r: r['net_worth'])
-    broke_year = None
-    for row in cashflow_data:
-        if row['net_worth'] < 0:
-            broke_year = row['year']
-            break
+    net_worth = np.array([row['net_worth'] for row in cashflow_data], dtype=float)
+    peak_nw_row = cashflow_data[int(net_worth.argmax())]
+    negative = np.flatnonzero(net_worth < 0)
+    broke_year = cashflow_data[negative[0]]['year'] if negative.size else None
 
     p1_retire_year = current_year + (st.session_state.parentX_retirement_age - st.session_state.parentX_age)
     years_to_retire = max(0, p1_retire_year - current_year)
@@ -10043,49 +10233,14 @@ def dashboard_tab():
     st.markdown("")
 
     # ── Net worth trajectory chart ───────────────────────────────────────────
-    years = [r['year'] for r in cashflow_data]
-    net_worths = [r['net_worth'] for r in cashflow_data]
-    incomes = [r['total_income'] for r in cashflow_data]
-    expenses = [r['total_expenses'] for r in cashflow_data]
-
-    from plotly.subplots import make_subplots
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
-
-    fig.add_trace(go.Scatter(
-        x=years, y=net_worths, name='Net Worth',
-        fill='tozeroy', line=dict(color=COLORS['primary'], width=2),
-        fillcolor='rgba(102,126,234,0.15)'
-    ), secondary_y=False)
-
-    fig.add_trace(go.Scatter(
-        x=years, y=incomes, name='Income',
-        line=dict(color=COLORS['success'], width=1.5, dash='dot')
-    ), secondary_y=True)
-    fig.add_trace(go.Scatter(
-        x=years, y=expenses, name='Expenses',
-        line=dict(color=COLORS['danger'], width=1.5, dash='dot')
-    ), secondary_y=True)
-
-    # Per-person net worth traces (Separate mode only)
-    if is_separate and cashflow_data[0].get('nw_parent1') is not None:
-        fig.add_trace(go.Scatter(
-            x=years, y=[r.get('nw_parent1', 0) for r in cashflow_data],
-            name=f'{p1_name}', line=dict(color=COLORS['purple'], width=1.5, dash='dash')
-        ), secondary_y=False)
-        fig.add_trace(go.Scatter(
-            x=years, y=[r.get('nw_parent2', 0) for r in cashflow_data],
-            name=f'{p2_name}', line=dict(color=COLORS['warning'], width=1.5, dash='dash')
-        ), secondary_y=False)
-
-    # Add retirement marker
-    if years_to_retire > 0:
-        fig.add_vline(x=p1_retire_year, line_dash="dash", line_color="gray", opacity=0.5,
-                      annotation_text="Retirement", annotation_position="top left")
-
-    fig.update_layout(title="Lifetime Financial Trajectory", xaxis_title="Year", **CHART_LAYOUT)
-    fig.update_yaxes(title_text="Net Worth ($)", secondary_y=False)
-    fig.update_yaxes(title_text="Annual Income / Expenses ($)", secondary_y=True)
-    st.plotly_chart(fig, use_container_width=True)
+    # calculate_lifetime_cashflow hands back the same rows until the plan changes, so the
+    # figure is only rebuilt when those rows or its labels change, not on every rerun
+    chart_labels = (is_separate, p1_name, p2_name, p1_retire_year, years_to_retire)
+    cached_chart = st.session_state.get('_dashboard_chart')
+    if cached_chart is None or cached_chart[0] is not cashflow_data or cached_chart[1] != chart_labels:
+        cached_chart = (cashflow_data, chart_labels, _dashboard_trajectory_chart(cashflow_data, *chart_labels))
+        st.session_state._dashboard_chart = cached_chart
+    st.plotly_chart(cached_chart[2], use_container_width=True)
 
     # ── Alerts section ───────────────────────────────────────────────────────
     alerts = generate_alerts(cashflow_data)
@@ -10347,9 +10502,43 @@ def _apply_whatif_add_child():
         st.error(f"Could not create scenario: {e}")
 
 
-# ══════════════════════════════════════════════════════════════════════════════
-# TAB HELP / WALKTHROUGH TEXT
-# ══════════════════════════════════════════════════════════════════════════════
+def _show_load_result(result_key: str):
+    """Show (and clear) the (level, message) a plan-loading callback left under result_key."""
+    result = st.session_state.pop(result_key, None)
+    if result:
+        level, message = result
+        getattr(st, level)(message)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _household_backup_files(household_id: str, dir_mtime_ns: int) -> tuple:
+    """Newest-first backup files for a household.
+
+    Keyed on the backup directory's mtime, which changes whenever a backup is
+    written or pruned, so the directory is only re-scanned after a save.
+    """
+    backup_dir = DATA_DIR / 'backups'
+    return tuple(sorted(backup_dir.glob(f"{household_id}_*.json"), reverse=True))
+
+
+def _restore_backup_version(hid: str, backup_label):
+    """Restore button callback: load the chosen snapshot and save it as the current plan again."""
+    backup_file = st.session_state.version_history_choice
+    try:
+        backup_data = _read_json_file(backup_file)
+        if 'plan_data' not in backup_data:
+            result = ('error', "Backup file doesn't contain plan data.")
+        else:
+            plan_json = json.dumps(backup_data['plan_data'])
+            if not load_data(plan_json):
+                return
+            # Also save the restored version as the current plan
+            save_household_plan(hid, plan_json)
+            result = ('success', f"Restored plan from {backup_label(backup_file)}")
+    except Exception as e:
+        result = ('error', f"Could not restore: {e}")
+    st.session_state['_restore_version_result'] = result
+
 
 def _version_history_section():
     """Show backup history with restore capability in Save/Load tab."""
@@ -10360,14 +10549,14 @@ def _version_history_section():
     if not backup_dir.exists():
         return
 
-    backups = sorted(backup_dir.glob(f"{hid}_*.json"), reverse=True)
+    backups = _household_backup_files(hid, backup_dir.stat().st_mtime_ns)
     if not backups:
         return
 
     st.subheader("🕐 Version History")
     st.caption("Automatic snapshots are created every time your plan is saved. Restore any previous version.")
 
-    for backup_file in backups[:10]:  # Show last 10
+    def _backup_label(backup_file):
         # Parse timestamp from filename: {hid}_{YYYYMMDD_HHMMSS}.json
         ts_part = backup_file.stem.replace(f"{hid}_", "")
         try:
@@ -10375,28 +10564,27 @@ def _version_history_section():
             display_time = ts.strftime("%b %d, %Y %I:%M %p")
         except ValueError:
             display_time = ts_part
+        return display_time
+
+    # One picker with a single Restore button rather than a button row per snapshot
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.selectbox(
+            "Snapshot",
+            options=backups[:10],  # Show last 10
+            format_func=lambda f: f"📄 {_backup_label(f)}  ({f.stat().st_size / 1024:.0f} KB)",
+            key="version_history_choice",
+            label_visibility="collapsed"
+        )
+    with col2:
+        st.button("Restore", key="restore_version", use_container_width=True,
+                  on_click=_restore_backup_version, args=(hid, _backup_label))
+    _show_load_result('_restore_version_result')
 
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            file_size = backup_file.stat().st_size / 1024
-            st.text(f"📄 {display_time}  ({file_size:.0f} KB)")
-        with col2:
-            if st.button("Restore", key=f"restore_{backup_file.name}", use_container_width=True):
-                try:
-                    with open(backup_file, 'r') as f:
-                        backup_data = json.load(f)
-                    if 'plan_data' in backup_data:
-                        plan_json = json.dumps(backup_data['plan_data'])
-                        if load_data(plan_json):
-                            # Also save the restored version as the current plan
-                            save_household_plan(hid, plan_json)
-                            st.success(f"Restored plan from {display_time}")
-                            st.rerun()
-                    else:
-                        st.error("Backup file doesn't contain plan data.")
-                except Exception as e:
-                    st.error(f"Could not restore: {e}")
 
+# ══════════════════════════════════════════════════════════════════════════════
+# TAB HELP / WALKTHROUGH TEXT
+# ══════════════════════════════════════════════════════════════════════════════
 
 TAB_HELP = {
     "dashboard": (
@@ -10532,6 +10720,12 @@ def _get_planned_for_year(year: int) -> dict:
     return {}
 
 
+def _breakdown_for_prefix(breakdown: dict, prefix: str) -> dict:
+    """Pick the `{prefix}{category}` entries of a cashflow breakdown, keyed by bare category."""
+    n = len(prefix)
+    return {k[n:]: v for k, v in breakdown.items() if k.startswith(prefix)}
+
+
 def actuals_input_tab():
     """Tab for entering actual year-end financial data."""
     st.header("📝 Enter Actuals")
@@ -10610,24 +10804,25 @@ def actuals_input_tab():
             act_val = actual_expenses.get(cat, 0)
             rows.append({"Category": cat, "Planned": plan_val, "Actual": act_val})
 
-        df = pd.DataFrame(rows)
+        df = pd.DataFrame(rows, columns=["Category", "Planned", "Actual"])
         edited = st.data_editor(
             df, key=f"actuals_editor_{key_prefix}",
             column_config={
                 "Category": st.column_config.TextColumn(disabled=True),
                 "Planned": st.column_config.NumberColumn(format="$%.0f", disabled=True),
-                "Actual": st.column_config.NumberColumn(format="$%.0f"),
+                "Actual": st.column_config.NumberColumn(format="$%.0f", min_value=0),
             },
             hide_index=True, use_container_width=True,
         )
-        return {row['Category']: row['Actual'] for _, row in edited.iterrows()}
+        # The column config only lets valid amounts through, so read the column as-is
+        return dict(zip(edited['Category'].tolist(), edited['Actual'].tolist()))
 
     # Get planned expense breakdowns
     planned_breakdown = planned.get('base_expenses_breakdown', {}) if planned else {}
 
     # Parent X expenses
     with expense_tabs[0]:
-        px_planned = {k.replace(f"{p1_name}_", ""): v for k, v in planned_breakdown.items() if k.startswith(f"{p1_name}_")} if planned_breakdown else {}
+        px_planned = _breakdown_for_prefix(planned_breakdown, f"{p1_name}_")
         if not px_planned:
             px_planned = dict(st.session_state.get('parentX_expenses', {}))
         px_actuals = actuals.get('expenses', {}).get('parentX', {})
@@ -10636,7 +10831,7 @@ def actuals_input_tab():
 
     # Parent Y expenses
     with expense_tabs[1]:
-        py_planned = {k.replace(f"{p2_name}_", ""): v for k, v in planned_breakdown.items() if k.startswith(f"{p2_name}_")} if planned_breakdown else {}
+        py_planned = _breakdown_for_prefix(planned_breakdown, f"{p2_name}_")
         if not py_planned:
             py_planned = dict(st.session_state.get('parentY_expenses', {}))
         py_actuals = actuals.get('expenses', {}).get('parentY', {})
@@ -10645,7 +10840,7 @@ def actuals_input_tab():
 
     # Family shared expenses
     with expense_tabs[2]:
-        fam_planned = {k.replace("Family_", ""): v for k, v in planned_breakdown.items() if k.startswith("Family_")} if planned_breakdown else {}
+        fam_planned = _breakdown_for_prefix(planned_breakdown, "Family_")
         if not fam_planned:
             fam_planned = dict(st.session_state.family_shared_expenses)
         fam_actuals = actuals.get('expenses', {}).get('family', {})
@@ -10837,14 +11032,11 @@ def plan_vs_actual_tab():
         categories.append(label)
         # Plan values from cashflow
         if plan_key == 'parentX':
-            pv = sum(v for k, v in planned.get('base_expenses_breakdown', {}).items()
-                     if k.startswith(st.session_state.parent1_name))
+            pv = sum(_breakdown_for_prefix(planned.get('base_expenses_breakdown', {}), f"{st.session_state.parent1_name}_").values())
         elif plan_key == 'parentY':
-            pv = sum(v for k, v in planned.get('base_expenses_breakdown', {}).items()
-                     if k.startswith(st.session_state.parent2_name))
+            pv = sum(_breakdown_for_prefix(planned.get('base_expenses_breakdown', {}), f"{st.session_state.parent2_name}_").values())
         elif plan_key == 'family':
-            pv = sum(v for k, v in planned.get('base_expenses_breakdown', {}).items()
-                     if k.startswith("Family"))
+            pv = sum(_breakdown_for_prefix(planned.get('base_expenses_breakdown', {}), "Family_").values())
         elif plan_key == 'children':
             pv = planned.get('children_expenses', 0)
         elif plan_key == 'healthcare':
@@ -10873,7 +11065,7 @@ def plan_vs_actual_tab():
         go.Bar(name='Actual', x=categories, y=actual_vals, marker_color=COLORS['warning']),
     ])
     fig.update_layout(barmode='group', title=f"Plan vs Actual — {selected_year}",
-                      yaxis=dict(tickformat="$,.0f"), height=400,
+                      yaxis=CURRENCY_AXIS, height=400,
                       font=dict(family="Inter, sans-serif"))
     st.plotly_chart(fig, use_container_width=True)
 
@@ -10887,7 +11079,7 @@ def plan_vs_actual_tab():
         v_colors = [COLORS['danger'] if v > 0 else COLORS['success'] for v in v_vals]
         fig_w = go.Figure(go.Bar(x=v_cats, y=v_vals, marker_color=v_colors))
         fig_w.update_layout(title="Over/Under Budget by Category",
-                            yaxis=dict(tickformat="$,.0f"), height=350,
+                            yaxis=CURRENCY_AXIS, height=350,
                             font=dict(family="Inter, sans-serif"))
         st.plotly_chart(fig_w, use_container_width=True)
 
@@ -10926,7 +11118,7 @@ def plan_vs_actual_tab():
         fig_trend.add_trace(go.Scatter(x=trend_years, y=act_nws, name='Actual',
                                         line=dict(color=COLORS['warning'], dash='dash')))
         fig_trend.update_layout(title="Net Worth: Plan vs Actual Over Time",
-                                yaxis=dict(tickformat="$,.0f"), height=350,
+                                yaxis=CURRENCY_AXIS, height=350,
                                 font=dict(family="Inter, sans-serif"))
         st.plotly_chart(fig_trend, use_container_width=True)
 
@@ -10956,8 +11148,7 @@ def excel_tracking_tab():
             with st.spinner("Generating Excel workbook..."):
                 wb = _generate_tracking_workbook(export_years[0], export_years[1])
                 if wb:
-                    from io import BytesIO
-                    buffer = BytesIO()
+                    buffer = io.BytesIO()
                     wb.save(buffer)
                     buffer.seek(0)
                     household_name = st.session_state.get('user_data', {}).get('household_id', 'plan')
@@ -11049,13 +11240,11 @@ def _generate_tracking_workbook(start_year: int, end_year: int):
         cashflow_data = calculate_lifetime_cashflow()
     except Exception:
         pass
+    # Planned rows keyed by year, so each summary row and expense sheet is one lookup
+    planned_by_year = {r['year']: r for r in cashflow_data}
 
     for row_idx, year in enumerate(range(start_year, end_year + 1), 2):
-        planned = {}
-        for r in cashflow_data:
-            if r['year'] == year:
-                planned = r
-                break
+        planned = planned_by_year.get(year, {})
         ws_sum.cell(row=row_idx, column=1, value=year)
         ws_sum.cell(row=row_idx, column=2, value=planned.get('net_worth', 0)).number_format = currency_fmt
         ws_sum.cell(row=row_idx, column=2).fill = plan_fill
@@ -11077,11 +11266,7 @@ def _generate_tracking_workbook(start_year: int, end_year: int):
 
     # Per-year expense sheets
     for year in range(start_year, end_year + 1):
-        planned = {}
-        for r in cashflow_data:
-            if r['year'] == year:
-                planned = r
-                break
+        planned = planned_by_year.get(year, {})
 
         ws = wb.create_sheet(f"Expenses_{year}")
 
@@ -11554,94 +11739,69 @@ def _family_expenses_guided_mode():
     _guided_nav(tab_key, step, total_steps)
 
 
-def parent_x_tab():
-    """Parent X financial details tab"""
-    st.header(f"{st.session_state.parent1_emoji} {st.session_state.parent1_name}'s Financial Details")
-    tab_walkthrough("parent")
+# Basic and retirement inputs on a parent's tab, one column each:
+# (session field suffix, label, number_input options, optional (caption prefix, multiplier)).
+# Fields without a min_value can't go below the parent's current age.
+PARENT_DETAIL_FIELDS = {
+    "Basic Information": [
+        ("age", "Current Age", {"min_value": 18, "max_value": 100, "step": 1}, None),
+        ("net_worth", "Current Net Worth ($)",
+         {"min_value": -10000000.0, "max_value": 100000000.0, "step": 1000.0, "format": "%.0f"}, ("Formatted", 1)),
+        ("income", "Annual Income ($)",
+         {"min_value": 0.0, "max_value": 10000000.0, "step": 1000.0, "format": "%.0f"}, ("Formatted", 1)),
+        ("raise", "Annual Raise (%)", {"min_value": 0.0, "max_value": 20.0, "step": 0.1, "format": "%.2f"}, None),
+    ],
+    "Retirement Information": [
+        ("retirement_age", "Retirement Age", {"max_value": 100, "step": 1}, None),
+        ("ss_benefit", "Monthly Social Security Benefit ($)",
+         {"min_value": 0.0, "max_value": 10000.0, "step": 50.0, "format": "%.0f"}, ("Annual", 12)),
+        ("death_age", "Expected Death Age", {"max_value": 120, "step": 1}, None),
+    ],
+}
 
-    col1, col2 = st.columns(2)
 
-    with col1:
-        st.subheader("Basic Information")
-        st.session_state.parentX_age = st.number_input(
-            "Current Age",
-            min_value=18,
-            max_value=100,
-            value=int(st.session_state.parentX_age),
-            step=1,
-            key="parentX_age_input"
-        )
+def parent_x_tab():
+    """Parent X financial details tab"""
+    _parent_details_tab("X")
 
-        st.session_state.parentX_net_worth = st.number_input(
-            "Current Net Worth ($)",
-            min_value=-10000000.0,
-            max_value=100000000.0,
-            value=float(st.session_state.parentX_net_worth),
-            step=1000.0,
-            format="%.0f",
-            key="parentX_net_worth_input"
-        )
-        st.caption(f"Formatted: {format_currency(st.session_state.parentX_net_worth, force_full=False)}")
 
-        st.session_state.parentX_income = st.number_input(
-            "Annual Income ($)",
-            min_value=0.0,
-            max_value=10000000.0,
-            value=float(st.session_state.parentX_income),
-            step=1000.0,
-            format="%.0f",
-            key="parentX_income_input"
-        )
-        st.caption(f"Formatted: {format_currency(st.session_state.parentX_income, force_full=False)}")
+def parent_y_tab():
+    """Parent Y financial details tab"""
+    _parent_details_tab("Y")
 
-        st.session_state.parentX_raise = st.number_input(
-            "Annual Raise (%)",
-            min_value=0.0,
-            max_value=20.0,
-            value=float(st.session_state.parentX_raise),
-            step=0.1,
-            format="%.2f",
-            key="parentX_raise_input"
-        )
 
-    with col2:
-        st.subheader("Retirement Information")
-        st.session_state.parentX_retirement_age = st.number_input(
-            "Retirement Age",
-            min_value=int(st.session_state.parentX_age),
-            max_value=100,
-            value=int(st.session_state.parentX_retirement_age),
-            step=1,
-            key="parentX_retirement_age_input"
-        )
+def _parent_details_tab(parent_prefix):
+    """Financial details tab for one parent."""
+    p = parent_prefix  # "X" or "Y"
+    short = f"p{p.lower()}"  # career phase widget keys use "px_" / "py_"
+    number = 1 if p == "X" else 2
+    name = st.session_state[f"parent{number}_name"]
+    st.header(f"{st.session_state[f'parent{number}_emoji']} {name}'s Financial Details")
+    tab_walkthrough("parent")
 
-        st.session_state.parentX_ss_benefit = st.number_input(
-            "Monthly Social Security Benefit ($)",
-            min_value=0.0,
-            max_value=10000.0,
-            value=float(st.session_state.parentX_ss_benefit),
-            step=50.0,
-            format="%.0f",
-            key="parentX_ss_benefit_input"
-        )
-        st.caption(f"Annual: {format_currency(st.session_state.parentX_ss_benefit * 12, force_full=False)}")
-
-        st.session_state.parentX_death_age = st.number_input(
-            "Expected Death Age",
-            min_value=int(st.session_state.parentX_age),
-            max_value=120,
-            value=int(st.session_state.parentX_death_age),
-            step=1,
-            key="parentX_death_age_input"
-        )
+    for column, (section, fields) in zip(st.columns(2), PARENT_DETAIL_FIELDS.items()):
+        with column:
+            st.subheader(section)
+            for field, label, options, caption in fields:
+                state_key = f"parent{p}_{field}"
+                options = {"min_value": int(st.session_state[f"parent{p}_age"]), **options}
+                st.session_state[state_key] = st.number_input(
+                    label,
+                    value=type(options["step"])(st.session_state[state_key]),
+                    key=f"{state_key}_input",
+                    **options
+                )
+                if caption:
+                    caption_prefix, multiplier = caption
+                    st.caption(f"{caption_prefix}: {format_currency(st.session_state[state_key] * multiplier, force_full=False)}")
 
     st.subheader("Career Phases")
     st.caption("Model your career trajectory — each phase represents a job or career stage. Default: single stable career until retirement.")
 
-    phases = st.session_state.parentX_career_phases
+    phases = st.session_state[f"parent{p}_career_phases"]
 
     # Philosophy defaults helper
-    PHILOSOPHY_DEFAULTS_PX = {
+    PHILOSOPHY_DEFAULTS = {
         "Stable": {"raise": 3.0, "bonus": 5.0, "rsu": 0},
         "Climbing the Ladder": {"raise": 5.0, "bonus": 15.0, "rsu": 0},
         "Startup": {"raise": 2.0, "bonus": 10.0, "rsu": 0},
@@ -11653,381 +11813,182 @@ def parent_x_tab():
         with st.expander(f"Phase {idx+1}: {phase.label or phase.philosophy} — Age {phase.start_age} to {phase.end_age}", expanded=(idx == 0)):
             col1, col2, col3 = st.columns(3)
             with col1:
-                phases[idx].start_age = st.number_input("Start Age", value=int(phase.start_age), min_value=16, max_value=100, key=f"px_cp_start_{idx}")
+                phases[idx].start_age = st.number_input("Start Age", value=int(phase.start_age), min_value=16, max_value=100, key=f"{short}_cp_start_{idx}")
             with col2:
-                phases[idx].end_age = st.number_input("End Age", value=int(phase.end_age), min_value=17, max_value=100, key=f"px_cp_end_{idx}")
+                phases[idx].end_age = st.number_input("End Age", value=int(phase.end_age), min_value=17, max_value=100, key=f"{short}_cp_end_{idx}")
             with col3:
                 phil_options = ["Stable", "Climbing the Ladder", "Startup", "Part-time", "Coasting"]
                 phil_idx = phil_options.index(phase.philosophy) if phase.philosophy in phil_options else 0
-                new_phil = st.selectbox("Career Style", phil_options, index=phil_idx, key=f"px_cp_phil_{idx}")
+                new_phil = st.selectbox("Career Style", phil_options, index=phil_idx, key=f"{short}_cp_phil_{idx}")
                 if new_phil != phase.philosophy:
                     phases[idx].philosophy = new_phil
-                    defaults = PHILOSOPHY_DEFAULTS_PX[new_phil]
+                    defaults = PHILOSOPHY_DEFAULTS[new_phil]
                     phases[idx].annual_raise_pct = defaults["raise"]
                     phases[idx].annual_bonus_pct = defaults["bonus"]
 
-            phases[idx].label = st.text_input("Label", value=phase.label, placeholder="e.g., Senior Engineer at BigCo", key=f"px_cp_label_{idx}")
+            phases[idx].label = st.text_input("Label", value=phase.label, placeholder="e.g., Senior Engineer at BigCo", key=f"{short}_cp_label_{idx}")
 
             col1, col2, col3 = st.columns(3)
             with col1:
-                phases[idx].base_salary = st.number_input("Base Salary ($)", value=float(phase.base_salary), min_value=0.0, step=5000.0, key=f"px_cp_salary_{idx}")
+                phases[idx].base_salary = st.number_input("Base Salary ($)", value=float(phase.base_salary), min_value=0.0, step=5000.0, key=f"{short}_cp_salary_{idx}")
             with col2:
-                phases[idx].annual_raise_pct = st.number_input("Annual Raise %", value=float(phase.annual_raise_pct), min_value=0.0, max_value=50.0, step=0.5, key=f"px_cp_raise_{idx}")
+                phases[idx].annual_raise_pct = st.number_input("Annual Raise %", value=float(phase.annual_raise_pct), min_value=0.0, max_value=50.0, step=0.5, key=f"{short}_cp_raise_{idx}")
             with col3:
-                phases[idx].annual_bonus_pct = st.number_input("Annual Bonus %", value=float(phase.annual_bonus_pct), min_value=0.0, max_value=100.0, step=1.0, key=f"px_cp_bonus_{idx}")
+                phases[idx].annual_bonus_pct = st.number_input("Annual Bonus %", value=float(phase.annual_bonus_pct), min_value=0.0, max_value=100.0, step=1.0, key=f"{short}_cp_bonus_{idx}")
 
-            has_equity = st.checkbox("I receive equity compensation", value=(phase.rsu_annual_grant > 0 or phase.stock_options_grant > 0), key=f"px_cp_equity_{idx}")
+            has_equity = st.checkbox("I receive equity compensation", value=(phase.rsu_annual_grant > 0 or phase.stock_options_grant > 0), key=f"{short}_cp_equity_{idx}")
             if has_equity:
                 col1, col2 = st.columns(2)
                 with col1:
-                    phases[idx].rsu_annual_grant = st.number_input("RSU Annual Grant ($)", value=float(phase.rsu_annual_grant), min_value=0.0, step=5000.0, key=f"px_cp_rsu_{idx}")
+                    phases[idx].rsu_annual_grant = st.number_input("RSU Annual Grant ($)", value=float(phase.rsu_annual_grant), min_value=0.0, step=5000.0, key=f"{short}_cp_rsu_{idx}")
                 with col2:
-                    phases[idx].rsu_vesting_years = st.number_input("Vesting Period (years)", value=int(phase.rsu_vesting_years), min_value=1, max_value=6, key=f"px_cp_vest_{idx}")
+                    phases[idx].rsu_vesting_years = st.number_input("Vesting Period (years)", value=int(phase.rsu_vesting_years), min_value=1, max_value=6, key=f"{short}_cp_vest_{idx}")
 
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    phases[idx].stock_options_grant = st.number_input("Stock Options Grant ($)", value=float(phase.stock_options_grant), min_value=0.0, step=10000.0, key=f"px_cp_opts_{idx}", help="Expected value above strike price")
+                    phases[idx].stock_options_grant = st.number_input("Stock Options Grant ($)", value=float(phase.stock_options_grant), min_value=0.0, step=10000.0, key=f"{short}_cp_opts_{idx}", help="Expected value above strike price")
                 with col2:
-                    phases[idx].stock_options_growth_pct = st.number_input("Options Growth %/yr", value=float(phase.stock_options_growth_pct), min_value=0.0, max_value=100.0, step=5.0, key=f"px_cp_optgrow_{idx}")
+                    phases[idx].stock_options_growth_pct = st.number_input("Options Growth %/yr", value=float(phase.stock_options_growth_pct), min_value=0.0, max_value=100.0, step=5.0, key=f"{short}_cp_optgrow_{idx}")
                 with col3:
-                    phases[idx].stock_options_liquidity_year = st.number_input("Liquidity Year", value=int(phase.stock_options_liquidity_year), min_value=0, max_value=2080, key=f"px_cp_optliq_{idx}", help="Year of IPO/acquisition. 0 = never")
+                    phases[idx].stock_options_liquidity_year = st.number_input("Liquidity Year", value=int(phase.stock_options_liquidity_year), min_value=0, max_value=2080, key=f"{short}_cp_optliq_{idx}", help="Year of IPO/acquisition. 0 = never")
             else:
                 phases[idx].rsu_annual_grant = 0.0
                 phases[idx].stock_options_grant = 0.0
 
             if len(phases) > 1:
-                if st.button("Remove this phase", key=f"px_cp_del_{idx}"):
-                    phases.pop(idx)
-                    st.rerun()
+                st.button("Remove this phase", key=f"{short}_cp_del_{idx}",
+                          on_click=_remove_list_item, args=(f"parent{p}_career_phases", idx))
 
-    if st.button("+ Add Career Phase", key="px_add_phase"):
+    def _new_career_phase():
         last = phases[-1] if phases else None
-        new_start = last.end_age if last else st.session_state.parentX_age
-        phases.append(CareerPhase(
-            start_age=new_start,
-            end_age=st.session_state.parentX_retirement_age,
+        return CareerPhase(
+            start_age=last.end_age if last else st.session_state[f"parent{p}_age"],
+            end_age=st.session_state[f"parent{p}_retirement_age"],
             philosophy="Stable",
             base_salary=last.base_salary if last else 75000,
             annual_raise_pct=3.0,
             label=""
-        ))
-        st.rerun()
+        )
 
-    st.session_state.parentX_career_phases = phases
+    st.button("+ Add Career Phase", key=f"{short}_add_phase",
+              on_click=_append_list_item, args=(f"parent{p}_career_phases", _new_career_phase))
+
+    st.session_state[f"parent{p}_career_phases"] = phases
     # Sync legacy fields
     if phases:
-        st.session_state.parentX_income = phases[0].base_salary
-        st.session_state.parentX_raise = phases[0].annual_raise_pct
+        st.session_state[f"parent{p}_income"] = phases[0].base_salary
+        st.session_state[f"parent{p}_raise"] = phases[0].annual_raise_pct
 
     # Annual Expenses Section
     st.markdown("---")
     st.subheader("💳 Annual Expenses")
-    st.markdown(f"Track {st.session_state.parent1_name}'s individual expenses (groceries, transportation, healthcare, etc.)")
+    st.markdown(f"Track {name}'s individual expenses (groceries, transportation, healthcare, etc.)")
 
     # Expense template settings
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        st.session_state.parentX_use_template = st.checkbox(
+        st.session_state[f"parent{p}_use_template"] = st.checkbox(
             "Use Expense Template",
-            value=st.session_state.parentX_use_template,
-            key="parentX_use_template_checkbox",
+            value=st.session_state[f"parent{p}_use_template"],
+            key=f"parent{p}_use_template_checkbox",
             help="Use location/strategy-based expense template or enter custom amounts"
         )
 
     with col2:
-        st.session_state.parentX_expense_location = st.selectbox(
+        st.session_state[f"parent{p}_expense_location"] = st.selectbox(
             "Location",
             options=AVAILABLE_LOCATIONS_ADULTS,
-            index=AVAILABLE_LOCATIONS_ADULTS.index(st.session_state.parentX_expense_location) if st.session_state.parentX_expense_location in AVAILABLE_LOCATIONS_ADULTS else 0,
-            key="parentX_expense_location_select",
-            disabled=not st.session_state.parentX_use_template
+            index=AVAILABLE_LOCATIONS_ADULTS.index(st.session_state[f"parent{p}_expense_location"]) if st.session_state[f"parent{p}_expense_location"] in AVAILABLE_LOCATIONS_ADULTS else 0,
+            key=f"parent{p}_expense_location_select",
+            disabled=not st.session_state[f"parent{p}_use_template"]
         )
 
     with col3:
-        st.session_state.parentX_expense_strategy = st.selectbox(
+        st.session_state[f"parent{p}_expense_strategy"] = st.selectbox(
             "Spending Strategy",
             options=STATISTICAL_STRATEGIES,
-            index=STATISTICAL_STRATEGIES.index(st.session_state.parentX_expense_strategy) if st.session_state.parentX_expense_strategy in STATISTICAL_STRATEGIES else 1,
-            key="parentX_expense_strategy_select",
-            disabled=not st.session_state.parentX_use_template
+            index=STATISTICAL_STRATEGIES.index(st.session_state[f"parent{p}_expense_strategy"]) if st.session_state[f"parent{p}_expense_strategy"] in STATISTICAL_STRATEGIES else 1,
+            key=f"parent{p}_expense_strategy_select",
+            disabled=not st.session_state[f"parent{p}_use_template"]
         )
 
     # Load template if using template mode
-    if st.session_state.parentX_use_template:
-        if st.button("📥 Load Template", key="parentX_load_template"):
+    if st.session_state[f"parent{p}_use_template"]:
+        if st.button("📥 Load Template", key=f"parent{p}_load_template"):
             template_data = get_adult_expense_template(
-                st.session_state.parentX_expense_location,
-                st.session_state.parentX_expense_strategy
+                st.session_state[f"parent{p}_expense_location"],
+                st.session_state[f"parent{p}_expense_strategy"]
             )
-            st.session_state.parentX_expenses = template_data.copy()
-            st.success(f"✅ Loaded {st.session_state.parentX_expense_strategy} template for {st.session_state.parentX_expense_location}")
+            st.session_state[f"parent{p}_expenses"] = template_data.copy()
+            location = st.session_state[f"parent{p}_expense_location"]
+            strategy = st.session_state[f"parent{p}_expense_strategy"]
+            st.success(f"✅ Loaded {strategy} template for {location}")
 
     # Display expenses by category group
     st.markdown("#### Expense Categories")
 
-    total_parentX_expenses = 0
+    expenses = st.session_state[f"parent{p}_expenses"]
+    total_expenses = 0
 
     for group_name, categories in ADULT_EXPENSE_CATEGORIES.items():
         with st.expander(f"**{group_name}**", expanded=False):
             cols = st.columns(2)
             for idx, category in enumerate(categories):
                 with cols[idx % 2]:
-                    if category not in st.session_state.parentX_expenses:
-                        st.session_state.parentX_expenses[category] = 0
+                    if category not in expenses:
+                        expenses[category] = 0
 
-                    st.session_state.parentX_expenses[category] = st.number_input(
+                    expenses[category] = st.number_input(
                         category,
                         min_value=0.0,
                         max_value=1000000.0,
-                        value=float(st.session_state.parentX_expenses[category]),
+                        value=float(expenses[category]),
                         step=100.0,
                         format="%.0f",
-                        key=f"parentX_expense_{category}",
+                        key=f"parent{p}_expense_{category}",
                         help=f"Annual amount for {category}"
                     )
-                    total_parentX_expenses += st.session_state.parentX_expenses[category]
+                    total_expenses += expenses[category]
 
     st.markdown("---")
-    st.metric("**Total Annual Expenses**", format_currency(total_parentX_expenses, force_full=False))
+    st.metric("**Total Annual Expenses**", format_currency(total_expenses, force_full=False))
 
 
-def parent_y_tab():
-    """Parent Y financial details tab"""
-    st.header(f"{st.session_state.parent2_emoji} {st.session_state.parent2_name}'s Financial Details")
-    tab_walkthrough("parent")
+@st.fragment
+def _template_amount_editor(template: dict) -> dict:
+    """
+    Amount inputs for each category of the template being edited, with their total.
 
-    col1, col2 = st.columns(2)
+    Runs as a fragment, so changing an amount only reruns this editor and its
+    total rather than the whole app. The save button outside it triggers a
+    full run, which reads the amounts back from their widget keys.
+    """
+    edited_template = {}
 
-    with col1:
-        st.subheader("Basic Information")
-        st.session_state.parentY_age = st.number_input(
-            "Current Age",
-            min_value=18,
-            max_value=100,
-            value=int(st.session_state.parentY_age),
-            step=1,
-            key="parentY_age_input"
-        )
+    for category, value in template.items():
+        col_cat, col_val = st.columns([2, 1])
 
-        st.session_state.parentY_net_worth = st.number_input(
-            "Current Net Worth ($)",
-            min_value=-10000000.0,
-            max_value=100000000.0,
-            value=float(st.session_state.parentY_net_worth),
-            step=1000.0,
-            format="%.0f",
-            key="parentY_net_worth_input"
-        )
-        st.caption(f"Formatted: {format_currency(st.session_state.parentY_net_worth, force_full=False)}")
+        with col_cat:
+            st.markdown(f"**{category}**")
 
-        st.session_state.parentY_income = st.number_input(
-            "Annual Income ($)",
-            min_value=0.0,
-            max_value=10000000.0,
-            value=float(st.session_state.parentY_income),
-            step=1000.0,
-            format="%.0f",
-            key="parentY_income_input"
-        )
-        st.caption(f"Formatted: {format_currency(st.session_state.parentY_income, force_full=False)}")
-
-        st.session_state.parentY_raise = st.number_input(
-            "Annual Raise (%)",
-            min_value=0.0,
-            max_value=20.0,
-            value=float(st.session_state.parentY_raise),
-            step=0.1,
-            format="%.2f",
-            key="parentY_raise_input"
-        )
-
-    with col2:
-        st.subheader("Retirement Information")
-        st.session_state.parentY_retirement_age = st.number_input(
-            "Retirement Age",
-            min_value=int(st.session_state.parentY_age),
-            max_value=100,
-            value=int(st.session_state.parentY_retirement_age),
-            step=1,
-            key="parentY_retirement_age_input"
-        )
-
-        st.session_state.parentY_ss_benefit = st.number_input(
-            "Monthly Social Security Benefit ($)",
-            min_value=0.0,
-            max_value=10000.0,
-            value=float(st.session_state.parentY_ss_benefit),
-            step=50.0,
-            format="%.0f",
-            key="parentY_ss_benefit_input"
-        )
-        st.caption(f"Annual: {format_currency(st.session_state.parentY_ss_benefit * 12, force_full=False)}")
-
-        st.session_state.parentY_death_age = st.number_input(
-            "Expected Death Age",
-            min_value=int(st.session_state.parentY_age),
-            max_value=120,
-            value=int(st.session_state.parentY_death_age),
-            step=1,
-            key="parentY_death_age_input"
-        )
-
-    st.subheader("Career Phases")
-    st.caption("Model your career trajectory — each phase represents a job or career stage. Default: single stable career until retirement.")
-
-    phases_y = st.session_state.parentY_career_phases
-
-    # Philosophy defaults helper
-    PHILOSOPHY_DEFAULTS_PY = {
-        "Stable": {"raise": 3.0, "bonus": 5.0, "rsu": 0},
-        "Climbing the Ladder": {"raise": 5.0, "bonus": 15.0, "rsu": 0},
-        "Startup": {"raise": 2.0, "bonus": 10.0, "rsu": 0},
-        "Part-time": {"raise": 1.0, "bonus": 0.0, "rsu": 0},
-        "Coasting": {"raise": 2.0, "bonus": 5.0, "rsu": 0},
-    }
-
-    for idx, phase in enumerate(phases_y):
-        with st.expander(f"Phase {idx+1}: {phase.label or phase.philosophy} — Age {phase.start_age} to {phase.end_age}", expanded=(idx == 0)):
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                phases_y[idx].start_age = st.number_input("Start Age", value=int(phase.start_age), min_value=16, max_value=100, key=f"py_cp_start_{idx}")
-            with col2:
-                phases_y[idx].end_age = st.number_input("End Age", value=int(phase.end_age), min_value=17, max_value=100, key=f"py_cp_end_{idx}")
-            with col3:
-                phil_options = ["Stable", "Climbing the Ladder", "Startup", "Part-time", "Coasting"]
-                phil_idx = phil_options.index(phase.philosophy) if phase.philosophy in phil_options else 0
-                new_phil = st.selectbox("Career Style", phil_options, index=phil_idx, key=f"py_cp_phil_{idx}")
-                if new_phil != phase.philosophy:
-                    phases_y[idx].philosophy = new_phil
-                    defaults = PHILOSOPHY_DEFAULTS_PY[new_phil]
-                    phases_y[idx].annual_raise_pct = defaults["raise"]
-                    phases_y[idx].annual_bonus_pct = defaults["bonus"]
-
-            phases_y[idx].label = st.text_input("Label", value=phase.label, placeholder="e.g., Senior Engineer at BigCo", key=f"py_cp_label_{idx}")
-
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                phases_y[idx].base_salary = st.number_input("Base Salary ($)", value=float(phase.base_salary), min_value=0.0, step=5000.0, key=f"py_cp_salary_{idx}")
-            with col2:
-                phases_y[idx].annual_raise_pct = st.number_input("Annual Raise %", value=float(phase.annual_raise_pct), min_value=0.0, max_value=50.0, step=0.5, key=f"py_cp_raise_{idx}")
-            with col3:
-                phases_y[idx].annual_bonus_pct = st.number_input("Annual Bonus %", value=float(phase.annual_bonus_pct), min_value=0.0, max_value=100.0, step=1.0, key=f"py_cp_bonus_{idx}")
-
-            has_equity = st.checkbox("I receive equity compensation", value=(phase.rsu_annual_grant > 0 or phase.stock_options_grant > 0), key=f"py_cp_equity_{idx}")
-            if has_equity:
-                col1, col2 = st.columns(2)
-                with col1:
-                    phases_y[idx].rsu_annual_grant = st.number_input("RSU Annual Grant ($)", value=float(phase.rsu_annual_grant), min_value=0.0, step=5000.0, key=f"py_cp_rsu_{idx}")
-                with col2:
-                    phases_y[idx].rsu_vesting_years = st.number_input("Vesting Period (years)", value=int(phase.rsu_vesting_years), min_value=1, max_value=6, key=f"py_cp_vest_{idx}")
-
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    phases_y[idx].stock_options_grant = st.number_input("Stock Options Grant ($)", value=float(phase.stock_options_grant), min_value=0.0, step=10000.0, key=f"py_cp_opts_{idx}", help="Expected value above strike price")
-                with col2:
-                    phases_y[idx].stock_options_growth_pct = st.number_input("Options Growth %/yr", value=float(phase.stock_options_growth_pct), min_value=0.0, max_value=100.0, step=5.0, key=f"py_cp_optgrow_{idx}")
-                with col3:
-                    phases_y[idx].stock_options_liquidity_year = st.number_input("Liquidity Year", value=int(phase.stock_options_liquidity_year), min_value=0, max_value=2080, key=f"py_cp_optliq_{idx}", help="Year of IPO/acquisition. 0 = never")
-            else:
-                phases_y[idx].rsu_annual_grant = 0.0
-                phases_y[idx].stock_options_grant = 0.0
-
-            if len(phases_y) > 1:
-                if st.button("Remove this phase", key=f"py_cp_del_{idx}"):
-                    phases_y.pop(idx)
-                    st.rerun()
-
-    if st.button("+ Add Career Phase", key="py_add_phase"):
-        last = phases_y[-1] if phases_y else None
-        new_start = last.end_age if last else st.session_state.parentY_age
-        phases_y.append(CareerPhase(
-            start_age=new_start,
-            end_age=st.session_state.parentY_retirement_age,
-            philosophy="Stable",
-            base_salary=last.base_salary if last else 75000,
-            annual_raise_pct=3.0,
-            label=""
-        ))
-        st.rerun()
-
-    st.session_state.parentY_career_phases = phases_y
-    # Sync legacy fields
-    if phases_y:
-        st.session_state.parentY_income = phases_y[0].base_salary
-        st.session_state.parentY_raise = phases_y[0].annual_raise_pct
-
-    # Annual Expenses Section
-    st.markdown("---")
-    st.subheader("💳 Annual Expenses")
-    st.markdown(f"Track {st.session_state.parent2_name}'s individual expenses (groceries, transportation, healthcare, etc.)")
-
-    # Expense template settings
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        st.session_state.parentY_use_template = st.checkbox(
-            "Use Expense Template",
-            value=st.session_state.parentY_use_template,
-            key="parentY_use_template_checkbox",
-            help="Use location/strategy-based expense template or enter custom amounts"
-        )
-
-    with col2:
-        st.session_state.parentY_expense_location = st.selectbox(
-            "Location",
-            options=AVAILABLE_LOCATIONS_ADULTS,
-            index=AVAILABLE_LOCATIONS_ADULTS.index(st.session_state.parentY_expense_location) if st.session_state.parentY_expense_location in AVAILABLE_LOCATIONS_ADULTS else 0,
-            key="parentY_expense_location_select",
-            disabled=not st.session_state.parentY_use_template
-        )
-
-    with col3:
-        st.session_state.parentY_expense_strategy = st.selectbox(
-            "Spending Strategy",
-            options=STATISTICAL_STRATEGIES,
-            index=STATISTICAL_STRATEGIES.index(st.session_state.parentY_expense_strategy) if st.session_state.parentY_expense_strategy in STATISTICAL_STRATEGIES else 1,
-            key="parentY_expense_strategy_select",
-            disabled=not st.session_state.parentY_use_template
-        )
-
-    # Load template if using template mode
-    if st.session_state.parentY_use_template:
-        if st.button("📥 Load Template", key="parentY_load_template"):
-            template_data = get_adult_expense_template(
-                st.session_state.parentY_expense_location,
-                st.session_state.parentY_expense_strategy
+        with col_val:
+            new_value = st.number_input(
+                f"Amount for {category}",
+                min_value=0.0,
+                max_value=1000000.0,
+                value=float(value),
+                step=100.0,
+                key=f"edit_{category}",
+                label_visibility="collapsed"
             )
-            st.session_state.parentY_expenses = template_data.copy()
-            st.success(f"✅ Loaded {st.session_state.parentY_expense_strategy} template for {st.session_state.parentY_expense_location}")
+            edited_template[category] = new_value
 
-    # Display expenses by category group
-    st.markdown("#### Expense Categories")
+    # Show total
+    total_edited = sum(edited_template.values())
+    st.metric("Total Annual Expenses", f"${total_edited:,.0f}")
 
-    total_parentY_expenses = 0
-
-    for group_name, categories in ADULT_EXPENSE_CATEGORIES.items():
-        with st.expander(f"**{group_name}**", expanded=False):
-            cols = st.columns(2)
-            for idx, category in enumerate(categories):
-                with cols[idx % 2]:
-                    if category not in st.session_state.parentY_expenses:
-                        st.session_state.parentY_expenses[category] = 0
-
-                    st.session_state.parentY_expenses[category] = st.number_input(
-                        category,
-                        min_value=0.0,
-                        max_value=1000000.0,
-                        value=float(st.session_state.parentY_expenses[category]),
-                        step=100.0,
-                        format="%.0f",
-                        key=f"parentY_expense_{category}",
-                        help=f"Annual amount for {category}"
-                    )
-                    total_parentY_expenses += st.session_state.parentY_expenses[category]
-
-    st.markdown("---")
-    st.metric("**Total Annual Expenses**", format_currency(total_parentY_expenses, force_full=False))
+    return edited_template
 
 
 def family_expenses_tab():
@@ -12038,477 +11999,454 @@ def family_expenses_tab():
     # Show inflation adjustment info
     st.info(f"ℹ️ All expense templates are inflation-adjusted to **{EXPENSE_TEMPLATE_BASE_YEAR}** dollars")
 
-    # Create tabs for different views
+    # Create tabs for different views (stateful, so only the open one is built)
     expense_tab1, expense_tab2, expense_tab3 = st.tabs([
         "📊 Browse Templates",
         "✏️ Edit Templates",
         "🌍 Create Custom City"
-    ])
+    ], key="family_expense_tabs", on_change="rerun")
 
     # TAB 1: Browse Templates
-    with expense_tab1:
-        st.subheader("📊 Browse Expense Templates by Location")
+    if expense_tab1.open:
+        with expense_tab1:
+            st.subheader("📊 Browse Expense Templates by Location")
 
-        # Get all available locations (built-in + custom)
-        all_templates = {**FAMILY_EXPENSE_TEMPLATES, **st.session_state.custom_family_templates}
-        available_locations = sorted(all_templates.keys())
+            # Get all available locations (built-in + custom)
+            all_templates = {**FAMILY_EXPENSE_TEMPLATES, **st.session_state.custom_family_templates}
+            available_locations = sorted(all_templates.keys())
 
-        if not available_locations:
-            st.warning("No templates available. Please create a custom city in the 'Create Custom City' tab.")
-            return
+            if not available_locations:
+                st.warning("No templates available. Please create a custom city in the 'Create Custom City' tab.")
+                return
 
-        # Create display options with full location names
-        location_display_options = [get_location_display_name(loc) for loc in available_locations]
+            col1, col2 = st.columns(2)
 
-        col1, col2 = st.columns(2)
+            with col1:
+                # Options are the location keys, shown with their full display names
+                selected_location = st.selectbox(
+                    "Select Location/City:",
+                    options=available_locations,
+                    format_func=get_location_display_name,
+                    index=0,
+                    key="browse_location"
+                )
 
-        with col1:
-            selected_display = st.selectbox(
-                "Select Location/City:",
-                options=location_display_options,
-                index=0,
-                key="browse_location"
-            )
-            # Get the actual location key from the display name
-            selected_location = available_locations[location_display_options.index(selected_display)]
+            # Get available strategies for selected location
+            available_strategies = list(all_templates[selected_location].keys())
 
-        # Get available strategies for selected location
-        available_strategies = list(all_templates[selected_location].keys())
+            with col2:
+                selected_strategy = st.selectbox(
+                    "Select Spending Strategy:",
+                    options=available_strategies,
+                    index=0,
+                    key="browse_strategy"
+                )
 
-        with col2:
-            selected_strategy = st.selectbox(
-                "Select Spending Strategy:",
-                options=available_strategies,
-                index=0,
-                key="browse_strategy"
-            )
+            # Display template details
+            template = all_templates[selected_location][selected_strategy]
 
-        # Display template details
-        template = all_templates[selected_location][selected_strategy]
+            st.markdown("---")
+            st.subheader(f"📋 {get_location_display_name(selected_location)} - {selected_strategy} Strategy")
+
+            # Show template as visualization and table
+            col_chart, col_table = st.columns([1, 1])
+
+            with col_chart:
+                # Create pie chart
+                categories = list(template.keys())
+                amounts = list(template.values())
+
+                fig = go.Figure(data=[go.Pie(
+                    labels=categories,
+                    values=amounts,
+                    hole=0.4,
+                    textinfo='label+percent',
+                    marker=dict(colors=px.colors.qualitative.Set3)
+                )])
 
-        st.markdown("---")
-        st.subheader(f"📋 {get_location_display_name(selected_location)} - {selected_strategy} Strategy")
-
-        # Show template as visualization and table
-        col_chart, col_table = st.columns([1, 1])
-
-        with col_chart:
-            # Create pie chart
-            categories = list(template.keys())
-            amounts = list(template.values())
-
-            fig = go.Figure(data=[go.Pie(
-                labels=categories,
-                values=amounts,
-                hole=0.4,
-                textinfo='label+percent',
-                marker=dict(colors=px.colors.qualitative.Set3)
-            )])
-
-            fig.update_layout(
-                title=f"Expense Breakdown",
-                height=400,
-                showlegend=True
-            )
+                fig.update_layout(
+                    title=f"Expense Breakdown",
+                    height=400,
+                    showlegend=True
+                )
 
-            st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True)
 
-        with col_table:
-            # Create detailed table
-            template_df = pd.DataFrame({
-                'Category': categories,
-                'Annual Amount': [f"${amt:,.0f}" for amt in amounts],
-                'Monthly Amount': [f"${amt/12:,.0f}" for amt in amounts]
-            })
+            with col_table:
+                # Create detailed table
+                template_df = pd.DataFrame({
+                    'Category': categories,
+                    'Annual Amount': amounts,
+                    'Monthly Amount': [amt / 12 for amt in amounts]
+                })
 
-            st.dataframe(template_df, hide_index=True, use_container_width=True)
+                st.dataframe(template_df, hide_index=True, use_container_width=True,
+                             column_config={'Annual Amount': CURRENCY_COLUMN, 'Monthly Amount': CURRENCY_COLUMN})
 
-            total = sum(amounts)
-            st.metric("Total Annual Expenses", f"${total:,.0f}")
-            st.caption(f"Monthly: ${total/12:,.0f}")
+                total = sum(amounts)
+                st.metric("Total Annual Expenses", f"${total:,.0f}")
+                st.caption(f"Monthly: ${total/12:,.0f}")
 
-        # Display data sources
-        st.markdown("---")
-        data_source = get_expense_data_source(selected_location)
+            # Display data sources
+            st.markdown("---")
+            data_source = get_expense_data_source(selected_location)
 
-        st.markdown("### 📚 Data Sources")
-        st.markdown(f"**Source:** {data_source['source']}")
+            st.markdown("### 📚 Data Sources")
+            st.markdown(f"**Source:** {data_source['source']}")
 
-        # Display URLs as clickable links
-        urls = data_source['url'].split(', ')
-        if len(urls) == 1 and urls[0] != 'N/A':
-            st.markdown(f"**URL:** [{urls[0]}]({urls[0]})")
-        elif urls[0] != 'N/A':
-            st.markdown("**URLs:**")
-            for url in urls:
-                url = url.strip()
-                st.markdown(f"- [{url}]({url})")
+            # Display URLs as clickable links
+            urls = data_source['url'].split(', ')
+            if len(urls) == 1 and urls[0] != 'N/A':
+                st.markdown(f"**URL:** [{urls[0]}]({urls[0]})")
+            elif urls[0] != 'N/A':
+                st.markdown("**URLs:**")
+                for url in urls:
+                    url = url.strip()
+                    st.markdown(f"- [{url}]({url})")
 
-        st.markdown(f"**Data Year:** {data_source['year']}")
+            st.markdown(f"**Data Year:** {data_source['year']}")
 
-        if data_source['notes']:
-            with st.expander("📝 Additional Notes"):
-                st.markdown(data_source['notes'])
+            if data_source['notes']:
+                with st.expander("📝 Additional Notes"):
+                    st.markdown(data_source['notes'])
 
-        # Quick save button
-        st.markdown("---")
-        col_save1, col_save2 = st.columns([3, 1])
-
-        with col_save1:
-            st.markdown(f"**Save this template for future use?**")
-            st.caption("This will save the template to your custom templates.")
-
-        with col_save2:
-            if st.button("💾 Save Template", type="primary", key="save_template_btn"):
-                # Save to custom templates
-                if selected_location not in st.session_state.custom_family_templates:
-                    st.session_state.custom_family_templates[selected_location] = {}
-                st.session_state.custom_family_templates[selected_location][selected_strategy] = template.copy()
-                st.success(f"✅ Saved {selected_strategy} template for {get_location_display_name(selected_location)}!")
-                st.rerun()
+            # Quick save button
+            st.markdown("---")
+            col_save1, col_save2 = st.columns([3, 1])
+
+            with col_save1:
+                st.markdown(f"**Save this template for future use?**")
+                st.caption("This will save the template to your custom templates.")
+
+            with col_save2:
+                if st.button("💾 Save Template", type="primary", key="save_template_btn"):
+                    # Save to custom templates
+                    if selected_location not in st.session_state.custom_family_templates:
+                        st.session_state.custom_family_templates[selected_location] = {}
+                    st.session_state.custom_family_templates[selected_location][selected_strategy] = template.copy()
+                    st.success(f"✅ Saved {selected_strategy} template for {get_location_display_name(selected_location)}!")
+                    st.rerun()
 
     # TAB 2: Edit Templates
-    with expense_tab2:
-        st.subheader("✏️ Edit and Save Templates")
-
-        st.markdown("""
-        Modify expense templates and save them. You can:
-        - Edit existing built-in templates (saved as custom versions)
-        - Modify your custom templates
-        - Create variations of existing templates
-        """)
-
-        # Select template to edit
-        all_templates = {**FAMILY_EXPENSE_TEMPLATES, **st.session_state.custom_family_templates}
-        available_locations = sorted(all_templates.keys())
-        location_display_options = [get_location_display_name(loc) for loc in available_locations]
+    if expense_tab2.open:
+        with expense_tab2:
+            st.subheader("✏️ Edit and Save Templates")
+
+            st.markdown("""
+            Modify expense templates and save them. You can:
+            - Edit existing built-in templates (saved as custom versions)
+            - Modify your custom templates
+            - Create variations of existing templates
+            """)
+
+            # Select template to edit
+            all_templates = {**FAMILY_EXPENSE_TEMPLATES, **st.session_state.custom_family_templates}
+            available_locations = sorted(all_templates.keys())
 
-        col1, col2, col3 = st.columns(3)
+            col1, col2, col3 = st.columns(3)
 
-        with col1:
-            edit_display = st.selectbox(
-                "Location to Edit:",
-                options=location_display_options,
-                key="edit_location"
-            )
-            edit_location = available_locations[location_display_options.index(edit_display)]
+            with col1:
+                edit_location = st.selectbox(
+                    "Location to Edit:",
+                    options=available_locations,
+                    format_func=get_location_display_name,
+                    key="edit_location"
+                )
 
-        available_strategies = list(all_templates[edit_location].keys())
+            available_strategies = list(all_templates[edit_location].keys())
 
-        with col2:
-            edit_strategy = st.selectbox(
-                "Strategy to Edit:",
-                options=available_strategies,
-                key="edit_strategy"
-            )
+            with col2:
+                edit_strategy = st.selectbox(
+                    "Strategy to Edit:",
+                    options=available_strategies,
+                    key="edit_strategy"
+                )
 
-        with col3:
-            save_as_new = st.checkbox("Save as new strategy", value=False, key="save_as_new")
+            with col3:
+                save_as_new = st.checkbox("Save as new strategy", value=False, key="save_as_new")
 
-        # Load template for editing
-        current_template = all_templates[edit_location][edit_strategy].copy()
+            # Load template for editing
+            current_template = all_templates[edit_location][edit_strategy].copy()
 
-        st.markdown("---")
-        st.markdown(f"### Editing: {get_location_display_name(edit_location)} - {edit_strategy}")
+            st.markdown("---")
+            st.markdown(f"### Editing: {get_location_display_name(edit_location)} - {edit_strategy}")
 
-        # Edit each category
-        edited_template = {}
+            # Edit each category
+            edited_template = _template_amount_editor(current_template)
 
-        for category, value in current_template.items():
-            col_cat, col_val = st.columns([2, 1])
+            # Save options
+            st.markdown("---")
+            st.subheader("💾 Save Changes")
 
-            with col_cat:
-                st.markdown(f"**{category}**")
+            # Option to save as a completely new city/location
+            save_as_new_city = st.checkbox("Save as new city/location", value=False, key="save_as_new_city")
 
-            with col_val:
-                new_value = st.number_input(
-                    f"Amount for {category}",
-                    min_value=0.0,
-                    max_value=1000000.0,
-                    value=float(value),
-                    step=100.0,
-                    key=f"edit_{category}",
-                    label_visibility="collapsed"
+            if save_as_new_city:
+                new_city_location = st.text_input(
+                    "New City/Location Name:",
+                    value=f"{edit_location} (Copy)",
+                    key="new_city_location",
+                    help="Enter a new city/location name to save this template under"
                 )
-                edited_template[category] = new_value
-
-        # Show total
-        total_edited = sum(edited_template.values())
-        st.metric("Total Annual Expenses", f"${total_edited:,.0f}")
-
-        # Save options
-        st.markdown("---")
-        st.subheader("💾 Save Changes")
-
-        # Option to save as a completely new city/location
-        save_as_new_city = st.checkbox("Save as new city/location", value=False, key="save_as_new_city")
-
-        if save_as_new_city:
-            new_city_location = st.text_input(
-                "New City/Location Name:",
-                value=f"{edit_location} (Copy)",
-                key="new_city_location",
-                help="Enter a new city/location name to save this template under"
-            )
-            # Get base name without suffix for input
-            base_strategy = get_strategy_base_name(edit_strategy)
-            new_strategy_base = st.text_input(
-                "Strategy Name:",
-                value=base_strategy,
-                key="new_strategy_name_city",
-                help="Custom strategy name (without suffix). Will be saved with '(custom)' suffix."
-            )
-            new_strategy_name = f"{new_strategy_base} (custom)"
-            save_location = new_city_location
-        elif save_as_new:
-            # Get base name without suffix for input
-            base_strategy = get_strategy_base_name(edit_strategy)
-            new_strategy_base = st.text_input(
-                "New Strategy Name:",
-                value=base_strategy,
-                key="new_strategy_name",
-                help="Custom strategy name (without suffix). Will be saved with '(custom)' suffix."
-            )
-            new_strategy_name = f"{new_strategy_base} (custom)"
-            save_location = edit_location
-        else:
-            # Check if trying to overwrite a statistical strategy
-            if is_statistical_strategy(edit_strategy):
-                st.error("❌ Cannot overwrite statistical (built-in) strategies. Please check 'Save as new strategy' to create a custom version.")
-                new_strategy_name = None
-                save_location = None
-            elif is_custom_strategy(edit_strategy):
-                # Can overwrite custom strategies
-                new_strategy_name = edit_strategy
+                # Get base name without suffix for input
+                base_strategy = get_strategy_base_name(edit_strategy)
+                new_strategy_base = st.text_input(
+                    "Strategy Name:",
+                    value=base_strategy,
+                    key="new_strategy_name_city",
+                    help="Custom strategy name (without suffix). Will be saved with '(custom)' suffix."
+                )
+                new_strategy_name = f"{new_strategy_base} (custom)"
+                save_location = new_city_location
+            elif save_as_new:
+                # Get base name without suffix for input
+                base_strategy = get_strategy_base_name(edit_strategy)
+                new_strategy_base = st.text_input(
+                    "New Strategy Name:",
+                    value=base_strategy,
+                    key="new_strategy_name",
+                    help="Custom strategy name (without suffix). Will be saved with '(custom)' suffix."
+                )
+                new_strategy_name = f"{new_strategy_base} (custom)"
                 save_location = edit_location
             else:
-                # Legacy strategy name - save as custom
-                new_strategy_name = f"{edit_strategy} (custom)"
-                save_location = edit_location
-
-        col_save1, col_save2, col_save3 = st.columns([2, 1, 1])
-
-        with col_save1:
-            if save_as_new_city:
-                st.info(f"Will save as new city: **{new_city_location} - {new_strategy_name}**")
-            elif save_as_new:
-                st.info(f"Will save as: **{get_location_display_name(edit_location)} - {new_strategy_name}**")
-            elif new_strategy_name:
-                if is_custom_strategy(edit_strategy):
-                    st.warning(f"⚠️ Will overwrite: **{get_location_display_name(edit_location)} - {edit_strategy}**")
+                # Check if trying to overwrite a statistical strategy
+                if is_statistical_strategy(edit_strategy):
+                    st.error("❌ Cannot overwrite statistical (built-in) strategies. Please check 'Save as new strategy' to create a custom version.")
+                    new_strategy_name = None
+                    save_location = None
+                elif is_custom_strategy(edit_strategy):
+                    # Can overwrite custom strategies
+                    new_strategy_name = edit_strategy
+                    save_location = edit_location
                 else:
-                    st.warning(f"⚠️ Will save as custom template: **{get_location_display_name(edit_location)} - {new_strategy_name}**")
-
-        with col_save2:
-            if new_strategy_name and st.button("💾 Save Template", type="primary", key="save_edited_template"):
-                # Initialize location if needed
-                if save_location not in st.session_state.custom_family_templates:
-                    st.session_state.custom_family_templates[save_location] = {}
-
-                # Save the template
-                st.session_state.custom_family_templates[save_location][new_strategy_name] = edited_template.copy()
-
-                st.success(f"✅ Saved template: {save_location} - {new_strategy_name}")
-                st.rerun()
+                    # Legacy strategy name - save as custom
+                    new_strategy_name = f"{edit_strategy} (custom)"
+                    save_location = edit_location
+
+            col_save1, col_save2, col_save3 = st.columns([2, 1, 1])
+
+            with col_save1:
+                if save_as_new_city:
+                    st.info(f"Will save as new city: **{new_city_location} - {new_strategy_name}**")
+                elif save_as_new:
+                    st.info(f"Will save as: **{get_location_display_name(edit_location)} - {new_strategy_name}**")
+                elif new_strategy_name:
+                    if is_custom_strategy(edit_strategy):
+                        st.warning(f"⚠️ Will overwrite: **{get_location_display_name(edit_location)} - {edit_strategy}**")
+                    else:
+                        st.warning(f"⚠️ Will save as custom template: **{get_location_display_name(edit_location)} - {new_strategy_name}**")
 
-        with col_save3:
-            # Delete button for custom strategies only
-            if is_custom_strategy(edit_strategy):
-                if st.button("🗑️ Delete", type="secondary", key="delete_strategy_btn"):
-                    st.session_state['confirm_delete_strategy'] = {
-                        'location': edit_location,
-                        'strategy': edit_strategy
-                    }
-                    st.rerun()
+            with col_save2:
+                if new_strategy_name and st.button("💾 Save Template", type="primary", key="save_edited_template"):
+                    # Initialize location if needed
+                    if save_location not in st.session_state.custom_family_templates:
+                        st.session_state.custom_family_templates[save_location] = {}
 
-        # Confirmation dialog for deletion
-        if 'confirm_delete_strategy' in st.session_state:
-            st.markdown("---")
-            st.warning(f"⚠️ **Confirm Deletion**")
-            st.write(f"Are you sure you want to delete the strategy **'{st.session_state.confirm_delete_strategy['strategy']}'** for **{st.session_state.confirm_delete_strategy['location']}**?")
-            st.write("This action cannot be undone.")
-
-            col_confirm1, col_confirm2, col_confirm3 = st.columns([1, 1, 2])
-            with col_confirm1:
-                if st.button("✅ Yes, Delete", type="primary", key="confirm_delete_yes"):
-                    loc = st.session_state.confirm_delete_strategy['location']
-                    strat = st.session_state.confirm_delete_strategy['strategy']
-
-                    if loc in st.session_state.custom_family_templates:
-                        if strat in st.session_state.custom_family_templates[loc]:
-                            del st.session_state.custom_family_templates[loc][strat]
-                            st.success(f"✅ Deleted strategy: {strat}")
-
-                            # Clean up empty locations
-                            if not st.session_state.custom_family_templates[loc]:
-                                del st.session_state.custom_family_templates[loc]
-
-                    del st.session_state['confirm_delete_strategy']
-                    st.rerun()
+                    # Save the template
+                    st.session_state.custom_family_templates[save_location][new_strategy_name] = edited_template.copy()
 
-            with col_confirm2:
-                if st.button("❌ Cancel", key="confirm_delete_no"):
-                    del st.session_state['confirm_delete_strategy']
+                    st.success(f"✅ Saved template: {save_location} - {new_strategy_name}")
                     st.rerun()
 
-    # TAB 3: Create Custom City
-    with expense_tab3:
-        st.subheader("🌍 Create Custom City/Location Template")
-
-        st.markdown("""
-        Create a brand new location template from scratch or copy an existing one as a starting point.
-        """)
+            with col_save3:
+                # Delete button for custom strategies only
+                if is_custom_strategy(edit_strategy):
+                    if st.button("🗑️ Delete", type="secondary", key="delete_strategy_btn"):
+                        st.session_state['confirm_delete_strategy'] = {
+                            'location': edit_location,
+                            'strategy': edit_strategy
+                        }
+                        st.rerun()
 
-        # Option to copy from existing or start fresh
-        creation_mode = st.radio(
-            "Creation Mode:",
-            options=["Start from scratch", "Copy from existing template"],
-            horizontal=True,
-            key="creation_mode"
-        )
+            # Confirmation dialog for deletion
+            if 'confirm_delete_strategy' in st.session_state:
+                st.markdown("---")
+                st.warning(f"⚠️ **Confirm Deletion**")
+                st.write(f"Are you sure you want to delete the strategy **'{st.session_state.confirm_delete_strategy['strategy']}'** for **{st.session_state.confirm_delete_strategy['location']}**?")
+                st.write("This action cannot be undone.")
+
+                col_confirm1, col_confirm2, col_confirm3 = st.columns([1, 1, 2])
+                with col_confirm1:
+                    if st.button("✅ Yes, Delete", type="primary", key="confirm_delete_yes"):
+                        loc = st.session_state.confirm_delete_strategy['location']
+                        strat = st.session_state.confirm_delete_strategy['strategy']
+
+                        if loc in st.session_state.custom_family_templates:
+                            if strat in st.session_state.custom_family_templates[loc]:
+                                del st.session_state.custom_family_templates[loc][strat]
+                                st.success(f"✅ Deleted strategy: {strat}")
+
+                                # Clean up empty locations
+                                if not st.session_state.custom_family_templates[loc]:
+                                    del st.session_state.custom_family_templates[loc]
+
+                        del st.session_state['confirm_delete_strategy']
+                        st.rerun()
 
-        # New city name
-        new_city_name = st.text_input(
-            "New City/Location Name:",
-            value="",
-            placeholder="e.g., Miami, FL, USA or London, UK",
-            key="new_city_name",
-            help="Include city, state (for USA), and country for clarity"
-        )
+                with col_confirm2:
+                    if st.button("❌ Cancel", key="confirm_delete_no"):
+                        del st.session_state['confirm_delete_strategy']
+                        st.rerun()
 
-        new_strategy_name_city = st.text_input(
-            "Strategy Name:",
-            value="Average",
-            key="new_strategy_name_city"
-        )
+    # TAB 3: Create Custom City
+    if expense_tab3.open:
+        with expense_tab3:
+            st.subheader("🌍 Create Custom City/Location Template")
+
+            st.markdown("""
+            Create a brand new location template from scratch or copy an existing one as a starting point.
+            """)
+
+            # Option to copy from existing or start fresh
+            creation_mode = st.radio(
+                "Creation Mode:",
+                options=["Start from scratch", "Copy from existing template"],
+                horizontal=True,
+                key="creation_mode"
+            )
 
-        # Geographic coordinates for world map
-        st.markdown("---")
-        st.markdown("**🗺️ Geographic Coordinates (Optional)**")
-        st.markdown("Provide coordinates to display this city on the Timeline World Map visualization.")
-
-        coord_col1, coord_col2 = st.columns(2)
-        with coord_col1:
-            new_city_lat = st.number_input(
-                "Latitude",
-                min_value=-90.0,
-                max_value=90.0,
-                value=0.0,
-                step=0.1,
-                key="new_city_lat",
-                help="Latitude: -90 (South Pole) to +90 (North Pole). Use a mapping service to find coordinates."
+            # New city name
+            new_city_name = st.text_input(
+                "New City/Location Name:",
+                value="",
+                placeholder="e.g., Miami, FL, USA or London, UK",
+                key="new_city_name",
+                help="Include city, state (for USA), and country for clarity"
             )
-        with coord_col2:
-            new_city_lon = st.number_input(
-                "Longitude",
-                min_value=-180.0,
-                max_value=180.0,
-                value=0.0,
-                step=0.1,
-                key="new_city_lon",
-                help="Longitude: -180 to +180. Negative = West, Positive = East"
+
+            new_strategy_name_city = st.text_input(
+                "Strategy Name:",
+                value="Average",
+                key="new_strategy_name_city"
             )
 
-        # Show link to help find coordinates
-        st.info("💡 Tip: Use [Google Maps](https://www.google.com/maps) or [LatLong.net](https://www.latlong.net/) to find coordinates for your city.")
+            # Geographic coordinates for world map
+            st.markdown("---")
+            st.markdown("**🗺️ Geographic Coordinates (Optional)**")
+            st.markdown("Provide coordinates to display this city on the Timeline World Map visualization.")
+
+            coord_col1, coord_col2 = st.columns(2)
+            with coord_col1:
+                new_city_lat = st.number_input(
+                    "Latitude",
+                    min_value=-90.0,
+                    max_value=90.0,
+                    value=0.0,
+                    step=0.1,
+                    key="new_city_lat",
+                    help="Latitude: -90 (South Pole) to +90 (North Pole). Use a mapping service to find coordinates."
+                )
+            with coord_col2:
+                new_city_lon = st.number_input(
+                    "Longitude",
+                    min_value=-180.0,
+                    max_value=180.0,
+                    value=0.0,
+                    step=0.1,
+                    key="new_city_lon",
+                    help="Longitude: -180 to +180. Negative = West, Positive = East"
+                )
 
-        if creation_mode == "Copy from existing template":
-            # Select template to copy
-            all_templates = {**FAMILY_EXPENSE_TEMPLATES, **st.session_state.custom_family_templates}
-            available_locations = sorted(all_templates.keys())
-            location_display_options = [get_location_display_name(loc) for loc in available_locations]
+            # Show link to help find coordinates
+            st.info("💡 Tip: Use [Google Maps](https://www.google.com/maps) or [LatLong.net](https://www.latlong.net/) to find coordinates for your city.")
 
-            col1, col2 = st.columns(2)
+            if creation_mode == "Copy from existing template":
+                # Select template to copy
+                all_templates = {**FAMILY_EXPENSE_TEMPLATES, **st.session_state.custom_family_templates}
+                available_locations = sorted(all_templates.keys())
 
-            with col1:
-                copy_display = st.selectbox(
-                    "Copy from Location:",
-                    options=location_display_options,
-                    key="copy_location"
-                )
-                copy_location = available_locations[location_display_options.index(copy_display)]
+                col1, col2 = st.columns(2)
 
-            available_strategies = list(all_templates[copy_location].keys())
+                with col1:
+                    copy_location = st.selectbox(
+                        "Copy from Location:",
+                        options=available_locations,
+                        format_func=get_location_display_name,
+                        key="copy_location"
+                    )
 
-            with col2:
-                copy_strategy = st.selectbox(
-                    "Copy from Strategy:",
-                    options=available_strategies,
-                    key="copy_strategy"
-                )
+                available_strategies = list(all_templates[copy_location].keys())
 
-            # Load template to use as base
-            base_template = all_templates[copy_location][copy_strategy].copy()
-        else:
-            # Start with default categories and zero values
-            base_template = {
-                'Food & Groceries': 0.0,
-                'Clothing': 0.0,
-                'Transportation': 0.0,
-                'Entertainment & Activities': 0.0,
-                'Personal Care': 0.0,
-                'Other Expenses': 0.0
-            }
+                with col2:
+                    copy_strategy = st.selectbox(
+                        "Copy from Strategy:",
+                        options=available_strategies,
+                        key="copy_strategy"
+                    )
 
-        st.markdown("---")
-        st.subheader(f"💵 Set Expense Values for {new_city_name if new_city_name else '(enter city name above)'}")
+                # Load template to use as base
+                base_template = all_templates[copy_location][copy_strategy].copy()
+            else:
+                # Start with default categories and zero values
+                base_template = {
+                    'Food & Groceries': 0.0,
+                    'Clothing': 0.0,
+                    'Transportation': 0.0,
+                    'Entertainment & Activities': 0.0,
+                    'Personal Care': 0.0,
+                    'Other Expenses': 0.0
+                }
 
-        # Edit template values
-        new_template = {}
+            st.markdown("---")
+            st.subheader(f"💵 Set Expense Values for {new_city_name if new_city_name else '(enter city name above)'}")
 
-        for category, value in base_template.items():
-            col_cat, col_val = st.columns([2, 1])
+            # Edit template values
+            new_template = {}
 
-            with col_cat:
-                st.markdown(f"**{category}**")
+            for category, value in base_template.items():
+                col_cat, col_val = st.columns([2, 1])
 
-            with col_val:
-                new_value = st.number_input(
-                    f"Amount for {category}",
-                    min_value=0.0,
-                    max_value=1000000.0,
-                    value=float(value),
-                    step=100.0,
-                    key=f"new_{category}",
-                    label_visibility="collapsed"
-                )
-                new_template[category] = new_value
+                with col_cat:
+                    st.markdown(f"**{category}**")
 
-        # Show total
-        total_new = sum(new_template.values())
-        st.metric("Total Annual Expenses", f"${total_new:,.0f}")
+                with col_val:
+                    new_value = st.number_input(
+                        f"Amount for {category}",
+                        min_value=0.0,
+                        max_value=1000000.0,
+                        value=float(value),
+                        step=100.0,
+                        key=f"new_{category}",
+                        label_visibility="collapsed"
+                    )
+                    new_template[category] = new_value
 
-        # Create button
-        st.markdown("---")
-        col_create1, col_create2 = st.columns([3, 1])
+            # Show total
+            total_new = sum(new_template.values())
+            st.metric("Total Annual Expenses", f"${total_new:,.0f}")
 
-        with col_create1:
-            if new_city_name:
-                st.info(f"Will create: **{new_city_name} - {new_strategy_name_city}**")
-            else:
-                st.warning("⚠️ Please enter a city name above")
-
-        with col_create2:
-            if st.button("🌍 Create City", type="primary", key="create_city_btn", disabled=not new_city_name):
-                # Initialize location
-                if new_city_name not in st.session_state.custom_family_templates:
-                    st.session_state.custom_family_templates[new_city_name] = {}
-
-                # Save the template
-                st.session_state.custom_family_templates[new_city_name][new_strategy_name_city] = new_template.copy()
-
-                # Save coordinates if provided (not at default 0,0)
-                if new_city_lat != 0.0 or new_city_lon != 0.0:
-                    st.session_state.custom_location_coordinates[new_city_name] = {
-                        'lat': new_city_lat,
-                        'lon': new_city_lon
-                    }
+            # Create button
+            st.markdown("---")
+            col_create1, col_create2 = st.columns([3, 1])
 
-                st.success(f"✅ Created new city: {new_city_name} - {new_strategy_name_city}!")
-                if new_city_lat != 0.0 or new_city_lon != 0.0:
-                    st.info(f"📍 Coordinates saved: {new_city_lat}°, {new_city_lon}° - City will appear on world map!")
-                st.balloons()
-                st.rerun()
+            with col_create1:
+                if new_city_name:
+                    st.info(f"Will create: **{new_city_name} - {new_strategy_name_city}**")
+                else:
+                    st.warning("⚠️ Please enter a city name above")
+
+            with col_create2:
+                if st.button("🌍 Create City", type="primary", key="create_city_btn", disabled=not new_city_name):
+                    # Initialize location
+                    if new_city_name not in st.session_state.custom_family_templates:
+                        st.session_state.custom_family_templates[new_city_name] = {}
+
+                    # Save the template
+                    st.session_state.custom_family_templates[new_city_name][new_strategy_name_city] = new_template.copy()
+
+                    # Save coordinates if provided (not at default 0,0)
+                    if new_city_lat != 0.0 or new_city_lon != 0.0:
+                        st.session_state.custom_location_coordinates[new_city_name] = {
+                            'lat': new_city_lat,
+                            'lon': new_city_lon
+                        }
+
+                    st.success(f"✅ Created new city: {new_city_name} - {new_strategy_name_city}!")
+                    if new_city_lat != 0.0 or new_city_lon != 0.0:
+                        st.info(f"📍 Coordinates saved: {new_city_lat}°, {new_city_lon}° - City will appear on world map!")
+                    st.balloons()
+                    st.rerun()
 
     # Show current expenses section at bottom (always visible)
     st.markdown("---")
@@ -12571,58 +12509,65 @@ def recurring_one_time_expenses_tab():
     These expenses are included in all financial simulations and projections.
     """)
 
-    if st.button("➕ Add Major Purchase"):
-        new_purchase = MajorPurchase(
-            name="New Purchase",
-            year=st.session_state.current_year,
-            amount=50000.0,
-            financing_years=0,
-            interest_rate=0.0,
-            asset_type="Expense",
-            appreciation_rate=0.0
-        )
-        st.session_state.major_purchases.append(new_purchase)
-        st.rerun()
-
-    for idx, purchase in enumerate(st.session_state.major_purchases):
-        with st.expander(f"🛍️ {purchase.name} - {format_currency(purchase.amount)} ({purchase.year})"):
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                purchase.name = st.text_input("Name", value=purchase.name, key=f"mp_name_{idx}")
-                purchase.year = st.number_input("Year", min_value=2020, max_value=2100, value=purchase.year, key=f"mp_year_{idx}")
-                purchase.amount = st.number_input("Amount ($)", min_value=0.0, value=float(purchase.amount), step=1000.0, key=f"mp_amount_{idx}")
-
-            with col2:
-                purchase.asset_type = st.selectbox(
-                    "Asset Type",
-                    ["Expense", "Real Estate", "Vehicle", "Investment"],
-                    index=["Expense", "Real Estate", "Vehicle", "Investment"].index(purchase.asset_type) if purchase.asset_type in ["Expense", "Real Estate", "Vehicle", "Investment"] else 0,
-                    key=f"mp_asset_type_{idx}"
-                )
-                purchase.appreciation_rate = st.number_input(
-                    "Appreciation Rate (% per year)",
-                    min_value=-20.0,
-                    max_value=50.0,
-                    value=float(purchase.appreciation_rate * 100),
-                    step=0.5,
-                    key=f"mp_appreciation_{idx}"
-                ) / 100.0
-
-            with col3:
-                purchase.financing_years = st.number_input("Financing Years", min_value=0, max_value=30, value=purchase.financing_years, key=f"mp_financing_{idx}")
-                purchase.interest_rate = st.number_input(
-                    "Interest Rate (%)",
-                    min_value=0.0,
-                    max_value=20.0,
-                    value=float(purchase.interest_rate * 100),
-                    step=0.1,
-                    key=f"mp_interest_{idx}"
-                ) / 100.0
+    # One-time major purchases, edited as one table (add/delete rows in the grid)
+    asset_types = ["Expense", "Real Estate", "Vehicle", "Investment"]
+    purchase_columns = ['Name', 'Year', 'Amount', 'Asset Type', 'Appreciation (%)', 'Financing Years', 'Interest Rate (%)']
+
+    def purchase_rows_of(purchases):
+        return [(p.name, p.year, p.amount, p.asset_type if p.asset_type in asset_types else "Expense",
+                 p.appreciation_rate * 100, p.financing_years, p.interest_rate * 100)
+                for p in purchases]
+
+    current_purchases = purchase_rows_of(st.session_state.major_purchases)
+    # The grid keeps its own edits keyed to the data it was given, so it is fed the same DataFrame on
+    # every rerun and only rebuilt when the purchases change outside it (e.g. a plan is loaded)
+    synced_purchases, purchases_source = st.session_state.get('_major_purchases_source', (None, None))
+    if synced_purchases != current_purchases:
+        purchases_source = pd.DataFrame(current_purchases, columns=purchase_columns)
+        st.session_state._major_purchases_source = (current_purchases, purchases_source)
+
+    st.subheader("🛍️ Major Purchases")
+    edited_purchases = st.data_editor(
+        purchases_source,
+        num_rows="dynamic",
+        column_config={
+            "Name": st.column_config.TextColumn(width="medium", default="New Purchase", required=True),
+            "Year": st.column_config.NumberColumn(width="small", min_value=2020, max_value=2100, step=1, format="%d",
+                                                  default=st.session_state.current_year, required=True),
+            "Amount": st.column_config.NumberColumn("Amount ($)", width="small", min_value=0.0, step=1000.0,
+                                                    format="dollar", default=50000.0, required=True),
+            "Asset Type": st.column_config.SelectboxColumn(width="small", options=asset_types, default="Expense",
+                                                           required=True),
+            "Appreciation (%)": st.column_config.NumberColumn(width="small", min_value=-20.0, max_value=50.0, step=0.5,
+                                                              default=0.0, required=True,
+                                                              help="Appreciation rate (% per year)"),
+            "Financing Years": st.column_config.NumberColumn(width="small", min_value=0, max_value=30, step=1,
+                                                             default=0, required=True),
+            "Interest Rate (%)": st.column_config.NumberColumn(width="small", min_value=0.0, max_value=20.0, step=0.1,
+                                                               default=0.0, required=True),
+        },
+        hide_index=True,
+        use_container_width=True,
+        key="major_purchases_editor"
+    )
 
-            if st.button(f"🗑️ Delete {purchase.name}", key=f"delete_mp_{idx}"):
-                st.session_state.major_purchases.pop(idx)
-                st.rerun()
+    # Update purchases, keeping the existing objects when nothing was edited
+    purchase_rows = list(zip(*(edited_purchases[column].tolist() for column in purchase_columns)))
+    if purchase_rows != current_purchases:
+        st.session_state.major_purchases = [
+            MajorPurchase(
+                name=name,
+                year=int(year),
+                amount=float(amount),
+                financing_years=int(financing_years),
+                interest_rate=interest_pct / 100.0,
+                asset_type=asset_type,
+                appreciation_rate=appreciation_pct / 100.0
+            )
+            for name, year, amount, asset_type, appreciation_pct, financing_years, interest_pct in purchase_rows
+        ]
+        st.session_state._major_purchases_source = (purchase_rows_of(st.session_state.major_purchases),
+                                                    purchases_source)
 
     # Recurring Expenses
     st.markdown("---")
@@ -12630,63 +12575,110 @@ def recurring_one_time_expenses_tab():
 
     st.markdown("""
     Add expenses that repeat every N years (e.g., buying a new car every 7 years,
-    home renovations every 15 years).
+    home renovations every 15 years). Leave End Year empty for no end.
     """)
 
-    if st.button("➕ Add Recurring Expense"):
-        new_recurring = RecurringExpense(
-            name="New Recurring",
-            category="Other",
-            amount=10000.0,
-            frequency_years=5,
-            start_year=st.session_state.current_year,
-            end_year=None,
-            inflation_adjust=True,
-            parent="Both",
-            financing_years=0,
-            interest_rate=0.0
-        )
-        st.session_state.recurring_expenses.append(new_recurring)
-        st.rerun()
-
-    for idx, recurring in enumerate(st.session_state.recurring_expenses):
-        with st.expander(f"🔁 {recurring.name} - Every {recurring.frequency_years} years"):
-            col1, col2, col3 = st.columns(3)
+    owner_options = ["Both", st.session_state.parent1_name, st.session_state.parent2_name]
+    # Map old owner values to the current parent names for backwards compatibility
+    legacy_owners = {"ParentX": st.session_state.parent1_name, "ParentY": st.session_state.parent2_name}
+    recurring_columns = ['Name', 'Category', 'Amount', 'Frequency (years)', 'Start Year', 'End Year',
+                         'Inflation Adjust', 'Owner', 'Financing Years', 'Interest Rate (%)']
 
-            with col1:
-                recurring.name = st.text_input("Name", value=recurring.name, key=f"re_name_{idx}")
-                recurring.category = st.text_input("Category", value=recurring.category, key=f"re_category_{idx}")
-                recurring.amount = st.number_input("Amount ($)", min_value=0.0, value=float(recurring.amount), step=1000.0, key=f"re_amount_{idx}")
-
-            with col2:
-                recurring.frequency_years = st.number_input("Frequency (years)", min_value=1, max_value=50, value=recurring.frequency_years, key=f"re_freq_{idx}")
-                recurring.start_year = st.number_input("Start Year", min_value=2020, max_value=2100, value=recurring.start_year, key=f"re_start_{idx}")
-                end_year_value = recurring.end_year if recurring.end_year is not None else 2100
-                end_year = st.number_input("End Year (or max for no end)", min_value=recurring.start_year, max_value=2100, value=end_year_value, key=f"re_end_{idx}")
-                recurring.end_year = end_year if end_year < 2100 else None
-
-            with col3:
-                recurring.inflation_adjust = st.checkbox("Inflation Adjust", value=recurring.inflation_adjust, key=f"re_inflate_{idx}")
-                owner_options = ["Both", st.session_state.parent1_name, st.session_state.parent2_name]
-                # Map old values to new values for backwards compatibility
-                if recurring.parent == "ParentX":
-                    recurring.parent = st.session_state.parent1_name
-                elif recurring.parent == "ParentY":
-                    recurring.parent = st.session_state.parent2_name
-                recurring.parent = st.selectbox("Owner", owner_options, index=owner_options.index(recurring.parent) if recurring.parent in owner_options else 0, key=f"re_parent_{idx}")
-                recurring.financing_years = st.number_input("Financing Years", min_value=0, max_value=30, value=recurring.financing_years, key=f"re_financing_{idx}")
-                recurring.interest_rate = st.number_input(
-                    "Interest Rate (%)",
-                    min_value=0.0,
-                    max_value=20.0,
-                    value=float(recurring.interest_rate * 100),
-                    step=0.1,
-                    key=f"re_interest_{idx}"
-                ) / 100.0
+    def recurring_rows_of(recurring_expenses):
+        rows = []
+        for recurring in recurring_expenses:
+            recurring.parent = legacy_owners.get(recurring.parent, recurring.parent)
+            rows.append((recurring.name, recurring.category, recurring.amount, recurring.frequency_years,
+                         recurring.start_year, recurring.end_year, recurring.inflation_adjust,
+                         recurring.parent if recurring.parent in owner_options else "Both",
+                         recurring.financing_years, recurring.interest_rate * 100))
+        return rows
+
+    current_recurring = recurring_rows_of(st.session_state.recurring_expenses)
+    synced_recurring, recurring_source = st.session_state.get('_recurring_expenses_source', (None, None))
+    if synced_recurring != current_recurring:
+        recurring_source = pd.DataFrame(current_recurring, columns=recurring_columns)
+        st.session_state._recurring_expenses_source = (current_recurring, recurring_source)
+
+    edited_recurring = st.data_editor(
+        recurring_source,
+        num_rows="dynamic",
+        column_config={
+            "Name": st.column_config.TextColumn(width="medium", default="New Recurring", required=True),
+            "Category": st.column_config.TextColumn(width="small", default="Other", required=True),
+            "Amount": st.column_config.NumberColumn("Amount ($)", width="small", min_value=0.0, step=1000.0,
+                                                    format="dollar", default=10000.0, required=True),
+            "Frequency (years)": st.column_config.NumberColumn(width="small", min_value=1, max_value=50, step=1,
+                                                               default=5, required=True),
+            "Start Year": st.column_config.NumberColumn(width="small", min_value=2020, max_value=2100, step=1,
+                                                        format="%d", default=st.session_state.current_year,
+                                                        required=True),
+            "End Year": st.column_config.NumberColumn(width="small", min_value=2020, max_value=2100, step=1, format="%d"),
+            "Inflation Adjust": st.column_config.CheckboxColumn(width="small", default=True),
+            "Owner": st.column_config.SelectboxColumn(width="small", options=owner_options, default="Both",
+                                                      required=True),
+            "Financing Years": st.column_config.NumberColumn(width="small", min_value=0, max_value=30, step=1,
+                                                             default=0, required=True),
+            "Interest Rate (%)": st.column_config.NumberColumn(width="small", min_value=0.0, max_value=20.0, step=0.1,
+                                                               default=0.0, required=True),
+        },
+        hide_index=True,
+        use_container_width=True,
+        key="recurring_expenses_editor"
+    )
 
-            if st.button(f"🗑️ Delete {recurring.name}", key=f"delete_re_{idx}"):
-                st.session_state.recurring_expenses.pop(idx)
-                st.rerun()
+    # Update recurring expenses, keeping the existing objects when nothing was edited
+    recurring_rows = [tuple(None if column == 'End Year' and pd.isna(value) else value
+                            for column, value in zip(recurring_columns, row))
+                      for row in zip(*(edited_recurring[column].tolist() for column in recurring_columns))]
+    if recurring_rows != current_recurring:
+        st.session_state.recurring_expenses = [
+            RecurringExpense(
+                name=name,
+                category=category,
+                amount=float(amount),
+                frequency_years=int(frequency_years),
+                start_year=int(start_year),
+                # An End Year before the Start Year is moved up to the Start Year
+                end_year=max(int(end_year), int(start_year)) if end_year is not None and end_year < 2100 else None,
+                inflation_adjust=bool(inflation_adjust),
+                parent=owner,
+                financing_years=int(financing_years),
+                interest_rate=interest_pct / 100.0
+            )
+            for (name, category, amount, frequency_years, start_year, end_year,
+                 inflation_adjust, owner, financing_years, interest_pct) in recurring_rows
+        ]
+        st.session_state._recurring_expenses_source = (recurring_rows_of(st.session_state.recurring_expenses),
+                                                       recurring_source)
+    early_end = [row[0] for row in recurring_rows if row[5] is not None and row[5] < row[4]]
+    if early_end:
+        st.warning(f"End Year is before Start Year for: {', '.join(map(str, early_end))}. "
+                   "Please set an End Year on or after the Start Year.")
+
+
+def _add_child():
+    """Add Child button callback; leaves its success/error message for the tab to show."""
+    child_name = st.session_state.new_child_name
+    child_birth_year = st.session_state.new_child_birth_year
+    # Check for duplicate names
+    if any(child['name'] == child_name for child in st.session_state.children_list):
+        result = (False, f"A child named '{child_name}' already exists. Please use a different name.")
+    elif child_name.strip() == "":
+        result = (False, "Please enter a child name.")
+    else:
+        st.session_state.children_list.append({
+            'name': child_name,
+            'birth_year': child_birth_year,
+            'use_template': True,
+            'template_state': 'Seattle',
+            'template_strategy': 'Average',
+            'school_type': 'Public',  # K-12: Public or Private
+            'college_type': 'Public',  # College: Public or Private
+            'college_location': 'Seattle'  # Where they attend college
+        })
+        result = (True, f"Added {child_name}")
+    st.session_state['_add_child_result'] = result
 
 
 def children_tab():
@@ -12700,9 +12692,9 @@ def children_tab():
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        child_name = st.text_input("Child Name", key="new_child_name")
+        st.text_input("Child Name", key="new_child_name")
     with col2:
-        child_birth_year = st.number_input(
+        st.number_input(
             "Birth Year",
             min_value=1990,
             max_value=st.session_state.current_year + 20,
@@ -12712,25 +12704,11 @@ def children_tab():
     with col3:
         st.write("")  # Spacing
         st.write("")  # Spacing
-        if st.button("➕ Add Child"):
-            # Check for duplicate names
-            if any(child['name'] == child_name for child in st.session_state.children_list):
-                st.error(f"A child named '{child_name}' already exists. Please use a different name.")
-            elif child_name.strip() == "":
-                st.error("Please enter a child name.")
-            else:
-                st.session_state.children_list.append({
-                    'name': child_name,
-                    'birth_year': child_birth_year,
-                    'use_template': True,
-                    'template_state': 'Seattle',
-                    'template_strategy': 'Average',
-                    'school_type': 'Public',  # K-12: Public or Private
-                    'college_type': 'Public',  # College: Public or Private
-                    'college_location': 'Seattle'  # Where they attend college
-                })
-                st.success(f"Added {child_name}")
-                st.rerun()
+        st.button("➕ Add Child", on_click=_add_child)
+        add_result = st.session_state.pop('_add_child_result', None)
+        if add_result:
+            ok, message = add_result
+            (st.success if ok else st.error)(message)
 
     # Display existing children
     if st.session_state.children_list:
@@ -12781,9 +12759,8 @@ def children_tab():
                 with col3:
                     st.write("")  # Spacing
                     st.write("")  # Spacing
-                    if st.button(f"🗑️ Remove {child['name']}", key=f"remove_child_{idx}"):
-                        st.session_state.children_list.pop(idx)
-                        st.rerun()
+                    st.button(f"🗑️ Remove {child['name']}", key=f"remove_child_{idx}",
+                              on_click=_remove_list_item, args=("children_list", idx))
 
                 # Add new row for school type and college location
                 st.markdown("---")
@@ -12848,6 +12825,11 @@ def children_tab():
     template = get_template_strategy_data(preview_state, preview_strategy, 'children')
 
     if template:
+        # (age x category) matrix copied out of the template, so the adjustments
+        # below never write into the shared template lists
+        categories = list(template.keys())
+        expense_matrix = np.array([template[category] for category in categories], dtype=float).T
+        education = categories.index('Education')
 
         # Adjust for private K-12 school (ages 5-17)
         if preview_school_type == "Private":
@@ -12866,30 +12848,28 @@ def children_tab():
             additional_tuition = private_school_costs.get(preview_state, 20000)
 
             # Apply to ages 5-17 (indices 5-17)
-            for age in range(5, 18):
-                if age < len(template['Education']):
-                    template['Education'][age] += additional_tuition
+            expense_matrix[5:18, education] += additional_tuition
 
         # Adjust education costs based on college type
         if preview_college_type == "Private":
             # Private colleges cost approximately 2.5x more than public colleges
-            template['Education'] = [cost * 2.5 for cost in template['Education']]
+            expense_matrix[:, education] *= 2.5
 
         # Create a preview dataframe
-        preview_df = pd.DataFrame({
-            'Age': list(range(31)),
-            **{category: values for category, values in template.items()}
-        })
+        preview_df = pd.DataFrame(expense_matrix, columns=categories)
+        preview_df.insert(0, 'Age', range(len(expense_matrix)))
 
-        st.dataframe(preview_df, use_container_width=True, height=400)
+        st.dataframe(preview_df, use_container_width=True, height=400,
+                     column_config={'Age': st.column_config.NumberColumn(width="small"),
+                                    **{category: CURRENCY_COLUMN for category in categories}})
 
         # Show totals by age
-        age_totals = preview_df.set_index('Age').sum(axis=1)
+        age_totals = expense_matrix.sum(axis=1)
 
         fig = go.Figure()
         fig.add_trace(go.Bar(
-            x=list(range(31)),
-            y=age_totals.values,
+            x=list(range(len(age_totals))),
+            y=age_totals,
             name="Total Annual Expenses"
         ))
         fig.update_layout(
@@ -12929,8 +12909,8 @@ def house_tab():
     st.header("🏠 House Portfolio")
     tab_walkthrough("house")
 
-    if st.button("➕ Add House"):
-        new_house = House(
+    def _new_house():
+        return House(
             name="New Property",
             purchase_year=st.session_state.current_year,
             purchase_price=500000.0,
@@ -12945,8 +12925,8 @@ def house_tab():
             owner="Shared",
             timeline=[HouseTimelineEntry(st.session_state.current_year, "Own_Live", 0.0)]
         )
-        st.session_state.houses.append(new_house)
-        st.rerun()
+
+    st.button("➕ Add House", on_click=_append_list_item, args=("houses", _new_house))
 
     for idx, house in enumerate(st.session_state.houses):
         monthly_payment = calculate_monthly_house_payment(house)
@@ -13035,25 +13015,29 @@ def house_tab():
                     'Rental Income': entry.rental_income
                 })
 
-            timeline_df = pd.DataFrame(timeline_data)
+            timeline_df = pd.DataFrame(timeline_data, columns=['Year', 'Status', 'Rental Income'])
             edited_timeline = st.data_editor(
                 timeline_df,
                 num_rows="dynamic",
                 column_config={
+                    "Year": st.column_config.NumberColumn(width="small", format="%d"),
                     "Status": st.column_config.SelectboxColumn(
                         "Status",
+                        width="small",
                         options=["Own_Live", "Own_Rent", "Sold"],
                         required=True
-                    )
+                    ),
+                    "Rental Income": st.column_config.NumberColumn(width="small")
                 },
                 key=f"house_timeline_{idx}"
             )
 
-            # Update timeline
-            house.timeline = [
-                HouseTimelineEntry(row['Year'], row['Status'], row['Rental Income'])
-                for _, row in edited_timeline.iterrows()
-            ]
+            # Update timeline, keeping the existing entries when nothing was edited
+            timeline_rows = list(zip(edited_timeline['Year'].tolist(),
+                                     edited_timeline['Status'].tolist(),
+                                     edited_timeline['Rental Income'].tolist()))
+            if timeline_rows != [(entry.year, entry.status, entry.rental_income) for entry in house.timeline]:
+                house.timeline = [HouseTimelineEntry(*row) for row in timeline_rows]
 
             # Payment breakdown
             st.subheader("Payment Breakdown")
@@ -13066,9 +13050,8 @@ def house_tab():
                 annual_property_tax = house.current_value * house.property_tax_rate
                 st.metric("Annual Property Tax", format_currency(annual_property_tax))
 
-            if st.button(f"🗑️ Delete {house.name}", key=f"delete_house_{idx}"):
-                st.session_state.houses.pop(idx)
-                st.rerun()
+            st.button(f"🗑️ Delete {house.name}", key=f"delete_house_{idx}",
+                      on_click=_remove_list_item, args=("houses", idx))
 
 
 def economy_tab():
@@ -13342,53 +13325,48 @@ def timeline_tab():
             'Spending Strategy': entry.spending_strategy
         })
 
-    timeline_df = pd.DataFrame(timeline_data)
+    timeline_df = pd.DataFrame(timeline_data, columns=['Year', 'State', 'Spending Strategy'])
 
     # Build comprehensive location list from LOCATION_HIERARCHY
     # Include: cities with templates, all US states, all Canadian provinces, international cities
-    available_locations = []
+    # A dict keeps first-seen order while making the membership checks O(1)
+    location_options = {}
     # US cities first (most common)
     us_data = LOCATION_HIERARCHY.get("United States", {})
     for state_name, state_data in sorted(us_data.get("states", {}).items()):
-        for city in state_data.get("cities", []):
-            available_locations.append(city)
+        location_options.update(dict.fromkeys(state_data.get("cities", [])))
     # All US states (for state-level expense data)
-    for state_name in sorted(us_data.get("states", {}).keys()):
-        if state_name not in available_locations:
-            available_locations.append(state_name)
+    location_options.update(dict.fromkeys(sorted(us_data.get("states", {}).keys())))
     # Canadian provinces and cities
     ca_data = LOCATION_HIERARCHY.get("Canada", {})
     for prov_name, prov_data in sorted(ca_data.get("states", {}).items()):
-        for city in prov_data.get("cities", []):
-            if city not in available_locations:
-                available_locations.append(city)
-        if prov_name not in available_locations:
-            available_locations.append(prov_name)
+        location_options.update(dict.fromkeys(prov_data.get("cities", [])))
+        location_options.setdefault(prov_name)
     # International cities
     for country, country_data in LOCATION_HIERARCHY.items():
         if country in ("United States", "Canada"):
             continue
-        for city in country_data.get("cities", []):
-            if city not in available_locations:
-                available_locations.append(city)
+        location_options.update(dict.fromkeys(country_data.get("cities", [])))
     # Custom user-created templates
     if hasattr(st.session_state, 'custom_family_templates') and st.session_state.custom_family_templates:
-        for city in st.session_state.custom_family_templates.keys():
-            if city not in available_locations:
-                available_locations.append(city)
+        location_options.update(dict.fromkeys(st.session_state.custom_family_templates.keys()))
+    available_locations = list(location_options)
 
     edited_timeline = st.data_editor(
         timeline_df,
         num_rows="dynamic",
         column_config={
+            "Year": st.column_config.NumberColumn(width="small", format="%d"),
             "State": st.column_config.SelectboxColumn(
                 "Location",
+                width="medium",
                 options=available_locations,
                 required=True,
                 help="Select your living location - expenses will adjust automatically"
             ),
             "Spending Strategy": st.column_config.SelectboxColumn(
                 "Spending Strategy",
+                width="medium",
                 options=STATISTICAL_STRATEGIES,
                 required=True
             )
@@ -13396,11 +13374,14 @@ def timeline_tab():
         use_container_width=True
     )
 
-    # Update state timeline
-    st.session_state.state_timeline = [
-        StateTimelineEntry(row['Year'], row['State'], row['Spending Strategy'])
-        for _, row in edited_timeline.iterrows()
-    ]
+    # Update state timeline, keeping the existing entries when nothing was edited
+    timeline_rows = list(zip(edited_timeline['Year'].tolist(),
+                             edited_timeline['State'].tolist(),
+                             edited_timeline['Spending Strategy'].tolist()))
+    current_rows = [(entry.year, entry.state, entry.spending_strategy)
+                    for entry in st.session_state.state_timeline]
+    if timeline_rows != current_rows:
+        st.session_state.state_timeline = [StateTimelineEntry(*row) for row in timeline_rows]
 
     # Visualization
     if len(edited_timeline) > 0:
@@ -13415,13 +13396,9 @@ def timeline_tab():
         all_years = list(range(st.session_state.current_year, end_year + 1))
 
         # Create a horizontal timeline showing state/spending for each year
-        timeline_states = []
-        timeline_spending = []
-
-        for year in all_years:
-            state, strategy = get_state_for_year(year)
-            timeline_states.append(state)
-            timeline_spending.append(strategy)
+        year_states = get_states_for_years(all_years)
+        timeline_states = [state for state, _ in year_states]
+        timeline_spending = [strategy for _, strategy in year_states]
 
         # Create a Gantt-style timeline
         fig = go.Figure()
@@ -13454,11 +13431,12 @@ def timeline_tab():
                 'end': all_years[-1]
             })
 
-        # Plot segments as horizontal bars
+        # Plot segments as horizontal bars, added in one batch rather than trace by trace
+        segment_bars = []
         for seg in segments:
             duration = seg['end'] - seg['start'] + 1
             location_full_name = get_location_display_name(seg['state'])
-            fig.add_trace(go.Bar(
+            segment_bars.append(go.Bar(
                 x=[duration],
                 y=['Timeline'],
                 orientation='h',
@@ -13468,6 +13446,7 @@ def timeline_tab():
                 hovertemplate=f"<b>{location_full_name}</b><br>{seg['strategy']}<br>Years: {seg['start']}-{seg['end']}<br>Duration: {duration} years<extra></extra>",
                 base=seg['start']
             ))
+        fig.add_traces(segment_bars)
 
         fig.update_layout(
             title=f"State & Spending Timeline (Until Both Parents Reach Age 100)",
@@ -13519,15 +13498,16 @@ def timeline_tab():
             # Create map figure
             map_fig = go.Figure()
 
-            # Add flight path lines between consecutive locations
-            for i in range(len(valid_locations) - 1):
-                loc1 = valid_locations[i]
-                loc2 = valid_locations[i + 1]
+            lats = [loc['coords']['lat'] for loc in valid_locations]
+            lons = [loc['coords']['lon'] for loc in valid_locations]
 
+            # Add flight path lines between consecutive locations. Consecutive legs share
+            # their endpoints, so the whole journey is one polyline (one trace)
+            if len(valid_locations) >= 2:
                 # Add curved line (great circle route simulation)
                 map_fig.add_trace(go.Scattergeo(
-                    lon=[loc1['coords']['lon'], loc2['coords']['lon']],
-                    lat=[loc1['coords']['lat'], loc2['coords']['lat']],
+                    lon=lons,
+                    lat=lats,
                     mode='lines',
                     line=dict(width=2, color='rgb(255, 100, 100)'),
                     opacity=0.6,
@@ -13536,8 +13516,6 @@ def timeline_tab():
                 ))
 
             # Add location markers
-            lats = [loc['coords']['lat'] for loc in valid_locations]
-            lons = [loc['coords']['lon'] for loc in valid_locations]
             texts = [f"{get_location_display_name(loc['state'])}<br>Year: {loc['year']}" for loc in valid_locations]
 
             map_fig.add_trace(go.Scattergeo(
@@ -13617,14 +13595,17 @@ def timeline_tab():
     # Show current and future states
     st.subheader("Timeline Summary")
 
-    current_state, current_strategy = get_state_for_year(st.session_state.current_year)
+    # Current year plus the next 5, resolved against the timeline in one pass
+    summary_states = get_states_for_years(range(st.session_state.current_year, st.session_state.current_year + 6))
+    current_state, current_strategy = summary_states[0]
     st.info(f"**Current ({st.session_state.current_year}):** {current_state} - {current_strategy}")
 
     # Show next 5 years
     st.markdown("**Upcoming Changes:**")
-    for year in range(st.session_state.current_year + 1, st.session_state.current_year + 6):
-        state, strategy = get_state_for_year(year)
-        prev_state, prev_strategy = get_state_for_year(year - 1)
+    for offset in range(1, 6):
+        year = st.session_state.current_year + offset
+        state, strategy = summary_states[offset]
+        prev_state, prev_strategy = summary_states[offset - 1]
 
         if state != prev_state or strategy != prev_strategy:
             st.success(f"**{year}:** → {state} - {strategy}")
@@ -13799,6 +13780,43 @@ def get_location_type(location):
     return 'unknown', None
 
 
+# 2024 federal brackets (IRS Rev. Proc. 2023-34) as (upper limit, rate) pairs
+FEDERAL_TAX_BRACKETS = {
+    'married': [
+        (23200, 0.10),      # 10% on first $23,200
+        (94300, 0.12),      # 12% on $23,201 to $94,300
+        (201050, 0.22),     # 22% on $94,301 to $201,050
+        (383900, 0.24),     # 24% on $201,051 to $383,900
+        (487450, 0.32),     # 32% on $383,901 to $487,450
+        (731200, 0.35),     # 35% on $487,451 to $731,200
+        (float('inf'), 0.37)  # 37% on $731,201+
+    ],
+    'single': [
+        (11600, 0.10),
+        (47150, 0.12),
+        (100525, 0.22),
+        (191950, 0.24),
+        (243725, 0.32),
+        (609350, 0.35),
+        (float('inf'), 0.37)
+    ],
+}
+
+# Same brackets as lookup tables: (bracket floors, rates, tax owed at each floor),
+# so tax = cumulative_tax[i] + (income - floors[i]) * rates[i] for the income's bracket i
+def _federal_tax_table(brackets):
+    floors = np.array([0.0] + [limit for limit, _ in brackets[:-1]])
+    rates = np.array([rate for _, rate in brackets])
+    cumulative_tax = np.concatenate(([0.0], np.cumsum(np.diff(floors) * rates[:-1])))
+    # Built once at import and shared by every calculation, so keep them read-only
+    for table in (floors, rates, cumulative_tax):
+        table.flags.writeable = False
+    return floors, rates, cumulative_tax
+
+
+FEDERAL_TAX_TABLES = {status: _federal_tax_table(brackets) for status, brackets in FEDERAL_TAX_BRACKETS.items()}
+
+
 def calculate_federal_income_tax(taxable_income, filing_status='married'):
     """
     Calculate federal income tax using 2024 tax brackets.
@@ -13810,41 +13828,24 @@ def calculate_federal_income_tax(taxable_income, filing_status='married'):
     Returns:
         float: Federal income tax amount
     """
-    if filing_status == 'married':
-        # 2024 Married Filing Jointly brackets (IRS Rev. Proc. 2023-34)
-        brackets = [
-            (23200, 0.10),      # 10% on first $23,200
-            (94300, 0.12),      # 12% on $23,201 to $94,300
-            (201050, 0.22),     # 22% on $94,301 to $201,050
-            (383900, 0.24),     # 24% on $201,051 to $383,900
-            (487450, 0.32),     # 32% on $383,901 to $487,450
-            (731200, 0.35),     # 35% on $487,451 to $731,200
-            (float('inf'), 0.37)  # 37% on $731,201+
-        ]
-    else:
-        # 2024 Single filer brackets (IRS Rev. Proc. 2023-34)
-        brackets = [
-            (11600, 0.10),
-            (47150, 0.12),
-            (100525, 0.22),
-            (191950, 0.24),
-            (243725, 0.32),
-            (609350, 0.35),
-            (float('inf'), 0.37)
-        ]
+    if taxable_income <= 0:
+        return 0
+    floors, rates, cumulative_tax = FEDERAL_TAX_TABLES['married' if filing_status == 'married' else 'single']
+    i = bisect_right(floors, taxable_income) - 1
+    return float(cumulative_tax[i] + (taxable_income - floors[i]) * rates[i])
 
-    tax = 0
-    previous_limit = 0
 
-    for limit, rate in brackets:
-        if taxable_income > previous_limit:
-            taxable_in_bracket = min(taxable_income, limit) - previous_limit
-            tax += taxable_in_bracket * rate
-            previous_limit = limit
-        else:
-            break
+def calculate_federal_income_tax_array(taxable_incomes, filing_status='married'):
+    """
+    Vectorized calculate_federal_income_tax for an array of taxable incomes.
 
-    return tax
+    Finds every income's bracket with one searchsorted call, so a whole
+    projection is taxed in one pass.
+    """
+    floors, rates, cumulative_tax = FEDERAL_TAX_TABLES['married' if filing_status == 'married' else 'single']
+    incomes = np.clip(np.asarray(taxable_incomes, dtype=float), 0.0, None)
+    i = np.searchsorted(floors, incomes, side='right') - 1
+    return cumulative_tax[i] + (incomes - floors[i]) * rates[i]
 
 def calculate_fica_tax(wage_income, filing_status='married'):
     """
@@ -13856,20 +13857,7 @@ def calculate_fica_tax(wage_income, filing_status='married'):
     Returns:
         float: Total FICA tax (employee portion)
     """
-    # Social Security: 6.2% up to wage base ($160,200 in 2024)
-    ss_wage_base = 168600  # 2024 SS wage base (IRS)
-    social_security_tax = min(wage_income, ss_wage_base) * 0.062
-
-    # Medicare: 1.45% on all wages, plus 0.9% Additional Medicare Tax on high earners
-    medicare_wage_threshold = 250000 if filing_status == 'married' else 200000
-
-    if wage_income <= medicare_wage_threshold:
-        medicare_tax = wage_income * 0.0145
-    else:
-        medicare_tax = (medicare_wage_threshold * 0.0145) + \
-                      ((wage_income - medicare_wage_threshold) * 0.0235)  # 1.45% + 0.9%
-
-    return social_security_tax + medicare_tax
+    return float(calculate_fica_tax_array([wage_income], filing_status)[0])
 
 def calculate_ss_taxable_amount(ss_income, other_income):
     """
@@ -13883,25 +13871,7 @@ def calculate_ss_taxable_amount(ss_income, other_income):
     Returns:
         float: Taxable portion of Social Security benefits
     """
-    # Provisional income = AGI + 50% of SS benefits + tax-exempt interest
-    provisional_income = other_income + (ss_income * 0.5)
-
-    # Married filing jointly thresholds
-    threshold_1 = 32000
-    threshold_2 = 44000
-
-    if provisional_income <= threshold_1:
-        # No SS benefits taxed
-        return 0
-    elif provisional_income <= threshold_2:
-        # Up to 50% of benefits may be taxed
-        excess = provisional_income - threshold_1
-        return min(excess, ss_income * 0.5)
-    else:
-        # Up to 85% of benefits may be taxed
-        excess_1 = threshold_2 - threshold_1
-        excess_2 = provisional_income - threshold_2
-        return min(excess_1 + (excess_2 * 0.85), ss_income * 0.85)
+    return float(calculate_ss_taxable_amount_array([ss_income], [other_income])[0])
 
 def calculate_total_taxes(parent1_income, parent2_income, ss_income, location=None, state_tax_rate=None, filing_status='married'):
     """
@@ -13916,111 +13886,216 @@ def calculate_total_taxes(parent1_income, parent2_income, ss_income, location=No
         filing_status: 'single' or 'married'
 
     Returns:
-        dict: Breakdown of all taxes including location info
+        dict: Breakdown of all taxes including location info (one year of calculate_total_taxes_for_years)
     """
-    wage_income = parent1_income + parent2_income
-
-    # Determine location type and tax rules
-    location_type = 'unknown'
-    tax_info = None
-
-    if location:
-        location_type, tax_info = get_location_type(location)
-
-    # Initialize tax components
-    federal_tax = 0
-    state_tax = 0
-    fica_tax = 0
-    foreign_tax = 0
-
-    # Calculate taxes based on location type
-    if location_type == 'us_state':
-        # US State: Apply federal + FICA + state taxes
-
-        # 1. Calculate FICA on wage income
-        fica_tax = calculate_fica_tax(wage_income)
-
-        # 2. Calculate taxable Social Security
-        taxable_ss = calculate_ss_taxable_amount(ss_income, wage_income)
-
-        # 3. Total taxable income with standard deduction
-        standard_deduction = 29200 if filing_status == 'married' else 14600
-        taxable_income = max(0, wage_income + taxable_ss - standard_deduction)
-
-        # 4. Calculate federal income tax
-        federal_tax = calculate_federal_income_tax(taxable_income, filing_status)
-
-        # 5. Calculate state tax using location's rate
-        state_rate = tax_info.get('rate', 0.0)
-        state_tax = taxable_income * state_rate
-
-    elif location_type == 'country' and tax_info:
-        # Foreign Country: Apply country's tax system
-        # Note: US citizens still owe US taxes on worldwide income, but we'll simplify
-        # by assuming they're using Foreign Earned Income Exclusion or Foreign Tax Credit
-
-        if tax_info.get('type') == 'federal_state':
-            # It's the United States as a country
-            # Apply US federal taxes + FICA
-            fica_tax = calculate_fica_tax(wage_income)
-            taxable_ss = calculate_ss_taxable_amount(ss_income, wage_income)
-            standard_deduction = 29200 if filing_status == 'married' else 14600
-            taxable_income = max(0, wage_income + taxable_ss - standard_deduction)
-            federal_tax = calculate_federal_income_tax(taxable_income, filing_status)
-            # No state tax since it's just "United States" without a specific state
-            state_tax = 0
-        else:
-            # Foreign country - apply their tax system
-            # Use effective rate on total income (simplified)
-            effective_rate = tax_info.get('effective_rate', 0.35)
+    return calculate_total_taxes_for_years([parent1_income], [parent2_income], [ss_income], [location],
+                                           state_tax_rate, filing_status)[0]
 
-            # Most countries don't have standard deductions like the US
-            # Some have personal allowances, but we'll simplify
-            total_income = wage_income + ss_income
-            foreign_tax = total_income * effective_rate
+def calculate_fica_tax_array(wage_incomes, filing_status='married'):
+    """Vectorized calculate_fica_tax for an array of wage incomes."""
+    wages = np.asarray(wage_incomes, dtype=float)
+    social_security_tax = np.minimum(wages, 168600) * 0.062
+    medicare_wage_threshold = 250000 if filing_status == 'married' else 200000
+    medicare_tax = np.where(
+        wages <= medicare_wage_threshold,
+        wages * 0.0145,
+        (medicare_wage_threshold * 0.0145) + ((wages - medicare_wage_threshold) * 0.0235)
+    )
+    return social_security_tax + medicare_tax
 
-            # FICA only applies if working for US employer
-            # We'll assume foreign employment = no FICA
-            if tax_info.get('has_fica', False):
-                fica_tax = calculate_fica_tax(wage_income)
 
-    else:
-        # Unknown location - use manual state_tax_rate if provided
-        # Default to US tax system
-        fica_tax = calculate_fica_tax(wage_income)
-        taxable_ss = calculate_ss_taxable_amount(ss_income, wage_income)
-        standard_deduction = 29200 if filing_status == 'married' else 14600
-        taxable_income = max(0, wage_income + taxable_ss - standard_deduction)
-        federal_tax = calculate_federal_income_tax(taxable_income, filing_status)
-
-        # Use manual override or default to 5%
-        if state_tax_rate is not None:
-            state_tax = taxable_income * state_tax_rate
-        else:
-            state_tax = taxable_income * 0.05
+def calculate_ss_taxable_amount_array(ss_incomes, other_incomes):
+    """Vectorized calculate_ss_taxable_amount (provisional income method)."""
+    ss = np.asarray(ss_incomes, dtype=float)
+    provisional_income = np.asarray(other_incomes, dtype=float) + (ss * 0.5)
+    return np.where(
+        provisional_income <= 32000,
+        0.0,
+        np.where(
+            provisional_income <= 44000,
+            np.minimum(provisional_income - 32000, ss * 0.5),
+            np.minimum(12000 + ((provisional_income - 44000) * 0.85), ss * 0.85)
+        )
+    )
+
 
-    # Calculate total
+def calculate_total_taxes_for_years(parent1_incomes, parent2_incomes, ss_incomes, locations,
+                                    state_tax_rate=None, filing_status='married'):
+    """
+    Calculate calculate_total_taxes() for every year of a projection at once.
+
+    Args:
+        parent1_incomes, parent2_incomes, ss_incomes: Per-year income arrays
+        locations: Location name (or None) for each year
+        state_tax_rate: Manual state/local rate for unknown locations
+        filing_status: 'single' or 'married'
+
+    Returns:
+        list: One tax breakdown dict per year, same keys as calculate_total_taxes()
+    """
+    wage_income = np.asarray(parent1_incomes, dtype=float) + np.asarray(parent2_incomes, dtype=float)
+    ss_income = np.asarray(ss_incomes, dtype=float)
+
+    # Resolve each distinct location once
+    location_info = {loc: (get_location_type(loc) if loc else ('unknown', None)) for loc in set(locations)}
+    location_types = [location_info[loc][0] for loc in locations]
+    tax_infos = [location_info[loc][1] for loc in locations]
+
+    # US-style taxes for every year, then select per year by location rules
+    fica_us = calculate_fica_tax_array(wage_income)
+    taxable_ss = calculate_ss_taxable_amount_array(ss_income, wage_income)
+    standard_deduction = 29200 if filing_status == 'married' else 14600
+    taxable_income = np.maximum(0, wage_income + taxable_ss - standard_deduction)
+    federal_us = calculate_federal_income_tax_array(taxable_income, filing_status)
+
+    is_foreign = np.array([
+        loc_type == 'country' and info is not None and info.get('type') != 'federal_state'
+        for loc_type, info in zip(location_types, tax_infos)
+    ], dtype=bool)
+    foreign_fica = np.array([
+        bool(info.get('has_fica', False)) if foreign else False
+        for info, foreign in zip(tax_infos, is_foreign)
+    ], dtype=bool)
+    unknown_rate = state_tax_rate if state_tax_rate is not None else 0.05
+    state_rates = np.array([
+        info.get('rate', 0.0) if loc_type == 'us_state'
+        else 0.0 if loc_type == 'country' and info
+        else unknown_rate
+        for loc_type, info in zip(location_types, tax_infos)
+    ], dtype=float)
+    foreign_rates = np.array([
+        info.get('effective_rate', 0.35) if foreign else 0.0
+        for info, foreign in zip(tax_infos, is_foreign)
+    ], dtype=float)
+
+    federal_tax = np.where(is_foreign, 0.0, federal_us)
+    state_tax = np.where(is_foreign, 0.0, taxable_income * state_rates)
+    fica_tax = np.where(~is_foreign | foreign_fica, fica_us, 0.0)
+    foreign_tax = np.where(is_foreign, (wage_income + ss_income) * foreign_rates, 0.0)
     total_taxes = federal_tax + state_tax + fica_tax + foreign_tax
 
-    return {
-        'federal_income_tax': federal_tax,
-        'state_tax': state_tax,
-        'fica_tax': fica_tax,
-        'foreign_tax': foreign_tax,
-        'total_taxes': total_taxes,
-        'location': location if location else 'Unknown',
-        'location_type': location_type,
-        'tax_note': tax_info.get('note', '') if tax_info else ''
+    return [
+        {
+            'federal_income_tax': federal,
+            'state_tax': state,
+            'fica_tax': fica,
+            'foreign_tax': foreign,
+            'total_taxes': total,
+            'location': loc if loc else 'Unknown',
+            'location_type': loc_type,
+            'tax_note': info.get('note', '') if info else ''
+        }
+        for federal, state, fica, foreign, total, loc, loc_type, info in zip(
+            federal_tax.tolist(), state_tax.tolist(), fica_tax.tolist(), foreign_tax.tolist(),
+            total_taxes.tolist(), locations, location_types, tax_infos
+        )
+    ]
+
+
+def get_household_income_for_years(years) -> list:
+    """
+    Employment and Social Security income for both parents over a range of years.
+
+    Ages, working/retired masks and Social Security are (parent, year)
+    arrays; each parent's salary history is projected for all their working
+    years in one call.
+
+    Returns:
+        list: (parent1_income, parent2_income, parent1_ss, parent2_ss) for each year
+    """
+    years = np.asarray(list(years))
+    current_year = st.session_state.current_year
+    parents = ('parentX', 'parentY')
+
+    ages = np.array([[st.session_state[f'{p}_age']] for p in parents]) + (years - current_year)
+    working = ages < np.array([[st.session_state[f'{p}_retirement_age']] for p in parents])
+
+    # Social Security: monthly benefit, cut by the projected shortfall once the trust fund runs dry
+    ss_factor = np.ones(len(years))
+    if st.session_state.ss_insolvency_enabled:
+        ss_factor[years >= 2034] = 1 - st.session_state.ss_shortfall_percentage / 100
+    ss_benefits = np.array([[st.session_state[f'{p}_ss_benefit'] * 12] for p in parents]) * ss_factor
+
+    salaries = np.zeros(ages.shape)
+    for row, prefix in enumerate(parents):
+        working_idx = np.flatnonzero(working[row])
+        # Look the parent's settings up once, not by formatted key for every working year
+        career_phases = st.session_state.get(f'{prefix}_career_phases')
+        if career_phases:
+            parent_age = st.session_state[f'{prefix}_age']
+            salaries[row, working_idx] = [
+                get_career_income_for_year(career_phases, parent_age, current_year, int(years[i]))['total_employment_income']
+                for i in working_idx
+            ]
+        elif len(working_idx):
+            salaries[row, working_idx] = get_income_for_years(
+                st.session_state[f'{prefix}_income'],
+                st.session_state[f'{prefix}_raise'],
+                st.session_state[f'{prefix}_job_changes'],
+                current_year,
+                years[working_idx]
+            )
+
+    employment = np.where(working, salaries, 0.0)
+    social_security = np.where(working, 0.0, ss_benefits)
+    return list(zip(employment[0].tolist(), employment[1].tolist(),
+                    social_security[0].tolist(), social_security[1].tolist()))
+
+
+def growth_factors(rate: float, first_year_offset: int, num_years: int) -> list:
+    """Compound growth factors (1 + rate) ** n for num_years consecutive year offsets, as one table."""
+    return ((1 + rate) ** np.arange(first_year_offset, first_year_offset + num_years)).tolist()
+
+
+def _cashflow_inputs_fingerprint() -> str:
+    """Hash of everything calculate_lifetime_cashflow reads: the saved plan plus the settings it doesn't carry."""
+    wizard_data = st.session_state.get('wizard_data', {})
+    children_expenses = st.session_state.get('children_expenses')
+    inputs = {
+        'plan': get_plan_data(),
+        'custom_family_templates': st.session_state.get('custom_family_templates', {}),
+        'children_expenses': children_expenses.to_json() if hasattr(children_expenses, 'to_json') else None,
+        'wizard_location': (wizard_data.get('current_location_state'), wizard_data.get('wiz_loc_state')),
+        'medicare': (st.session_state.get('medicare_part_b_premium'), st.session_state.get('medicare_part_d_premium'),
+                     st.session_state.get('medigap_premium')),
+        'taxes': (st.session_state.get('tax_filing_status'), st.session_state.get('state_tax_rate')),
     }
+    return _json_fingerprint(inputs)
+
 
 def calculate_lifetime_cashflow():
     """
     Calculate detailed year-by-year cashflow for entire lifetime (current year to age 100).
     Now includes tax calculations.
 
+    The dashboard, sidebar alerts and tracking tabs all ask for this on every
+    run, so the result is kept in session state against a fingerprint of its
+    inputs and only recomputed when the plan changes. Callers must not modify
+    the returned rows.
+
     Returns:
         list: List of dictionaries with year-by-year financial data
     """
+    fingerprint = _cashflow_inputs_fingerprint()
+    cached = st.session_state.get('_lifetime_cashflow')
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    results = _compute_lifetime_cashflow()
+    st.session_state._lifetime_cashflow = (fingerprint, results)
+    return results
+
+
+def _cashflow_columns(rows: list, *keys: str) -> tuple:
+    """One list per key from a list of row dicts (e.g. cashflow years), gathered in a single pass."""
+    if not rows:
+        return tuple([] for _ in keys)
+    getter = itemgetter(*keys)
+    values = map(getter, rows) if len(keys) > 1 else ((getter(row),) for row in rows)
+    return tuple(map(list, zip(*values)))
+
+
+def _compute_lifetime_cashflow():
+    """Year-by-year cashflow rows for calculate_lifetime_cashflow (always recomputed)."""
     # Calculate timeline end (when both parents reach their death age)
     parent1_death_year = (st.session_state.current_year - st.session_state.parentX_age) + st.session_state.parentX_death_age
     parent2_death_year = (st.session_state.current_year - st.session_state.parentY_age) + st.session_state.parentY_death_age
@@ -14039,119 +14114,80 @@ def calculate_lifetime_cashflow():
         nw_parent2 = None
         cumulative_net_worth = st.session_state.parentX_net_worth + st.session_state.parentY_net_worth
 
-    # Use economic params inflation rate (not hardcoded 3%)
-    expense_inflation = 1 + st.session_state.economic_params.inflation_rate
+    # Optional plan sections: resolve once rather than probing session state every year
+    houses = st.session_state.get('houses', [])
+    health_insurances = st.session_state.get('health_insurances', [])
+    ltc_insurances = st.session_state.get('ltc_insurances', [])
+    has_medicare = 'medicare_part_b_premium' in st.session_state
+
+    years = range(st.session_state.current_year, timeline_end + 1)
+
+    # Income doesn't depend on net worth, so project it for the whole timeline
+    # first and tax every year in one vectorized pass.
+    yearly_income = get_household_income_for_years(years)
+    house_statuses = [house.get_statuses_for_years(years) for house in houses]
+
+    # Growth tables indexed by years from now, instead of a pow() per line item per year
+    # (economic params inflation rate, not hardcoded 3%)
+    inflation_factors = growth_factors(st.session_state.economic_params.inflation_rate, 0, len(years))
+    appreciation_factors = [growth_factors(getattr(house, 'appreciation_rate', 3.0) / 100, 0, len(years)) for house in houses]
+
+    yearly_taxes = calculate_total_taxes_for_years(
+        [inc[0] for inc in yearly_income],
+        [inc[1] for inc in yearly_income],
+        [inc[2] + inc[3] for inc in yearly_income],
+        [state for state, _ in get_states_for_years(years)],
+        state_tax_rate=st.session_state.get('state_tax_rate', None),
+        filing_status=st.session_state.get('tax_filing_status', 'married')
+    )
+
+    # Job change events keyed by year, built once instead of rescanning both
+    # job change tables for every projected year
+    job_change_events = {}
+    for parent_name, job_changes in ((st.session_state.parent1_name, st.session_state.parentX_job_changes),
+                                     (st.session_state.parent2_name, st.session_state.parentY_job_changes)):
+        for job_year, new_income in zip(job_changes['Year'], job_changes['New Income']):
+            job_change_events.setdefault(int(job_year), []).append(('job_change', parent_name, new_income))
 
-    for year in range(st.session_state.current_year, timeline_end + 1):
+    for year, (parent1_income, parent2_income, parent1_ss, parent2_ss), tax_breakdown in zip(years, yearly_income, yearly_taxes):
         # Calculate ages
         parent1_age = st.session_state.parentX_age + (year - st.session_state.current_year)
         parent2_age = st.session_state.parentY_age + (year - st.session_state.current_year)
 
-        # Calculate income
-        parent1_working = parent1_age < st.session_state.parentX_retirement_age
-        parent2_working = parent2_age < st.session_state.parentY_retirement_age
-
-        parent1_income = 0
-        parent2_income = 0
-        parent1_ss = 0
-        parent2_ss = 0
-
-        if parent1_working:
-            if st.session_state.get('parentX_career_phases'):
-                comp = get_career_income_for_year(
-                    st.session_state.parentX_career_phases,
-                    st.session_state.parentX_age,
-                    st.session_state.current_year,
-                    year
-                )
-                parent1_income = comp['total_employment_income']
-            else:
-                parent1_income = get_income_for_year(
-                    st.session_state.parentX_income,
-                    st.session_state.parentX_raise,
-                    st.session_state.parentX_job_changes,
-                    st.session_state.current_year,
-                    year
-                )
-        else:
-            parent1_ss = st.session_state.parentX_ss_benefit * 12
-            if st.session_state.ss_insolvency_enabled and year >= 2034:
-                parent1_ss *= (1 - st.session_state.ss_shortfall_percentage / 100)
-
-        if parent2_working:
-            if st.session_state.get('parentY_career_phases'):
-                comp = get_career_income_for_year(
-                    st.session_state.parentY_career_phases,
-                    st.session_state.parentY_age,
-                    st.session_state.current_year,
-                    year
-                )
-                parent2_income = comp['total_employment_income']
-            else:
-                parent2_income = get_income_for_year(
-                    st.session_state.parentY_income,
-                    st.session_state.parentY_raise,
-                    st.session_state.parentY_job_changes,
-                    st.session_state.current_year,
-                    year
-                )
-        else:
-            parent2_ss = st.session_state.parentY_ss_benefit * 12
-            if st.session_state.ss_insolvency_enabled and year >= 2034:
-                parent2_ss *= (1 - st.session_state.ss_shortfall_percentage / 100)
-
         ss_income = parent1_ss + parent2_ss
         total_income = parent1_income + parent2_income + ss_income
-
-        # Calculate taxes based on location for this year
-        # Get the location (state or country) for this year
-        location, _ = get_state_for_year(year)
-
-        # Get manual tax rate override from session state if set
-        state_tax_rate = st.session_state.get('state_tax_rate', None)
-        filing_status = st.session_state.get('tax_filing_status', 'married')
-
-        tax_breakdown = calculate_total_taxes(
-            parent1_income,
-            parent2_income,
-            ss_income,
-            location=location,
-            state_tax_rate=state_tax_rate,
-            filing_status=filing_status
-        )
-
         total_taxes = tax_breakdown['total_taxes']
 
         # Calculate expenses
         # Parent + Family expenses (with inflation)
         years_from_now = year - st.session_state.current_year
+        inflation_factor = inflation_factors[years_from_now]
 
         # Parent X individual expenses (with inflation)
         parentX_expenses_inflated = {}
         for category, amount in st.session_state.parentX_expenses.items():
-            parentX_expenses_inflated[category] = amount * (expense_inflation ** years_from_now)
+            parentX_expenses_inflated[category] = amount * inflation_factor
         parentX_total = sum(parentX_expenses_inflated.values())
 
         # Parent Y individual expenses (with inflation)
         parentY_expenses_inflated = {}
         for category, amount in st.session_state.parentY_expenses.items():
-            parentY_expenses_inflated[category] = amount * (expense_inflation ** years_from_now)
+            parentY_expenses_inflated[category] = amount * inflation_factor
         parentY_total = sum(parentY_expenses_inflated.values())
 
         # Family shared expenses (with inflation)
         family_expenses_inflated = {}
         for category, amount in st.session_state.family_shared_expenses.items():
-            family_expenses_inflated[category] = amount * (expense_inflation ** years_from_now)
+            family_expenses_inflated[category] = amount * inflation_factor
 
         # Housing ↔ Location linking: if user lives in an owned house this year,
         # zero out the Mortgage/Rent family expense (house costs are in house_expenses)
         lives_in_owned_house = False
-        if 'houses' in st.session_state:
-            for house in st.session_state.houses:
-                status, _ = house.get_status_for_year(year)
-                if status == "Own_Live":
-                    lives_in_owned_house = True
-                    break
+        for statuses in house_statuses:
+            status, _ = statuses[years_from_now]
+            if status == "Own_Live":
+                lives_in_owned_house = True
+                break
         if lives_in_owned_house:
             family_expenses_inflated['Mortgage/Rent'] = 0.0
 
@@ -14202,7 +14238,7 @@ def calculate_lifetime_cashflow():
                     if years_since_start % recurring.frequency_years == 0:
                         expense_amount = recurring.amount
                         if recurring.inflation_adjust:
-                            expense_amount *= (expense_inflation ** years_from_now)
+                            expense_amount *= inflation_factor
                         recurring_expenses_total += expense_amount
 
                         # Store details
@@ -14227,27 +14263,26 @@ def calculate_lifetime_cashflow():
         healthcare_expense_details = {}  # Store detailed breakdown
 
         # Health insurance premiums (pre-Medicare, includes early retirement)
-        if 'health_insurances' in st.session_state:
-            for insurance in st.session_state.health_insurances:
-                # Check if this insurance applies to either parent based on age
-                annual_premium = 0
-                if insurance.covered_by in ["Parent 1", "Both", "Family"] and insurance.start_age <= parent1_age <= insurance.end_age:
-                    annual_premium = insurance.monthly_premium * 12
-                elif insurance.covered_by == "Parent 2" and insurance.start_age <= parent2_age <= insurance.end_age:
+        for insurance in health_insurances:
+            # Check if this insurance applies to either parent based on age
+            annual_premium = 0
+            if insurance.covered_by in ["Parent 1", "Both", "Family"] and insurance.start_age <= parent1_age <= insurance.end_age:
+                annual_premium = insurance.monthly_premium * 12
+            elif insurance.covered_by == "Parent 2" and insurance.start_age <= parent2_age <= insurance.end_age:
+                annual_premium = insurance.monthly_premium * 12
+            elif insurance.covered_by in ["Both", "Family"]:
+                # For Both/Family, check if either parent is in age range
+                if (insurance.start_age <= parent1_age <= insurance.end_age) or (insurance.start_age <= parent2_age <= insurance.end_age):
                     annual_premium = insurance.monthly_premium * 12
-                elif insurance.covered_by in ["Both", "Family"]:
-                    # For Both/Family, check if either parent is in age range
-                    if (insurance.start_age <= parent1_age <= insurance.end_age) or (insurance.start_age <= parent2_age <= insurance.end_age):
-                        annual_premium = insurance.monthly_premium * 12
 
-                if annual_premium > 0:
-                    healthcare_expenses += annual_premium
-                    key = f"Health Insurance ({insurance.covered_by})"
-                    healthcare_expense_details[key] = healthcare_expense_details.get(key, 0) + annual_premium
+            if annual_premium > 0:
+                healthcare_expenses += annual_premium
+                key = f"Health Insurance ({insurance.covered_by})"
+                healthcare_expense_details[key] = healthcare_expense_details.get(key, 0) + annual_premium
 
         # Medicare costs (age 65+)
         medicare_expenses = 0
-        if 'medicare_part_b_premium' in st.session_state:
+        if has_medicare:
             if parent1_age >= 65:
                 part_b = st.session_state.medicare_part_b_premium * 12
                 part_d = st.session_state.get('medicare_part_d_premium', 55.0) * 12
@@ -14268,81 +14303,76 @@ def calculate_lifetime_cashflow():
         healthcare_expenses += medicare_expenses
 
         # Long-term care insurance premiums
-        if 'ltc_insurances' in st.session_state:
-            for ltc in st.session_state.ltc_insurances:
-                if ltc.covered_person == "Parent 1" and parent1_age >= ltc.start_age:
-                    ltc_annual = ltc.monthly_premium * 12
-                    healthcare_expenses += ltc_annual
-                    healthcare_expense_details[f"Long-term Care ({st.session_state.parent1_name})"] = ltc_annual
-                elif ltc.covered_person == "Parent 2" and parent2_age >= ltc.start_age:
-                    ltc_annual = ltc.monthly_premium * 12
-                    healthcare_expenses += ltc_annual
-                    healthcare_expense_details[f"Long-term Care ({st.session_state.parent2_name})"] = ltc_annual
+        for ltc in ltc_insurances:
+            if ltc.covered_person == "Parent 1" and parent1_age >= ltc.start_age:
+                ltc_annual = ltc.monthly_premium * 12
+                healthcare_expenses += ltc_annual
+                healthcare_expense_details[f"Long-term Care ({st.session_state.parent1_name})"] = ltc_annual
+            elif ltc.covered_person == "Parent 2" and parent2_age >= ltc.start_age:
+                ltc_annual = ltc.monthly_premium * 12
+                healthcare_expenses += ltc_annual
+                healthcare_expense_details[f"Long-term Care ({st.session_state.parent2_name})"] = ltc_annual
 
         # House expenses (property tax, insurance, maintenance, upkeep)
         house_expenses = 0
         house_expense_details = []  # Store detailed breakdown
-        if 'houses' in st.session_state:
-            for house in st.session_state.houses:
-                # Check if the house is owned during this year based on timeline
-                is_owned = False
-                for timeline_entry in house.timeline:
-                    if timeline_entry.year <= year:
-                        if timeline_entry.status in ["Own_Live", "Own_Rent"]:
-                            is_owned = True
-                        elif timeline_entry.status == "Sold":
-                            is_owned = False
-
-                if is_owned:
-                    # Calculate house value with appreciation (per-house rate)
-                    appr_rate = 1 + getattr(house, 'appreciation_rate', 3.0) / 100
-                    current_house_value = house.current_value * (appr_rate ** years_from_now)
-
-                    # Property tax (based on current house value)
-                    property_tax = current_house_value * house.property_tax_rate
-                    house_expenses += property_tax
-
-                    # Home insurance (with general inflation)
-                    home_insurance = house.home_insurance * (expense_inflation ** years_from_now)
-                    house_expenses += home_insurance
-
-                    # Maintenance (based on current house value)
-                    maintenance = current_house_value * house.maintenance_rate
-                    house_expenses += maintenance
-
-                    # Upkeep costs (with general inflation)
-                    upkeep = house.upkeep_costs * (expense_inflation ** years_from_now)
-                    house_expenses += upkeep
-
-                    # Store breakdown
-                    house_expense_details.append({
-                        'name': house.name,
-                        'property_tax': property_tax,
-                        'home_insurance': home_insurance,
-                        'maintenance': maintenance,
-                        'upkeep': upkeep
-                    })
+        for house, appreciation in zip(houses, appreciation_factors):
+            # Check if the house is owned during this year based on timeline
+            is_owned = False
+            for timeline_entry in house.timeline:
+                if timeline_entry.year <= year:
+                    if timeline_entry.status in ["Own_Live", "Own_Rent"]:
+                        is_owned = True
+                    elif timeline_entry.status == "Sold":
+                        is_owned = False
+
+            if is_owned:
+                # Calculate house value with appreciation (per-house rate)
+                current_house_value = house.current_value * appreciation[years_from_now]
+
+                # Property tax (based on current house value)
+                property_tax = current_house_value * house.property_tax_rate
+                house_expenses += property_tax
+
+                # Home insurance (with general inflation)
+                home_insurance = house.home_insurance * inflation_factor
+                house_expenses += home_insurance
+
+                # Maintenance (based on current house value)
+                maintenance = current_house_value * house.maintenance_rate
+                house_expenses += maintenance
+
+                # Upkeep costs (with general inflation)
+                upkeep = house.upkeep_costs * inflation_factor
+                house_expenses += upkeep
+
+                # Store breakdown
+                house_expense_details.append({
+                    'name': house.name,
+                    'property_tax': property_tax,
+                    'home_insurance': home_insurance,
+                    'maintenance': maintenance,
+                    'upkeep': upkeep
+                })
 
         total_expenses = base_expenses + children_expenses + recurring_expenses_total + major_purchase_expenses + healthcare_expenses + house_expenses
 
         # ── House equity calculation (non-liquid net worth) ──────────────
         total_house_equity = 0
-        if 'houses' in st.session_state:
-            for house in st.session_state.houses:
-                status, _ = house.get_status_for_year(year)
-                if status in ("Own_Live", "Own_Rent"):
-                    appr = 1 + getattr(house, 'appreciation_rate', 3.0) / 100
-                    h_value = house.current_value * (appr ** years_from_now)
-                    # Remaining mortgage (simple: pay down linearly over mortgage_years_left)
-                    years_into_mortgage = years_from_now
-                    if house.mortgage_years_left > 0 and years_into_mortgage < house.mortgage_years_left:
-                        remaining_frac = 1 - (years_into_mortgage / house.mortgage_years_left)
-                        h_mortgage = house.mortgage_balance * remaining_frac
-                    elif house.mortgage_years_left > 0:
-                        h_mortgage = 0  # Paid off
-                    else:
-                        h_mortgage = 0
-                    total_house_equity += max(0, h_value - h_mortgage)
+        for house, statuses, appreciation in zip(houses, house_statuses, appreciation_factors):
+            status, _ = statuses[years_from_now]
+            if status in ("Own_Live", "Own_Rent"):
+                h_value = house.current_value * appreciation[years_from_now]
+                # Remaining mortgage (simple: pay down linearly over mortgage_years_left)
+                years_into_mortgage = years_from_now
+                if house.mortgage_years_left > 0 and years_into_mortgage < house.mortgage_years_left:
+                    remaining_frac = 1 - (years_into_mortgage / house.mortgage_years_left)
+                    h_mortgage = house.mortgage_balance * remaining_frac
+                elif house.mortgage_years_left > 0:
+                    h_mortgage = 0  # Paid off
+                else:
+                    h_mortgage = 0
+                total_house_equity += max(0, h_value - h_mortgage)
 
         # ── Net worth update ──────────────────────────────────────────────
         inv_rate = st.session_state.economic_params.investment_return
@@ -14357,22 +14387,21 @@ def calculate_lifetime_cashflow():
             p2_house_exp = 0
             p1_name = st.session_state.parent1_name
             p2_name = st.session_state.parent2_name
-            if 'houses' in st.session_state:
-                for detail in house_expense_details:
-                    # Find matching house to check owner
-                    owner = "Shared"
-                    for house in st.session_state.houses:
-                        if house.name == detail['name']:
-                            owner = house.owner
-                            break
-                    h_total = detail['property_tax'] + detail['home_insurance'] + detail['maintenance'] + detail['upkeep']
-                    if owner == p1_name:
-                        p1_house_exp += h_total
-                    elif owner == p2_name:
-                        p2_house_exp += h_total
-                    else:  # Shared
-                        p1_house_exp += h_total * split_pct
-                        p2_house_exp += h_total * (1 - split_pct)
+            for detail in house_expense_details:
+                # Find matching house to check owner
+                owner = "Shared"
+                for house in houses:
+                    if house.name == detail['name']:
+                        owner = house.owner
+                        break
+                h_total = detail['property_tax'] + detail['home_insurance'] + detail['maintenance'] + detail['upkeep']
+                if owner == p1_name:
+                    p1_house_exp += h_total
+                elif owner == p2_name:
+                    p2_house_exp += h_total
+                else:  # Shared
+                    p1_house_exp += h_total * split_pct
+                    p2_house_exp += h_total * (1 - split_pct)
 
             # Allocate healthcare by covered person
             p1_healthcare = 0
@@ -14414,16 +14443,8 @@ def calculate_lifetime_cashflow():
             investment_return = cumulative_net_worth * inv_rate
             cumulative_net_worth += cashflow + investment_return
 
-        # Track events
-        events = []
-
-        # Job changes
-        for _, row in st.session_state.parentX_job_changes.iterrows():
-            if int(row['Year']) == year:
-                events.append(('job_change', st.session_state.parent1_name, row['New Income']))
-        for _, row in st.session_state.parentY_job_changes.iterrows():
-            if int(row['Year']) == year:
-                events.append(('job_change', st.session_state.parent2_name, row['New Income']))
+        # Track events (job changes first)
+        events = list(job_change_events.get(year, ()))
 
         # College events
         if children_in_college:
@@ -14505,678 +14526,962 @@ def deterministic_cashflow_tab():
     if st.button("🏦 Calculate Lifetime Cashflow", type="primary", use_container_width=True, key="calc_cashflow"):
         with st.spinner("Calculating lifetime cashflow..."):
             st.session_state.cashflow_data_cached = calculate_lifetime_cashflow()
+        # The results below render from the fresh data in this same run
         if st.session_state.cashflow_data_cached:
             st.success("✅ Calculation complete! Scroll down to view results.")
-        st.rerun()
 
     # Check if we have calculated data to show
     if st.session_state.cashflow_data_cached is not None:
         cashflow_data = st.session_state.cashflow_data_cached
 
         if cashflow_data:
-            # Create tabs for different views
-            cashflow_tab1, cashflow_tab2, cashflow_tab3 = st.tabs(["📈 Timeline View", "📊 Critical Years Table", "📅 Life Stages"])
+            # Create tabs for different views (stateful, so only the open one is built)
+            cashflow_tab1, cashflow_tab2, cashflow_tab3 = st.tabs(["📈 Timeline View", "📊 Critical Years Table", "📅 Life Stages"],
+                                                                  key="cashflow_view_tabs", on_change="rerun")
 
-            with cashflow_tab1:
-                st.subheader("Lifetime Income vs Expenses Timeline")
+            if cashflow_tab1.open:
+                with cashflow_tab1:
+                    st.subheader("Lifetime Income vs Expenses Timeline")
 
-                # Prepare data for plotting
-                years = [d['year'] for d in cashflow_data]
-                income = [d['total_income'] for d in cashflow_data]
-                expenses = [d['total_expenses'] for d in cashflow_data]
-                cashflow = [d['cashflow'] for d in cashflow_data]
+                    # Prepare data for plotting
+                    years, income, expenses, cashflow = _cashflow_columns(
+                        cashflow_data, 'year', 'total_income', 'total_expenses', 'cashflow')
 
-                # Create figure
-                fig = go.Figure()
+                    # Create figure
+                    fig = go.Figure()
 
-                # Add income line
-                fig.add_trace(go.Scatter(
-                    x=years,
-                    y=income,
-                    mode='lines',
-                    name='Income',
-                    line=dict(color='green', width=2),
-                    hovertemplate='<b>Year %{x}</b><br>Income: $%{y:,.0f}<br>Click for details<extra></extra>'
-                ))
-
-                # Add expenses line
-                fig.add_trace(go.Scatter(
-                    x=years,
-                    y=expenses,
-                    mode='lines',
-                    name='Expenses',
-                    line=dict(color='red', width=2),
-                    hovertemplate='<b>Year %{x}</b><br>Expenses: $%{y:,.0f}<br>Click for details<extra></extra>'
-                ))
-
-                # Add cashflow area (positive)
-                cashflow_positive = [max(0, cf) for cf in cashflow]
-                fig.add_trace(go.Scatter(
-                    x=years,
-                    y=cashflow_positive,
-                    mode='none',
-                    name='Positive Cashflow',
-                    fill='tozeroy',
-                    fillcolor='rgba(0, 255, 0, 0.1)',
-                    hovertemplate='<b>Year %{x}</b><br>Surplus: $%{y:,.0f}<extra></extra>'
-                ))
+                    # Add income line
+                    fig.add_trace(go.Scatter(
+                        x=years,
+                        y=income,
+                        mode='lines',
+                        name='Income',
+                        line=dict(color='green', width=2),
+                        hovertemplate='<b>Year %{x}</b><br>Income: $%{y:,.0f}<br>Click for details<extra></extra>'
+                    ))
 
-                # Add cashflow area (negative)
-                cashflow_negative = [min(0, cf) for cf in cashflow]
-                fig.add_trace(go.Scatter(
-                    x=years,
-                    y=cashflow_negative,
-                    mode='none',
-                    name='Deficit',
-                    fill='tozeroy',
-                    fillcolor='rgba(255, 0, 0, 0.1)',
-                    hovertemplate='<b>Year %{x}</b><br>Deficit: $%{y:,.0f}<extra></extra>'
-                ))
+                    # Add expenses line
+                    fig.add_trace(go.Scatter(
+                        x=years,
+                        y=expenses,
+                        mode='lines',
+                        name='Expenses',
+                        line=dict(color='red', width=2),
+                        hovertemplate='<b>Year %{x}</b><br>Expenses: $%{y:,.0f}<br>Click for details<extra></extra>'
+                    ))
 
-                # Add major event markers
-                major_events = []
-                for d in cashflow_data:
-                    for event_type, *event_data in d['events']:
-                        if event_type == 'job_change':
-                            major_events.append({'year': d['year'], 'type': 'job_change', 'label': f"💼 {event_data[0]}", 'value': d['total_income']})
-                        elif event_type == 'retirement':
-                            major_events.append({'year': d['year'], 'type': 'retirement', 'label': f"🏖️ {event_data[0]}", 'value': d['total_income']})
-
-                college_years_list = [d['year'] for d in cashflow_data if d['children_in_college']]
-                if college_years_list:
-                    first_college = min(college_years_list)
-                    last_college = max(college_years_list)
-                    first_college_data = next(d for d in cashflow_data if d['year'] == first_college)
-                    major_events.append({'year': first_college, 'type': 'college_start', 'label': '🎓 College Starts', 'value': first_college_data['total_expenses']})
-                    if last_college != first_college:
-                        last_college_data = next(d for d in cashflow_data if d['year'] == last_college)
-                        major_events.append({'year': last_college, 'type': 'college_end', 'label': '🎓 College Ends', 'value': last_college_data['total_expenses']})
-
-                if major_events:
-                    event_years = [e['year'] for e in major_events]
-                    event_values = [e['value'] for e in major_events]
-                    event_labels = [e['label'] for e in major_events]
+                    # Add cashflow area (positive)
+                    cashflow_positive = [max(0, cf) for cf in cashflow]
                     fig.add_trace(go.Scatter(
-                        x=event_years,
-                        y=event_values,
-                        mode='markers',
-                        name='Major Events',
-                        marker=dict(size=15, color='blue', symbol='star', line=dict(width=2, color='white')),
-                        hovertemplate='<b>%{customdata}</b><br>Year: %{x}<extra></extra>',
-                        customdata=event_labels
+                        x=years,
+                        y=cashflow_positive,
+                        mode='none',
+                        name='Positive Cashflow',
+                        fill='tozeroy',
+                        fillcolor='rgba(0, 255, 0, 0.1)',
+                        hovertemplate='<b>Year %{x}</b><br>Surplus: $%{y:,.0f}<extra></extra>'
                     ))
 
-                fig.update_layout(
-                    title="Lifetime Income, Expenses, and Cashflow (Click any year for details)",
-                    xaxis_title="Year",
-                    yaxis_title="Amount ($)",
-                    height=700,
-                    hovermode='x unified',
-                    showlegend=True,
-                    clickmode='event+select'
-                )
+                    # Add cashflow area (negative)
+                    cashflow_negative = [min(0, cf) for cf in cashflow]
+                    fig.add_trace(go.Scatter(
+                        x=years,
+                        y=cashflow_negative,
+                        mode='none',
+                        name='Deficit',
+                        fill='tozeroy',
+                        fillcolor='rgba(255, 0, 0, 0.1)',
+                        hovertemplate='<b>Year %{x}</b><br>Deficit: $%{y:,.0f}<extra></extra>'
+                    ))
 
-                selected_points = st.plotly_chart(fig, use_container_width=True, on_select="rerun", key="cashflow_chart_main")
+                    # Add major event markers
+                    major_events = []
+                    for d in cashflow_data:
+                        for event_type, *event_data in d['events']:
+                            if event_type == 'job_change':
+                                major_events.append({'year': d['year'], 'type': 'job_change', 'label': f"💼 {event_data[0]}", 'value': d['total_income']})
+                            elif event_type == 'retirement':
+                                major_events.append({'year': d['year'], 'type': 'retirement', 'label': f"🏖️ {event_data[0]}", 'value': d['total_income']})
+
+                    # cashflow_data is in year order, so the first and last college rows bound the college years
+                    college_rows = [d for d in cashflow_data if d['children_in_college']]
+                    if college_rows:
+                        first_college_data, last_college_data = college_rows[0], college_rows[-1]
+                        first_college, last_college = first_college_data['year'], last_college_data['year']
+                        major_events.append({'year': first_college, 'type': 'college_start', 'label': '🎓 College Starts', 'value': first_college_data['total_expenses']})
+                        if last_college != first_college:
+                            major_events.append({'year': last_college, 'type': 'college_end', 'label': '🎓 College Ends', 'value': last_college_data['total_expenses']})
+
+                    if major_events:
+                        event_years, event_values, event_labels = _cashflow_columns(major_events, 'year', 'value', 'label')
+                        fig.add_trace(go.Scatter(
+                            x=event_years,
+                            y=event_values,
+                            mode='markers',
+                            name='Major Events',
+                            marker=dict(size=15, color='blue', symbol='star', line=dict(width=2, color='white')),
+                            hovertemplate='<b>%{customdata}</b><br>Year: %{x}<extra></extra>',
+                            customdata=event_labels
+                        ))
+
+                    fig.update_layout(
+                        title="Lifetime Income, Expenses, and Cashflow (Click any year for details)",
+                        xaxis_title="Year",
+                        yaxis_title="Amount ($)",
+                        height=700,
+                        hovermode='x unified',
+                        showlegend=True,
+                        clickmode='event+select'
+                    )
 
-                # Handle year selection via manual input
-                st.markdown("---")
-                col_select1, col_select2 = st.columns([3, 1])
-                with col_select1:
-                    selected_year = st.selectbox("Select a year to see detailed breakdown:", options=years, index=0, key="year_selector_main")
-                with col_select2:
-                    st.markdown("<br>", unsafe_allow_html=True)
-                    if st.button("Show Details", type="primary", key="show_details_btn"):
-                        st.session_state.selected_cashflow_year = selected_year
-
-                # Show detailed breakdown if year is selected
-                if st.session_state.selected_cashflow_year:
-                    year_data = next((d for d in cashflow_data if d['year'] == st.session_state.selected_cashflow_year), None)
-                    if year_data:
-                        st.markdown("---")
-                        st.subheader(f"📊 Detailed Breakdown for {st.session_state.selected_cashflow_year}")
-
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.markdown("#### 💵 Income Breakdown")
-                            income_breakdown = []
-                            if year_data['parent1_income'] > 0:
-                                income_breakdown.append({'Source': f"{st.session_state.parent1_name} Salary", 'Amount': year_data['parent1_income']})
-                            if year_data['parent2_income'] > 0:
-                                income_breakdown.append({'Source': f"{st.session_state.parent2_name} Salary", 'Amount': year_data['parent2_income']})
-                            if year_data['ss_income'] > 0:
-                                income_breakdown.append({'Source': 'Social Security', 'Amount': year_data['ss_income']})
-                            if year_data.get('investment_income', 0) > 0:
-                                income_breakdown.append({'Source': '📈 Investment Returns', 'Amount': year_data['investment_income']})
-
-                            if income_breakdown:
-                                income_df = pd.DataFrame(income_breakdown)
-                                income_fig = go.Figure(data=[go.Pie(labels=income_df['Source'], values=income_df['Amount'], hole=0.3, marker_colors=['#2ecc71', '#27ae60', '#16a085', '#1abc9c'])])
-                                income_fig.update_layout(height=300, showlegend=True)
-                                st.plotly_chart(income_fig, use_container_width=True)
-                                income_df['Amount'] = income_df['Amount'].apply(lambda x: f"${x:,.0f}")
-                                st.dataframe(income_df, hide_index=True, use_container_width=True)
-
-                                # Calculate total including investment returns
-                                total_with_investments = year_data['total_income'] + year_data.get('investment_income', 0)
-                                st.metric("Total Earned Income", f"${year_data['total_income']:,.0f}")
+                    selected_points = st.plotly_chart(fig, use_container_width=True, on_select="rerun", key="cashflow_chart_main")
+
+                    # Handle year selection via manual input
+                    st.markdown("---")
+                    col_select1, col_select2 = st.columns([3, 1])
+                    with col_select1:
+                        selected_year = st.selectbox("Select a year to see detailed breakdown:", options=years, index=0, key="year_selector_main")
+                    with col_select2:
+                        st.markdown("<br>", unsafe_allow_html=True)
+                        if st.button("Show Details", type="primary", key="show_details_btn"):
+                            st.session_state.selected_cashflow_year = selected_year
+
+                    # Show detailed breakdown if year is selected
+                    if st.session_state.selected_cashflow_year:
+                        year_data = next((d for d in cashflow_data if d['year'] == st.session_state.selected_cashflow_year), None)
+                        if year_data:
+                            st.markdown("---")
+                            st.subheader(f"📊 Detailed Breakdown for {st.session_state.selected_cashflow_year}")
+
+                            col1, col2 = st.columns(2)
+                            with col1:
+                                st.markdown("#### 💵 Income Breakdown")
+                                income_breakdown = []
+                                if year_data['parent1_income'] > 0:
+                                    income_breakdown.append({'Source': f"{st.session_state.parent1_name} Salary", 'Amount': year_data['parent1_income']})
+                                if year_data['parent2_income'] > 0:
+                                    income_breakdown.append({'Source': f"{st.session_state.parent2_name} Salary", 'Amount': year_data['parent2_income']})
+                                if year_data['ss_income'] > 0:
+                                    income_breakdown.append({'Source': 'Social Security', 'Amount': year_data['ss_income']})
                                 if year_data.get('investment_income', 0) > 0:
-                                    st.metric("Total with Investments", f"${total_with_investments:,.0f}")
-                            else:
-                                st.info("No income for this year")
-
-                        with col2:
-                            st.markdown("#### 💳 Expense Breakdown")
-                            expense_breakdown = []
-                            # Add taxes first (critical expense)
-                            if year_data.get('taxes', 0) > 0:
-                                expense_breakdown.append({'Category': '💸 Taxes', 'Amount': year_data['taxes']})
-                            if year_data['base_expenses'] > 0:
-                                expense_breakdown.append({'Category': 'Family Living Expenses', 'Amount': year_data['base_expenses']})
-                            if year_data['children_expenses'] > 0:
-                                expense_breakdown.append({'Category': 'Children Expenses', 'Amount': year_data['children_expenses']})
-                            if year_data.get('healthcare_expenses', 0) > 0:
-                                expense_breakdown.append({'Category': 'Healthcare & Insurance', 'Amount': year_data['healthcare_expenses']})
-                            if year_data.get('house_expenses', 0) > 0:
-                                expense_breakdown.append({'Category': 'House Expenses', 'Amount': year_data['house_expenses']})
-                            if year_data.get('recurring_expenses', 0) > 0:
-                                expense_breakdown.append({'Category': 'Recurring Expenses', 'Amount': year_data['recurring_expenses']})
-                            if year_data.get('major_purchases', 0) > 0:
-                                expense_breakdown.append({'Category': 'One-Time Major Purchases', 'Amount': year_data['major_purchases']})
+                                    income_breakdown.append({'Source': '📈 Investment Returns', 'Amount': year_data['investment_income']})
+
+                                if income_breakdown:
+                                    income_df = pd.DataFrame(income_breakdown)
+                                    income_fig = go.Figure(data=[go.Pie(labels=income_df['Source'], values=income_df['Amount'], hole=0.3, marker_colors=['#2ecc71', '#27ae60', '#16a085', '#1abc9c'])])
+                                    income_fig.update_layout(height=300, showlegend=True)
+                                    st.plotly_chart(income_fig, use_container_width=True)
+                                    st.dataframe(income_df, hide_index=True, use_container_width=True, column_config={'Amount': CURRENCY_COLUMN})
+
+                                    # Calculate total including investment returns
+                                    total_with_investments = year_data['total_income'] + year_data.get('investment_income', 0)
+                                    st.metric("Total Earned Income", f"${year_data['total_income']:,.0f}")
+                                    if year_data.get('investment_income', 0) > 0:
+                                        st.metric("Total with Investments", f"${total_with_investments:,.0f}")
+                                else:
+                                    st.info("No income for this year")
+
+                            with col2:
+                                st.markdown("#### 💳 Expense Breakdown")
+                                expense_breakdown = []
+                                # Add taxes first (critical expense)
+                                if year_data.get('taxes', 0) > 0:
+                                    expense_breakdown.append({'Category': '💸 Taxes', 'Amount': year_data['taxes']})
+                                if year_data['base_expenses'] > 0:
+                                    expense_breakdown.append({'Category': 'Family Living Expenses', 'Amount': year_data['base_expenses']})
+                                if year_data['children_expenses'] > 0:
+                                    expense_breakdown.append({'Category': 'Children Expenses', 'Amount': year_data['children_expenses']})
+                                if year_data.get('healthcare_expenses', 0) > 0:
+                                    expense_breakdown.append({'Category': 'Healthcare & Insurance', 'Amount': year_data['healthcare_expenses']})
+                                if year_data.get('house_expenses', 0) > 0:
+                                    expense_breakdown.append({'Category': 'House Expenses', 'Amount': year_data['house_expenses']})
+                                if year_data.get('recurring_expenses', 0) > 0:
+                                    expense_breakdown.append({'Category': 'Recurring Expenses', 'Amount': year_data['recurring_expenses']})
+                                if year_data.get('major_purchases', 0) > 0:
+                                    expense_breakdown.append({'Category': 'One-Time Major Purchases', 'Amount': year_data['major_purchases']})
+
+                                if expense_breakdown:
+                                    expense_df = pd.DataFrame(expense_breakdown)
+                                    expense_fig = go.Figure(data=[go.Pie(labels=expense_df['Category'], values=expense_df['Amount'], hole=0.3, marker_colors=['#e74c3c', '#c0392b', '#9b59b6', '#8e44ad', '#d35400', '#e67e22'])])
+                                    expense_fig.update_layout(height=300, showlegend=True)
+                                    st.plotly_chart(expense_fig, use_container_width=True)
+                                    st.dataframe(expense_df, hide_index=True, use_container_width=True, column_config={'Amount': CURRENCY_COLUMN})
+                                    st.metric("Total Expenses", f"${year_data['total_expenses']:,.0f}")
+
+                            # Sankey and detailed breakdowns — full width (outside columns)
+                            if year_data.get('total_income', 0) > 0 or year_data.get('total_expenses', 0) > 0:
+                                # Sankey Diagram for Money Flow
+                                st.markdown("---")
+                                st.markdown("#### 💰 Money Flow Visualization (Sankey Diagram)")
+                                st.caption("See how money flows from income sources (including investment returns) through various expense categories to savings")
+
+                                # Build Sankey diagram data
+                                sankey_labels = []
+                                sankey_source = []
+                                sankey_target = []
+                                sankey_values = []
+                                sankey_colors = []
+
+                                # Define node indices
+                                node_index = 0
+                                node_map = {}
+
+                                # Income sources (left side)
+                                income_sources = []
+                                if year_data['parent1_income'] > 0:
+                                    income_sources.append({
+                                        'name': f"{st.session_state.parent1_name} Salary",
+                                        'value': year_data['parent1_income'],
+                                        'color': '#2ecc71'
+                                    })
+                                if year_data['parent2_income'] > 0:
+                                    income_sources.append({
+                                        'name': f"{st.session_state.parent2_name} Salary",
+                                        'value': year_data['parent2_income'],
+                                        'color': '#27ae60'
+                                    })
+                                if year_data['ss_income'] > 0:
+                                    income_sources.append({
+                                        'name': 'Social Security',
+                                        'value': year_data['ss_income'],
+                                        'color': '#16a085'
+                                    })
+                                if year_data.get('investment_income', 0) > 0:
+                                    income_sources.append({
+                                        'name': '📈 Investment Returns',
+                                        'value': year_data['investment_income'],
+                                        'color': '#1abc9c'
+                                    })
+
+                                # Add income source nodes
+                                for source in income_sources:
+                                    sankey_labels.append(source['name'])
+                                    node_map[source['name']] = node_index
+                                    node_index += 1
+
+                                # Add "Total Income" middle node
+                                sankey_labels.append("Total Income")
+                                node_map["Total Income"] = node_index
+                                total_income_idx = node_index
+                                node_index += 1
 
-                            if expense_breakdown:
-                                expense_df = pd.DataFrame(expense_breakdown)
-                                expense_fig = go.Figure(data=[go.Pie(labels=expense_df['Category'], values=expense_df['Amount'], hole=0.3, marker_colors=['#e74c3c', '#c0392b', '#9b59b6', '#8e44ad', '#d35400', '#e67e22'])])
-                                expense_fig.update_layout(height=300, showlegend=True)
-                                st.plotly_chart(expense_fig, use_container_width=True)
-                                expense_df['Amount'] = expense_df['Amount'].apply(lambda x: f"${x:,.0f}")
-                                st.dataframe(expense_df, hide_index=True, use_container_width=True)
-                                st.metric("Total Expenses", f"${year_data['total_expenses']:,.0f}")
-
-                        # Sankey and detailed breakdowns — full width (outside columns)
-                        if year_data.get('total_income', 0) > 0 or year_data.get('total_expenses', 0) > 0:
-                            # Sankey Diagram for Money Flow
-                            st.markdown("---")
-                            st.markdown("#### 💰 Money Flow Visualization (Sankey Diagram)")
-                            st.caption("See how money flows from income sources (including investment returns) through various expense categories to savings")
-
-                            # Build Sankey diagram data
-                            sankey_labels = []
-                            sankey_source = []
-                            sankey_target = []
-                            sankey_values = []
-                            sankey_colors = []
-
-                            # Define node indices
-                            node_index = 0
-                            node_map = {}
-
-                            # Income sources (left side)
-                            income_sources = []
-                            if year_data['parent1_income'] > 0:
-                                income_sources.append({
-                                    'name': f"{st.session_state.parent1_name} Salary",
-                                    'value': year_data['parent1_income'],
-                                    'color': '#2ecc71'
-                                })
-                            if year_data['parent2_income'] > 0:
-                                income_sources.append({
-                                    'name': f"{st.session_state.parent2_name} Salary",
-                                    'value': year_data['parent2_income'],
-                                    'color': '#27ae60'
-                                })
-                            if year_data['ss_income'] > 0:
-                                income_sources.append({
-                                    'name': 'Social Security',
-                                    'value': year_data['ss_income'],
-                                    'color': '#16a085'
-                                })
-                            if year_data.get('investment_income', 0) > 0:
-                                income_sources.append({
-                                    'name': '📈 Investment Returns',
-                                    'value': year_data['investment_income'],
-                                    'color': '#1abc9c'
-                                })
+                                # Connect income sources to Total Income
+                                for source in income_sources:
+                                    sankey_source.append(node_map[source['name']])
+                                    sankey_target.append(total_income_idx)
+                                    sankey_values.append(source['value'])
+                                    sankey_colors.append(source['color'])
 
-                            # Add income source nodes
-                            for source in income_sources:
-                                sankey_labels.append(source['name'])
-                                node_map[source['name']] = node_index
-                                node_index += 1
+                                # Expense categories (right side)
+                                expense_categories = []
 
-                            # Add "Total Income" middle node
-                            sankey_labels.append("Total Income")
-                            node_map["Total Income"] = node_index
-                            total_income_idx = node_index
-                            node_index += 1
-
-                            # Connect income sources to Total Income
-                            for source in income_sources:
-                                sankey_source.append(node_map[source['name']])
-                                sankey_target.append(total_income_idx)
-                                sankey_values.append(source['value'])
-                                sankey_colors.append(source['color'])
-
-                            # Expense categories (right side)
-                            expense_categories = []
-
-                            # Taxes come first (critical expense)
-                            if year_data.get('taxes', 0) > 0:
-                                expense_categories.append({
-                                    'name': '💸 Taxes',
-                                    'value': year_data['taxes'],
-                                    'color': 'rgba(52, 73, 94, 0.7)'  # Dark gray-blue
-                                })
+                                # Taxes come first (critical expense)
+                                if year_data.get('taxes', 0) > 0:
+                                    expense_categories.append({
+                                        'name': '💸 Taxes',
+                                        'value': year_data['taxes'],
+                                        'color': 'rgba(52, 73, 94, 0.7)'  # Dark gray-blue
+                                    })
+
+                                if year_data['base_expenses'] > 0:
+                                    expense_categories.append({
+                                        'name': 'Family Living',
+                                        'value': year_data['base_expenses'],
+                                        'color': 'rgba(231, 76, 60, 0.6)'
+                                    })
+                                if year_data['children_expenses'] > 0:
+                                    expense_categories.append({
+                                        'name': 'Children',
+                                        'value': year_data['children_expenses'],
+                                        'color': 'rgba(192, 57, 43, 0.6)'
+                                    })
+                                if year_data.get('healthcare_expenses', 0) > 0:
+                                    expense_categories.append({
+                                        'name': 'Healthcare',
+                                        'value': year_data['healthcare_expenses'],
+                                        'color': 'rgba(155, 89, 182, 0.6)'
+                                    })
+                                if year_data.get('house_expenses', 0) > 0:
+                                    expense_categories.append({
+                                        'name': 'House',
+                                        'value': year_data['house_expenses'],
+                                        'color': 'rgba(142, 68, 173, 0.6)'
+                                    })
+                                if year_data.get('recurring_expenses', 0) > 0:
+                                    expense_categories.append({
+                                        'name': 'Recurring',
+                                        'value': year_data['recurring_expenses'],
+                                        'color': 'rgba(211, 84, 0, 0.6)'
+                                    })
+                                if year_data.get('major_purchases', 0) > 0:
+                                    expense_categories.append({
+                                        'name': 'Major Purchases',
+                                        'value': year_data['major_purchases'],
+                                        'color': 'rgba(230, 126, 34, 0.6)'
+                                    })
+
+                                # Add expense category nodes
+                                for category in expense_categories:
+                                    sankey_labels.append(category['name'])
+                                    node_map[category['name']] = node_index
+                                    node_index += 1
+
+                                # Add Savings/Deficit node
+                                cashflow_value = year_data['cashflow']
+                                if cashflow_value > 0:
+                                    sankey_labels.append("💰 Savings")
+                                    node_map["Savings"] = node_index
+                                    savings_idx = node_index
+                                    node_index += 1
+                                    savings_color = 'rgba(46, 204, 113, 0.6)'
+                                elif cashflow_value < 0:
+                                    sankey_labels.append("⚠️ Deficit")
+                                    node_map["Deficit"] = node_index
+                                    deficit_idx = node_index
+                                    node_index += 1
+                                    deficit_color = 'rgba(231, 76, 60, 0.8)'
+
+                                # Connect Total Income to expense categories
+                                for category in expense_categories:
+                                    sankey_source.append(total_income_idx)
+                                    sankey_target.append(node_map[category['name']])
+                                    sankey_values.append(category['value'])
+                                    sankey_colors.append(category['color'])
+
+                                # Connect Total Income to Savings or show Deficit
+                                if cashflow_value > 0:
+                                    sankey_source.append(total_income_idx)
+                                    sankey_target.append(savings_idx)
+                                    sankey_values.append(cashflow_value)
+                                    sankey_colors.append(savings_color)
+
+                                # Create node colors list
+                                node_colors = []
+                                for label in sankey_labels:
+                                    if 'Salary' in label:
+                                        node_colors.append('#2ecc71')
+                                    elif 'Social Security' in label:
+                                        node_colors.append('#16a085')
+                                    elif 'Investment Returns' in label:
+                                        node_colors.append('#1abc9c')
+                                    elif 'Total Income' in label:
+                                        node_colors.append('#3498db')
+                                    elif 'Savings' in label:
+                                        node_colors.append('#2ecc71')
+                                    elif 'Deficit' in label:
+                                        node_colors.append('#e74c3c')
+                                    else:
+                                        node_colors.append('#95a5a6')
+
+                                # Create Sankey diagram
+                                sankey_fig = go.Figure(data=[go.Sankey(
+                                    node=dict(
+                                        pad=15,
+                                        thickness=20,
+                                        line=dict(color="black", width=0.5),
+                                        label=sankey_labels,
+                                        color=node_colors,
+                                        hovertemplate='%{label}<br>$%{value:,.0f}<extra></extra>'
+                                    ),
+                                    link=dict(
+                                        source=sankey_source,
+                                        target=sankey_target,
+                                        value=sankey_values,
+                                        color=sankey_colors,
+                                        hovertemplate='%{source.label} → %{target.label}<br>$%{value:,.0f}<extra></extra>'
+                                    )
+                                )])
 
-                            if year_data['base_expenses'] > 0:
-                                expense_categories.append({
-                                    'name': 'Family Living',
-                                    'value': year_data['base_expenses'],
-                                    'color': 'rgba(231, 76, 60, 0.6)'
-                                })
-                            if year_data['children_expenses'] > 0:
-                                expense_categories.append({
-                                    'name': 'Children',
-                                    'value': year_data['children_expenses'],
-                                    'color': 'rgba(192, 57, 43, 0.6)'
-                                })
-                            if year_data.get('healthcare_expenses', 0) > 0:
-                                expense_categories.append({
-                                    'name': 'Healthcare',
-                                    'value': year_data['healthcare_expenses'],
-                                    'color': 'rgba(155, 89, 182, 0.6)'
-                                })
-                            if year_data.get('house_expenses', 0) > 0:
-                                expense_categories.append({
-                                    'name': 'House',
-                                    'value': year_data['house_expenses'],
-                                    'color': 'rgba(142, 68, 173, 0.6)'
-                                })
-                            if year_data.get('recurring_expenses', 0) > 0:
-                                expense_categories.append({
-                                    'name': 'Recurring',
-                                    'value': year_data['recurring_expenses'],
-                                    'color': 'rgba(211, 84, 0, 0.6)'
-                                })
-                            if year_data.get('major_purchases', 0) > 0:
-                                expense_categories.append({
-                                    'name': 'Major Purchases',
-                                    'value': year_data['major_purchases'],
-                                    'color': 'rgba(230, 126, 34, 0.6)'
-                                })
+                                sankey_fig.update_layout(
+                                    title=f"Money Flow for {st.session_state.selected_cashflow_year}",
+                                    font=dict(size=12),
+                                    height=600,
+                                    margin=dict(l=20, r=20, t=40, b=20)
+                                )
 
-                            # Add expense category nodes
-                            for category in expense_categories:
-                                sankey_labels.append(category['name'])
-                                node_map[category['name']] = node_index
-                                node_index += 1
+                                st.plotly_chart(sankey_fig, use_container_width=True)
 
-                            # Add Savings/Deficit node
-                            cashflow_value = year_data['cashflow']
-                            if cashflow_value > 0:
-                                sankey_labels.append("💰 Savings")
-                                node_map["Savings"] = node_index
-                                savings_idx = node_index
-                                node_index += 1
-                                savings_color = 'rgba(46, 204, 113, 0.6)'
-                            elif cashflow_value < 0:
-                                sankey_labels.append("⚠️ Deficit")
-                                node_map["Deficit"] = node_index
-                                deficit_idx = node_index
-                                node_index += 1
-                                deficit_color = 'rgba(231, 76, 60, 0.8)'
-
-                            # Connect Total Income to expense categories
-                            for category in expense_categories:
-                                sankey_source.append(total_income_idx)
-                                sankey_target.append(node_map[category['name']])
-                                sankey_values.append(category['value'])
-                                sankey_colors.append(category['color'])
-
-                            # Connect Total Income to Savings or show Deficit
-                            if cashflow_value > 0:
-                                sankey_source.append(total_income_idx)
-                                sankey_target.append(savings_idx)
-                                sankey_values.append(cashflow_value)
-                                sankey_colors.append(savings_color)
-
-                            # Create node colors list
-                            node_colors = []
-                            for label in sankey_labels:
-                                if 'Salary' in label:
-                                    node_colors.append('#2ecc71')
-                                elif 'Social Security' in label:
-                                    node_colors.append('#16a085')
-                                elif 'Investment Returns' in label:
-                                    node_colors.append('#1abc9c')
-                                elif 'Total Income' in label:
-                                    node_colors.append('#3498db')
-                                elif 'Savings' in label:
-                                    node_colors.append('#2ecc71')
-                                elif 'Deficit' in label:
-                                    node_colors.append('#e74c3c')
+                                # Add summary below Sankey
+                                total_available = year_data['total_income'] + year_data.get('investment_income', 0)
+                                if cashflow_value >= 0:
+                                    # Include investment returns in the savings calculation
+                                    total_added_to_savings = cashflow_value + year_data.get('investment_income', 0)
+                                    st.success(f"💰 **Net Addition to Savings: ${total_added_to_savings:,.0f}** ({(total_added_to_savings/total_available*100):.1f}% of total available funds)")
+                                    if year_data.get('investment_income', 0) > 0:
+                                        st.info(f"📊 Breakdown: ${cashflow_value:,.0f} from earned income surplus + ${year_data['investment_income']:,.0f} from investments")
                                 else:
-                                    node_colors.append('#95a5a6')
-
-                            # Create Sankey diagram
-                            sankey_fig = go.Figure(data=[go.Sankey(
-                                node=dict(
-                                    pad=15,
-                                    thickness=20,
-                                    line=dict(color="black", width=0.5),
-                                    label=sankey_labels,
-                                    color=node_colors,
-                                    customdata=[f"${year_data['parent1_income']:,.0f}" if i == 0 and year_data['parent1_income'] > 0 else
-                                               f"${year_data['parent2_income']:,.0f}" if 'parent2' in sankey_labels[i].lower() else
-                                               f"${val:,.0f}" for i, val in enumerate([0]*len(sankey_labels))],
-                                    hovertemplate='%{label}<br>$%{value:,.0f}<extra></extra>'
-                                ),
-                                link=dict(
-                                    source=sankey_source,
-                                    target=sankey_target,
-                                    value=sankey_values,
-                                    color=sankey_colors,
-                                    hovertemplate='%{source.label} → %{target.label}<br>$%{value:,.0f}<extra></extra>'
-                                )
-                            )])
+                                    st.error(f"⚠️ **Deficit: ${abs(cashflow_value):,.0f}** (spending {(abs(cashflow_value)/year_data['total_income']*100):.1f}% more than earned income)")
+                                    if year_data.get('investment_income', 0) > 0:
+                                        net_change = cashflow_value + year_data['investment_income']
+                                        if net_change >= 0:
+                                            st.warning(f"⚖️ Investment returns of ${year_data['investment_income']:,.0f} cover the deficit with ${net_change:,.0f} remaining")
+                                        else:
+                                            st.error(f"⚖️ Even with ${year_data['investment_income']:,.0f} investment returns, net change is ${net_change:,.0f}")
+
+                                # Detailed subcategory breakdowns
+                                st.markdown("---")
+                                st.markdown("#### 📋 Detailed Expense Breakdown - All Line Items")
+
+                                # Tax breakdown (show first - critical expense)
+                                if year_data.get('taxes', 0) > 0 and year_data.get('tax_breakdown'):
+                                    with st.expander("💸 Tax Details", expanded=True):
+                                        tax_breakdown = year_data['tax_breakdown']
+
+                                        # Show location info if available
+                                        if tax_breakdown.get('location'):
+                                            location_type = tax_breakdown.get('location_type', 'unknown')
+                                            location_emoji = '🇺🇸' if location_type == 'us_state' else ('🌍' if location_type == 'country' else '📍')
+                                            st.info(f"{location_emoji} **Tax Location:** {tax_breakdown['location']}")
+                                            if tax_breakdown.get('tax_note'):
+                                                st.caption(f"Note: {tax_breakdown['tax_note']}")
+
+                                        # Build tax table based on what taxes apply
+                                        tax_rows = []
+                                        if tax_breakdown.get('federal_income_tax', 0) > 0:
+                                            tax_rows.append({'Tax Type': 'Federal Income Tax', 'Amount': tax_breakdown['federal_income_tax']})
+                                        if tax_breakdown.get('state_tax', 0) > 0:
+                                            tax_rows.append({'Tax Type': 'State/Local Income Tax', 'Amount': tax_breakdown['state_tax']})
+                                        if tax_breakdown.get('fica_tax', 0) > 0:
+                                            tax_rows.append({'Tax Type': 'FICA (Social Security + Medicare)', 'Amount': tax_breakdown['fica_tax']})
+                                        if tax_breakdown.get('foreign_tax', 0) > 0:
+                                            tax_rows.append({'Tax Type': 'Foreign Income Tax', 'Amount': tax_breakdown['foreign_tax']})
+
+                                        if tax_rows:
+                                            tax_df = pd.DataFrame(tax_rows)
+                                            st.dataframe(tax_df, hide_index=True, use_container_width=True, column_config={'Amount': CURRENCY_COLUMN})
+
+                                        st.markdown(f"**Total Taxes: ${tax_breakdown['total_taxes']:,.0f}**")
+
+                                        # Show effective tax rate
+                                        effective_rate = (tax_breakdown['total_taxes'] / year_data['total_income'] * 100) if year_data['total_income'] > 0 else 0
+                                        st.caption(f"Effective tax rate on total income: {effective_rate:.1f}%")
+
+                                # Family Living Expenses breakdown
+                                if year_data['base_expenses'] > 0 and year_data.get('base_expenses_breakdown'):
+                                    with st.expander("🏠 Family Living Expenses Details", expanded=True):
+                                        family_breakdown = year_data['base_expenses_breakdown']
+                                        family_df = pd.DataFrame([
+                                            {'Category': k, 'Amount': v}
+                                            for k, v in family_breakdown.items() if v > 0
+                                        ])
+                                        if not family_df.empty:
+                                            st.dataframe(family_df, hide_index=True, use_container_width=True, column_config={'Amount': CURRENCY_COLUMN})
+                                            st.markdown(f"**Family Total: ${sum(family_breakdown.values()):,.0f}**")
+
+                                # Children Expenses breakdown
+                                if year_data['children_expenses'] > 0 and year_data.get('children_expense_details'):
+                                    with st.expander("👶 Children Expenses Details (Per Child)", expanded=True):
+                                        for child_detail in year_data['children_expense_details']:
+                                            st.markdown(f"### {child_detail['child_name']}")
+                                            child_df = pd.DataFrame([
+                                                {'Category': k, 'Amount': v}
+                                                for k, v in child_detail['expenses'].items() if v > 0
+                                            ])
+                                            if not child_df.empty:
+                                                st.dataframe(child_df, hide_index=True, use_container_width=True, column_config={'Amount': CURRENCY_COLUMN})
+                                                child_total = sum(child_detail['expenses'].values())
+                                                st.markdown(f"**{child_detail['child_name']} Total: ${child_total:,.0f}**")
+                                            st.markdown("")  # Add spacing
+
+                                        # Show total for all children
+                                        total_children = sum(sum(child['expenses'].values()) for child in year_data['children_expense_details'])
+                                        st.markdown(f"### **All Children Total: ${total_children:,.0f}**")
+
+                                # Healthcare Expenses breakdown
+                                if year_data.get('healthcare_expenses', 0) > 0 and year_data.get('healthcare_expense_details'):
+                                    with st.expander("🏥 Healthcare & Insurance Details", expanded=True):
+                                        healthcare_breakdown = year_data['healthcare_expense_details']
+                                        healthcare_df = pd.DataFrame([
+                                            {'Category': k, 'Amount': v}
+                                            for k, v in healthcare_breakdown.items() if v > 0
+                                        ])
+                                        if not healthcare_df.empty:
+                                            st.dataframe(healthcare_df, hide_index=True, use_container_width=True, column_config={'Amount': CURRENCY_COLUMN})
+                                            st.markdown(f"**Healthcare Total: ${sum(healthcare_breakdown.values()):,.0f}**")
+
+                                # House Expenses breakdown
+                                if year_data.get('house_expenses', 0) > 0 and year_data.get('house_expense_details'):
+                                    with st.expander("🏡 House Expenses Details", expanded=True):
+                                        for house_detail in year_data['house_expense_details']:
+                                            st.markdown(f"### {house_detail['name']}")
+                                            house_df = pd.DataFrame([
+                                                {'Category': 'Property Tax', 'Amount': house_detail['property_tax']},
+                                                {'Category': 'Home Insurance', 'Amount': house_detail['home_insurance']},
+                                                {'Category': 'Maintenance', 'Amount': house_detail['maintenance']},
+                                                {'Category': 'Upkeep', 'Amount': house_detail['upkeep']}
+                                            ])
+                                            st.dataframe(house_df, hide_index=True, use_container_width=True, column_config={'Amount': CURRENCY_COLUMN})
+                                            house_total = house_detail['property_tax'] + house_detail['home_insurance'] + house_detail['maintenance'] + house_detail['upkeep']
+                                            st.markdown(f"**{house_detail['name']} Total: ${house_total:,.0f}**")
+                                            st.markdown("")  # Add spacing
+
+                                        # Show total for all houses
+                                        if len(year_data['house_expense_details']) > 1:
+                                            total_houses = sum(
+                                                h['property_tax'] + h['home_insurance'] + h['maintenance'] + h['upkeep']
+                                                for h in year_data['house_expense_details']
+                                            )
+                                            st.markdown(f"### **All Houses Total: ${total_houses:,.0f}**")
+
+                                # Recurring Expenses breakdown
+                                if year_data.get('recurring_expenses', 0) > 0 and year_data.get('recurring_expense_details'):
+                                    with st.expander("🔁 Recurring Expenses Details", expanded=True):
+                                        recurring_df = pd.DataFrame([
+                                            {'Item': item['name'], 'Amount': item['amount']}
+                                            for item in year_data['recurring_expense_details']
+                                        ])
+                                        st.dataframe(recurring_df, hide_index=True, use_container_width=True, column_config={'Amount': CURRENCY_COLUMN})
+                                        total_recurring = sum(item['amount'] for item in year_data['recurring_expense_details'])
+                                        st.markdown(f"**Recurring Total: ${total_recurring:,.0f}**")
+
+                                # One-Time Major Purchases breakdown
+                                if year_data.get('major_purchases', 0) > 0 and year_data.get('major_purchase_details'):
+                                    with st.expander("🛒 One-Time Major Purchases Details", expanded=True):
+                                        purchases_df = pd.DataFrame([
+                                            {'Item': item['name'], 'Amount': item['amount']}
+                                            for item in year_data['major_purchase_details']
+                                        ])
+                                        st.dataframe(purchases_df, hide_index=True, use_container_width=True, column_config={'Amount': CURRENCY_COLUMN})
+                                        total_purchases = sum(item['amount'] for item in year_data['major_purchase_details'])
+                                        st.markdown(f"**Purchases Total: ${total_purchases:,.0f}**")
 
-                            sankey_fig.update_layout(
-                                title=f"Money Flow for {st.session_state.selected_cashflow_year}",
-                                font=dict(size=12),
-                                height=600,
-                                margin=dict(l=20, r=20, t=40, b=20)
-                            )
+                                else:
+                                    st.info("No expenses for this year")
 
-                            st.plotly_chart(sankey_fig, use_container_width=True)
+                            # Comprehensive expense summary table
+                            if expense_breakdown:
+                                st.markdown("---")
+                                st.markdown("#### 💰 Complete Expense Summary")
 
-                            # Add summary below Sankey
-                            total_available = year_data['total_income'] + year_data.get('investment_income', 0)
-                            if cashflow_value >= 0:
-                                # Include investment returns in the savings calculation
-                                total_added_to_savings = cashflow_value + year_data.get('investment_income', 0)
-                                st.success(f"💰 **Net Addition to Savings: ${total_added_to_savings:,.0f}** ({(total_added_to_savings/total_available*100):.1f}% of total available funds)")
-                                if year_data.get('investment_income', 0) > 0:
-                                    st.info(f"📊 Breakdown: ${cashflow_value:,.0f} from earned income surplus + ${year_data['investment_income']:,.0f} from investments")
-                            else:
-                                st.error(f"⚠️ **Deficit: ${abs(cashflow_value):,.0f}** (spending {(abs(cashflow_value)/year_data['total_income']*100):.1f}% more than earned income)")
-                                if year_data.get('investment_income', 0) > 0:
-                                    net_change = cashflow_value + year_data['investment_income']
-                                    if net_change >= 0:
-                                        st.warning(f"⚖️ Investment returns of ${year_data['investment_income']:,.0f} cover the deficit with ${net_change:,.0f} remaining")
-                                    else:
-                                        st.error(f"⚖️ Even with ${year_data['investment_income']:,.0f} investment returns, net change is ${net_change:,.0f}")
+                                # Build comprehensive summary
+                                summary_data = []
 
-                            # Detailed subcategory breakdowns
-                            st.markdown("---")
-                            st.markdown("#### 📋 Detailed Expense Breakdown - All Line Items")
-
-                            # Tax breakdown (show first - critical expense)
-                            if year_data.get('taxes', 0) > 0 and year_data.get('tax_breakdown'):
-                                with st.expander("💸 Tax Details", expanded=True):
-                                    tax_breakdown = year_data['tax_breakdown']
-
-                                    # Show location info if available
-                                    if tax_breakdown.get('location'):
-                                        location_type = tax_breakdown.get('location_type', 'unknown')
-                                        location_emoji = '🇺🇸' if location_type == 'us_state' else ('🌍' if location_type == 'country' else '📍')
-                                        st.info(f"{location_emoji} **Tax Location:** {tax_breakdown['location']}")
-                                        if tax_breakdown.get('tax_note'):
-                                            st.caption(f"Note: {tax_breakdown['tax_note']}")
-
-                                    # Build tax table based on what taxes apply
-                                    tax_rows = []
-                                    if tax_breakdown.get('federal_income_tax', 0) > 0:
-                                        tax_rows.append({'Tax Type': 'Federal Income Tax', 'Amount': f"${tax_breakdown['federal_income_tax']:,.0f}"})
-                                    if tax_breakdown.get('state_tax', 0) > 0:
-                                        tax_rows.append({'Tax Type': 'State/Local Income Tax', 'Amount': f"${tax_breakdown['state_tax']:,.0f}"})
-                                    if tax_breakdown.get('fica_tax', 0) > 0:
-                                        tax_rows.append({'Tax Type': 'FICA (Social Security + Medicare)', 'Amount': f"${tax_breakdown['fica_tax']:,.0f}"})
-                                    if tax_breakdown.get('foreign_tax', 0) > 0:
-                                        tax_rows.append({'Tax Type': 'Foreign Income Tax', 'Amount': f"${tax_breakdown['foreign_tax']:,.0f}"})
-
-                                    if tax_rows:
-                                        tax_df = pd.DataFrame(tax_rows)
-                                        st.dataframe(tax_df, hide_index=True, use_container_width=True)
-
-                                    st.markdown(f"**Total Taxes: ${tax_breakdown['total_taxes']:,.0f}**")
-
-                                    # Show effective tax rate
-                                    effective_rate = (tax_breakdown['total_taxes'] / year_data['total_income'] * 100) if year_data['total_income'] > 0 else 0
-                                    st.caption(f"Effective tax rate on total income: {effective_rate:.1f}%")
-
-                            # Family Living Expenses breakdown
-                            if year_data['base_expenses'] > 0 and year_data.get('base_expenses_breakdown'):
-                                with st.expander("🏠 Family Living Expenses Details", expanded=True):
-                                    family_breakdown = year_data['base_expenses_breakdown']
-                                    family_df = pd.DataFrame([
-                                        {'Category': k, 'Amount': f"${v:,.0f}"}
-                                        for k, v in family_breakdown.items() if v > 0
-                                    ])
-                                    if not family_df.empty:
-                                        st.dataframe(family_df, hide_index=True, use_container_width=True)
-                                        st.markdown(f"**Family Total: ${sum(family_breakdown.values()):,.0f}**")
-
-                            # Children Expenses breakdown
-                            if year_data['children_expenses'] > 0 and year_data.get('children_expense_details'):
-                                with st.expander("👶 Children Expenses Details (Per Child)", expanded=True):
+                                # Family expenses
+                                if year_data['base_expenses'] > 0 and year_data.get('base_expenses_breakdown'):
+                                    summary_data.append({'Category': '🏠 FAMILY LIVING EXPENSES', 'Amount': year_data['base_expenses']})
+                                    for k, v in year_data['base_expenses_breakdown'].items():
+                                        if v > 0:
+                                            summary_data.append({'Category': f"   • {k}", 'Amount': v})
+
+                                # Children expenses
+                                if year_data['children_expenses'] > 0 and year_data.get('children_expense_details'):
+                                    summary_data.append({'Category': '👶 CHILDREN EXPENSES', 'Amount': year_data['children_expenses']})
                                     for child_detail in year_data['children_expense_details']:
-                                        st.markdown(f"### {child_detail['child_name']}")
-                                        child_df = pd.DataFrame([
-                                            {'Category': k, 'Amount': f"${v:,.0f}"}
-                                            for k, v in child_detail['expenses'].items() if v > 0
-                                        ])
-                                        if not child_df.empty:
-                                            st.dataframe(child_df, hide_index=True, use_container_width=True)
-                                            child_total = sum(child_detail['expenses'].values())
-                                            st.markdown(f"**{child_detail['child_name']} Total: ${child_total:,.0f}**")
-                                        st.markdown("")  # Add spacing
-
-                                    # Show total for all children
-                                    total_children = sum(sum(child['expenses'].values()) for child in year_data['children_expense_details'])
-                                    st.markdown(f"### **All Children Total: ${total_children:,.0f}**")
-
-                            # Healthcare Expenses breakdown
-                            if year_data.get('healthcare_expenses', 0) > 0 and year_data.get('healthcare_expense_details'):
-                                with st.expander("🏥 Healthcare & Insurance Details", expanded=True):
-                                    healthcare_breakdown = year_data['healthcare_expense_details']
-                                    healthcare_df = pd.DataFrame([
-                                        {'Category': k, 'Amount': f"${v:,.0f}"}
-                                        for k, v in healthcare_breakdown.items() if v > 0
-                                    ])
-                                    if not healthcare_df.empty:
-                                        st.dataframe(healthcare_df, hide_index=True, use_container_width=True)
-                                        st.markdown(f"**Healthcare Total: ${sum(healthcare_breakdown.values()):,.0f}**")
-
-                            # House Expenses breakdown
-                            if year_data.get('house_expenses', 0) > 0 and year_data.get('house_expense_details'):
-                                with st.expander("🏡 House Expenses Details", expanded=True):
+                                        child_total = sum(child_detail['expenses'].values())
+                                        summary_data.append({'Category': f"   {child_detail['child_name']}:", 'Amount': child_total})
+                                        for k, v in child_detail['expenses'].items():
+                                            if v > 0:
+                                                summary_data.append({'Category': f"      • {k}", 'Amount': v})
+
+                                # Healthcare expenses
+                                if year_data.get('healthcare_expenses', 0) > 0 and year_data.get('healthcare_expense_details'):
+                                    summary_data.append({'Category': '🏥 HEALTHCARE & INSURANCE', 'Amount': year_data['healthcare_expenses']})
+                                    for k, v in year_data['healthcare_expense_details'].items():
+                                        if v > 0:
+                                            summary_data.append({'Category': f"   • {k}", 'Amount': v})
+
+                                # House expenses
+                                if year_data.get('house_expenses', 0) > 0 and year_data.get('house_expense_details'):
+                                    summary_data.append({'Category': '🏡 HOUSE EXPENSES', 'Amount': year_data['house_expenses']})
                                     for house_detail in year_data['house_expense_details']:
-                                        st.markdown(f"### {house_detail['name']}")
-                                        house_df = pd.DataFrame([
-                                            {'Category': 'Property Tax', 'Amount': f"${house_detail['property_tax']:,.0f}"},
-                                            {'Category': 'Home Insurance', 'Amount': f"${house_detail['home_insurance']:,.0f}"},
-                                            {'Category': 'Maintenance', 'Amount': f"${house_detail['maintenance']:,.0f}"},
-                                            {'Category': 'Upkeep', 'Amount': f"${house_detail['upkeep']:,.0f}"}
-                                        ])
-                                        st.dataframe(house_df, hide_index=True, use_container_width=True)
                                         house_total = house_detail['property_tax'] + house_detail['home_insurance'] + house_detail['maintenance'] + house_detail['upkeep']
-                                        st.markdown(f"**{house_detail['name']} Total: ${house_total:,.0f}**")
-                                        st.markdown("")  # Add spacing
-
-                                    # Show total for all houses
-                                    if len(year_data['house_expense_details']) > 1:
-                                        total_houses = sum(
-                                            h['property_tax'] + h['home_insurance'] + h['maintenance'] + h['upkeep']
-                                            for h in year_data['house_expense_details']
-                                        )
-                                        st.markdown(f"### **All Houses Total: ${total_houses:,.0f}**")
-
-                            # Recurring Expenses breakdown
-                            if year_data.get('recurring_expenses', 0) > 0 and year_data.get('recurring_expense_details'):
-                                with st.expander("🔁 Recurring Expenses Details", expanded=True):
-                                    recurring_df = pd.DataFrame([
-                                        {'Item': item['name'], 'Amount': f"${item['amount']:,.0f}"}
-                                        for item in year_data['recurring_expense_details']
-                                    ])
-                                    st.dataframe(recurring_df, hide_index=True, use_container_width=True)
-                                    total_recurring = sum(item['amount'] for item in year_data['recurring_expense_details'])
-                                    st.markdown(f"**Recurring Total: ${total_recurring:,.0f}**")
-
-                            # One-Time Major Purchases breakdown
-                            if year_data.get('major_purchases', 0) > 0 and year_data.get('major_purchase_details'):
-                                with st.expander("🛒 One-Time Major Purchases Details", expanded=True):
-                                    purchases_df = pd.DataFrame([
-                                        {'Item': item['name'], 'Amount': f"${item['amount']:,.0f}"}
-                                        for item in year_data['major_purchase_details']
-                                    ])
-                                    st.dataframe(purchases_df, hide_index=True, use_container_width=True)
-                                    total_purchases = sum(item['amount'] for item in year_data['major_purchase_details'])
-                                    st.markdown(f"**Purchases Total: ${total_purchases:,.0f}**")
+                                        summary_data.append({'Category': f"   {house_detail['name']}:", 'Amount': house_total})
+                                        summary_data.append({'Category': f"      • Property Tax", 'Amount': house_detail['property_tax']})
+                                        summary_data.append({'Category': f"      • Home Insurance", 'Amount': house_detail['home_insurance']})
+                                        summary_data.append({'Category': f"      • Maintenance", 'Amount': house_detail['maintenance']})
+                                        summary_data.append({'Category': f"      • Upkeep", 'Amount': house_detail['upkeep']})
+
+                                # Recurring expenses
+                                if year_data.get('recurring_expenses', 0) > 0 and year_data.get('recurring_expense_details'):
+                                    summary_data.append({'Category': '🔁 RECURRING EXPENSES', 'Amount': year_data['recurring_expenses']})
+                                    for item in year_data['recurring_expense_details']:
+                                        summary_data.append({'Category': f"   • {item['name']}", 'Amount': item['amount']})
+
+                                # Major purchases
+                                if year_data.get('major_purchases', 0) > 0 and year_data.get('major_purchase_details'):
+                                    summary_data.append({'Category': '🛒 ONE-TIME PURCHASES', 'Amount': year_data['major_purchases']})
+                                    for item in year_data['major_purchase_details']:
+                                        summary_data.append({'Category': f"   • {item['name']}", 'Amount': item['amount']})
+
+                                # Display the comprehensive summary
+                                if summary_data:
+                                    summary_df = pd.DataFrame(summary_data)
+                                    st.dataframe(summary_df, hide_index=True, use_container_width=True, height=min(600, len(summary_data) * 35 + 38), column_config={'Amount': CURRENCY_COLUMN})
+                                    st.markdown(f"### **TOTAL EXPENSES: ${year_data['total_expenses']:,.0f}**")
+
+                            # Show summary metrics
+                            st.markdown("#### 📈 Year Summary")
+                            sum_col1, sum_col2, sum_col3, sum_col4 = st.columns(4)
+                            with sum_col1:
+                                st.metric("Ages", f"{year_data['parent1_age']} / {year_data['parent2_age']}")
+                            with sum_col2:
+                                cashflow_val = year_data['cashflow']
+                                cashflow_delta = "Surplus" if cashflow_val >= 0 else "Deficit"
+                                st.metric("Cashflow", f"${abs(cashflow_val):,.0f}", cashflow_delta)
+                            with sum_col3:
+                                st.metric("Net Worth", f"${year_data['net_worth']:,.0f}")
+                            with sum_col4:
+                                if year_data['children_in_college']:
+                                    st.metric("In College", ", ".join(year_data['children_in_college']))
+                                else:
+                                    st.metric("In College", "None")
+
+            if cashflow_tab2.open:
+                with cashflow_tab2:
+                    # Critical Years Table
+                    st.subheader("Critical Years Analysis")
+                    critical_years_data = []
+                    for d in cashflow_data:
+                        if d['cashflow'] < 0 or d['net_worth'] < 0 or d['children_in_college'] or any(e[0] in ['retirement', 'job_change'] for e in d['events']):
+                            critical_years_data.append({
+                                'Year': d['year'],
+                                'Ages': f"{d['parent1_age']} / {d['parent2_age']}",
+                                'Cashflow': d['cashflow'],
+                                'Net Worth': d['net_worth'],
+                                'Events': ', '.join([f"{e[1]}" if len(e) > 1 else e[0] for e in d['events']]) if d['events'] else '-',
+                                'In College': ', '.join(d['children_in_college']) if d['children_in_college'] else '-'
+                            })
+
+                    if critical_years_data:
+                        critical_df = pd.DataFrame(critical_years_data)
+                        # Fixed column widths so the grid doesn't measure every row's text to size them
+                        st.dataframe(critical_df, use_container_width=True, hide_index=True, height=400,
+                                     column_config={
+                                         'Year': st.column_config.NumberColumn(width="small", format="%d"),
+                                         'Ages': st.column_config.TextColumn(width="small"),
+                                         'Cashflow': st.column_config.NumberColumn(width="small", format="dollar", step=1),
+                                         'Net Worth': st.column_config.NumberColumn(width="small", format="dollar", step=1),
+                                         'Events': st.column_config.TextColumn(width="large"),
+                                         'In College': st.column_config.TextColumn(width="medium"),
+                                     })
+                    else:
+                        st.info("No critical years identified in your plan.")
 
-                            else:
-                                st.info("No expenses for this year")
+            if cashflow_tab3.open:
+                with cashflow_tab3:
+                    # Life Stages View
+                    st.subheader("Life Stages Financial Summary")
 
-                        # Comprehensive expense summary table
-                        if expense_breakdown:
-                            st.markdown("---")
-                            st.markdown("#### 💰 Complete Expense Summary")
-
-                            # Build comprehensive summary
-                            summary_data = []
-
-                            # Family expenses
-                            if year_data['base_expenses'] > 0 and year_data.get('base_expenses_breakdown'):
-                                summary_data.append({'Category': '🏠 FAMILY LIVING EXPENSES', 'Amount': f"${year_data['base_expenses']:,.0f}"})
-                                for k, v in year_data['base_expenses_breakdown'].items():
-                                    if v > 0:
-                                        summary_data.append({'Category': f"   • {k}", 'Amount': f"${v:,.0f}"})
-
-                            # Children expenses
-                            if year_data['children_expenses'] > 0 and year_data.get('children_expense_details'):
-                                summary_data.append({'Category': '👶 CHILDREN EXPENSES', 'Amount': f"${year_data['children_expenses']:,.0f}"})
-                                for child_detail in year_data['children_expense_details']:
-                                    child_total = sum(child_detail['expenses'].values())
-                                    summary_data.append({'Category': f"   {child_detail['child_name']}:", 'Amount': f"${child_total:,.0f}"})
-                                    for k, v in child_detail['expenses'].items():
-                                        if v > 0:
-                                            summary_data.append({'Category': f"      • {k}", 'Amount': f"${v:,.0f}"})
-
-                            # Healthcare expenses
-                            if year_data.get('healthcare_expenses', 0) > 0 and year_data.get('healthcare_expense_details'):
-                                summary_data.append({'Category': '🏥 HEALTHCARE & INSURANCE', 'Amount': f"${year_data['healthcare_expenses']:,.0f}"})
-                                for k, v in year_data['healthcare_expense_details'].items():
-                                    if v > 0:
-                                        summary_data.append({'Category': f"   • {k}", 'Amount': f"${v:,.0f}"})
-
-                            # House expenses
-                            if year_data.get('house_expenses', 0) > 0 and year_data.get('house_expense_details'):
-                                summary_data.append({'Category': '🏡 HOUSE EXPENSES', 'Amount': f"${year_data['house_expenses']:,.0f}"})
-                                for house_detail in year_data['house_expense_details']:
-                                    house_total = house_detail['property_tax'] + house_detail['home_insurance'] + house_detail['maintenance'] + house_detail['upkeep']
-                                    summary_data.append({'Category': f"   {house_detail['name']}:", 'Amount': f"${house_total:,.0f}"})
-                                    summary_data.append({'Category': f"      • Property Tax", 'Amount': f"${house_detail['property_tax']:,.0f}"})
-                                    summary_data.append({'Category': f"      • Home Insurance", 'Amount': f"${house_detail['home_insurance']:,.0f}"})
-                                    summary_data.append({'Category': f"      • Maintenance", 'Amount': f"${house_detail['maintenance']:,.0f}"})
-                                    summary_data.append({'Category': f"      • Upkeep", 'Amount': f"${house_detail['upkeep']:,.0f}"})
-
-                            # Recurring expenses
-                            if year_data.get('recurring_expenses', 0) > 0 and year_data.get('recurring_expense_details'):
-                                summary_data.append({'Category': '🔁 RECURRING EXPENSES', 'Amount': f"${year_data['recurring_expenses']:,.0f}"})
-                                for item in year_data['recurring_expense_details']:
-                                    summary_data.append({'Category': f"   • {item['name']}", 'Amount': f"${item['amount']:,.0f}"})
-
-                            # Major purchases
-                            if year_data.get('major_purchases', 0) > 0 and year_data.get('major_purchase_details'):
-                                summary_data.append({'Category': '🛒 ONE-TIME PURCHASES', 'Amount': f"${year_data['major_purchases']:,.0f}"})
-                                for item in year_data['major_purchase_details']:
-                                    summary_data.append({'Category': f"   • {item['name']}", 'Amount': f"${item['amount']:,.0f}"})
-
-                            # Display the comprehensive summary
-                            if summary_data:
-                                summary_df = pd.DataFrame(summary_data)
-                                st.dataframe(summary_df, hide_index=True, use_container_width=True, height=min(600, len(summary_data) * 35 + 38))
-                                st.markdown(f"### **TOTAL EXPENSES: ${year_data['total_expenses']:,.0f}**")
-
-                        # Show summary metrics
-                        st.markdown("#### 📈 Year Summary")
-                        sum_col1, sum_col2, sum_col3, sum_col4 = st.columns(4)
-                        with sum_col1:
-                            st.metric("Ages", f"{year_data['parent1_age']} / {year_data['parent2_age']}")
-                        with sum_col2:
-                            cashflow_val = year_data['cashflow']
-                            cashflow_delta = "Surplus" if cashflow_val >= 0 else "Deficit"
-                            st.metric("Cashflow", f"${abs(cashflow_val):,.0f}", cashflow_delta)
-                        with sum_col3:
-                            st.metric("Net Worth", f"${year_data['net_worth']:,.0f}")
-                        with sum_col4:
-                            if year_data['children_in_college']:
-                                st.metric("In College", ", ".join(year_data['children_in_college']))
-                            else:
-                                st.metric("In College", "None")
-
-            with cashflow_tab2:
-                # Critical Years Table
-                st.subheader("Critical Years Analysis")
-                critical_years_data = []
-                for d in cashflow_data:
-                    if d['cashflow'] < 0 or d['net_worth'] < 0 or d['children_in_college'] or any(e[0] in ['retirement', 'job_change'] for e in d['events']):
-                        critical_years_data.append({
-                            'Year': d['year'],
-                            'Ages': f"{d['parent1_age']} / {d['parent2_age']}",
-                            'Cashflow': f"${d['cashflow']:,.0f}",
-                            'Net Worth': f"${d['net_worth']:,.0f}",
-                            'Events': ', '.join([f"{e[1]}" if len(e) > 1 else e[0] for e in d['events']]) if d['events'] else '-',
-                            'In College': ', '.join(d['children_in_college']) if d['children_in_college'] else '-'
-                        })
+                    stages = {
+                        'Working Years (Pre-Retirement)': [],
+                        'Early Retirement': [],
+                        'Late Retirement': []
+                    }
 
-                if critical_years_data:
-                    critical_df = pd.DataFrame(critical_years_data)
-                    st.dataframe(critical_df, use_container_width=True, hide_index=True, height=400)
-                else:
-                    st.info("No critical years identified in your plan.")
+                    for d in cashflow_data:
+                        parent1_retired = d['parent1_age'] >= st.session_state.parentX_retirement_age
+                        parent2_retired = d['parent2_age'] >= st.session_state.parentY_retirement_age
+                        both_retired = parent1_retired and parent2_retired
 
-            with cashflow_tab3:
-                # Life Stages View
-                st.subheader("Life Stages Financial Summary")
+                        if not both_retired:
+                            stages['Working Years (Pre-Retirement)'].append(d)
+                        elif d['parent1_age'] < 75 and d['parent2_age'] < 75:
+                            stages['Early Retirement'].append(d)
+                        else:
+                            stages['Late Retirement'].append(d)
+
+                    for stage_name, stage_data in stages.items():
+                        if stage_data:
+                            st.markdown(f"### {stage_name}")
+                            avg_income = sum(d['total_income'] for d in stage_data) / len(stage_data)
+                            avg_expenses = sum(d['total_expenses'] for d in stage_data) / len(stage_data)
+                            avg_cashflow = sum(d['cashflow'] for d in stage_data) / len(stage_data)
+
+                            col1, col2, col3, col4 = st.columns(4)
+                            with col1:
+                                st.metric("Years", len(stage_data))
+                            with col2:
+                                st.metric("Avg Income", f"${avg_income:,.0f}")
+                            with col3:
+                                st.metric("Avg Expenses", f"${avg_expenses:,.0f}")
+                            with col4:
+                                st.metric("Avg Cashflow", f"${avg_cashflow:,.0f}")
+        else:
+            st.warning("No cashflow data available. Please configure your financial details first.")
+    else:
+        st.warning("⚠️ No cashflow data calculated yet. Click the button above to generate your lifetime cashflow analysis.")
 
-                stages = {
-                    'Working Years (Pre-Retirement)': [],
-                    'Early Retirement': [],
-                    'Late Retirement': []
-                }
 
-                for d in cashflow_data:
-                    parent1_retired = d['parent1_age'] >= st.session_state.parentX_retirement_age
-                    parent2_retired = d['parent2_age'] >= st.session_state.parentY_retirement_age
-                    both_retired = parent1_retired and parent2_retired
 
-                    if not both_retired:
-                        stages['Working Years (Pre-Retirement)'].append(d)
-                    elif d['parent1_age'] < 75 and d['parent2_age'] < 75:
-                        stages['Early Retirement'].append(d)
-                    else:
-                        stages['Late Retirement'].append(d)
-
-                for stage_name, stage_data in stages.items():
-                    if stage_data:
-                        st.markdown(f"### {stage_name}")
-                        avg_income = sum(d['total_income'] for d in stage_data) / len(stage_data)
-                        avg_expenses = sum(d['total_expenses'] for d in stage_data) / len(stage_data)
-                        avg_cashflow = sum(d['cashflow'] for d in stage_data) / len(stage_data)
-
-                        col1, col2, col3, col4 = st.columns(4)
-                        with col1:
-                            st.metric("Years", len(stage_data))
-                        with col2:
-                            st.metric("Avg Income", f"${avg_income:,.0f}")
-                        with col3:
-                            st.metric("Avg Expenses", f"${avg_expenses:,.0f}")
-                        with col4:
-                            st.metric("Avg Cashflow", f"${avg_cashflow:,.0f}")
+def _monte_carlo_year_components(start_year: int, num_years: int) -> dict:
+    """
+    Deterministic per-year income and expense components for the Monte Carlo run.
+
+    None of these depend on the random draws, so they are projected once per
+    year rather than once per simulated path. Each component is built as
+    array arithmetic over the projection years (one pass per recurring
+    expense, insurance policy or house, not per year).
+
+    Returns:
+        dict: component name -> np.ndarray of length num_years
+    """
+    current_year = st.session_state.current_year
+    parentX_base = sum(st.session_state.parentX_expenses.values())
+    parentY_base = sum(st.session_state.parentY_expenses.values())
+    family_shared = dict(st.session_state.family_shared_expenses)
+    family_base = sum(family_shared.values())
+    # Living in an owned house → no rent
+    family_shared['Mortgage/Rent'] = 0.0
+    family_base_owned = sum(family_shared.values())
+    houses = st.session_state.get('houses', [])
+    health_insurances = st.session_state.get('health_insurances', [])
+    ltc_insurances = st.session_state.get('ltc_insurances', [])
+    has_medicare = 'medicare_part_b_premium' in st.session_state
+
+    years = np.arange(start_year, start_year + num_years)
+    components = {}
+
+    # Base expenses only grow with inflation
+    inflation_factors = np.array(growth_factors(st.session_state.economic_params.inflation_rate, start_year - current_year, num_years))
+    components['parentX_expenses'] = parentX_base * inflation_factors
+    components['parentY_expenses'] = parentY_base * inflation_factors
+    components['children_expenses'] = get_children_expense_totals(start_year, num_years)
+
+    # Parent income includes Social Security once retired; only employment income is varied
+    parent1_income, parent2_income, parent1_ss, parent2_ss = np.array(
+        get_household_income_for_years(range(start_year, start_year + num_years)), dtype=float).reshape(num_years, 4).T
+    components['employment_income'] = parent1_income + parent2_income
+    components['ss_income'] = parent1_ss + parent2_ss
+    components['parent1_income'] = parent1_income + parent1_ss
+    components['parent2_income'] = parent2_income + parent2_ss
+
+    house_statuses = [house.get_statuses_for_years(range(start_year, start_year + num_years)) for house in houses]
+    house_status_arrays = [np.array([status for status, _rental in statuses]) for statuses in house_statuses]
+    lives_owned = np.zeros(num_years, dtype=bool)
+    for statuses in house_status_arrays:
+        lives_owned |= statuses == "Own_Live"
+    components['family_expenses'] = np.where(lives_owned, family_base_owned, family_base) * inflation_factors
+
+    recurring_total = np.zeros(num_years)
+    for recurring in st.session_state.recurring_expenses:
+        years_since_start = years - recurring.start_year
+        due = (years_since_start >= 0) & (years_since_start % recurring.frequency_years == 0)
+        if recurring.end_year is not None:
+            due &= years <= recurring.end_year
+        recurring_total += due * (recurring.amount * inflation_factors if recurring.inflation_adjust else recurring.amount)
+    components['recurring_expenses'] = recurring_total
+
+    major_purchases = np.zeros(num_years)
+    for purchase in st.session_state.major_purchases:
+        if start_year <= purchase.year < start_year + num_years:
+            major_purchases[purchase.year - start_year] += purchase.amount
+    components['major_purchases'] = major_purchases
+
+    # Healthcare: insurance premiums, Medicare (65+), long-term care premiums
+    healthcare = np.zeros(num_years)
+    parent1_age = st.session_state.parentX_age + (years - current_year)
+    parent2_age = st.session_state.parentY_age + (years - current_year)
+    for insurance in health_insurances:
+        parent1_covered = (insurance.start_age <= parent1_age) & (parent1_age <= insurance.end_age)
+        parent2_covered = (insurance.start_age <= parent2_age) & (parent2_age <= insurance.end_age)
+        if insurance.covered_by == "Parent 1":
+            covered = parent1_covered
+        elif insurance.covered_by == "Parent 2":
+            covered = parent2_covered
+        elif insurance.covered_by in ["Both", "Family"]:
+            covered = parent1_covered | parent2_covered
         else:
-            st.warning("No cashflow data available. Please configure your financial details first.")
+            continue
+        healthcare += covered * (insurance.monthly_premium * 12)
+    if has_medicare:
+        medicare_per_person = (st.session_state.medicare_part_b_premium * 12
+                               + st.session_state.get('medicare_part_d_premium', 55.0) * 12
+                               + st.session_state.get('medigap_premium', 150.0) * 12)
+        healthcare += ((parent1_age >= 65).astype(float) + (parent2_age >= 65)) * medicare_per_person
+    for ltc in ltc_insurances:
+        if ltc.covered_person == "Parent 1":
+            healthcare += (parent1_age >= ltc.start_age) * (ltc.monthly_premium * 12)
+        elif ltc.covered_person == "Parent 2":
+            healthcare += (parent2_age >= ltc.start_age) * (ltc.monthly_premium * 12)
+    components['healthcare_expenses'] = healthcare
+
+    # Housing: property tax, insurance, maintenance, upkeep
+    house_total = np.zeros(num_years)
+    for house, statuses in zip(houses, house_status_arrays):
+        owned = (statuses == "Own_Live") | (statuses == "Own_Rent")
+        current_house_value = house.current_value * np.array(
+            growth_factors(getattr(house, 'appreciation_rate', 3.0) / 100, start_year - current_year, num_years))
+        house_total += owned * (current_house_value * house.property_tax_rate
+                                + house.home_insurance * inflation_factors
+                                + current_house_value * house.maintenance_rate
+                                + house.upkeep_costs * inflation_factors)
+    components['house_expenses'] = house_total
+
+    return components
+
+
+# Smallest share of paths worth handing to its own worker thread
+MC_PATHS_PER_WORKER = 5000
+
+
+def _variability_multipliers(rng, size: tuple, positive_pct: float, negative_pct: float) -> np.ndarray:
+    """Random multipliers: a coin flip picks an upswing of up to positive_pct or a downswing of up to negative_pct."""
+    upside = rng.random(size) > 0.5
+    return np.where(upside,
+                    1 + rng.uniform(0, positive_pct / 100, size),
+                    1 - rng.uniform(0, negative_pct / 100, size))
+
+
+def _draw_multipliers(rng, size: tuple, use_asymmetric: bool, variability: list) -> list:
+    """One multiplier array per (positive_pct, negative_pct) pair; symmetric draws use the positive bound both ways."""
+    if use_asymmetric:
+        return [_variability_multipliers(rng, size, positive_pct, negative_pct) for positive_pct, negative_pct in variability]
+    return [1 + rng.uniform(-positive_pct / 100, positive_pct / 100, size) for positive_pct, _ in variability]
+
+
+def _draw_multipliers_threaded(seed: Optional[int], size: tuple, use_asymmetric: bool, variability: list) -> list:
+    """
+    _draw_multipliers with the paths drawn in blocks on worker threads.
+
+    Each block of MC_PATHS_PER_WORKER paths gets its own generator spawned
+    from the seed, so a seed gives the same draws whatever the core count.
+    """
+    num_sims, num_years = size
+    blocks = max(1, -(-num_sims // MC_PATHS_PER_WORKER))
+    rngs = [np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(blocks)]
+    if blocks == 1:
+        return _draw_multipliers(rngs[0], size, use_asymmetric, variability)
+
+    bounds = np.linspace(0, num_sims, blocks + 1).astype(int)
+    multipliers = [np.empty(size) for _ in variability]
+
+    def draw_block(rng, lo, hi):
+        for out, block in zip(multipliers, _draw_multipliers(rng, (hi - lo, num_years), use_asymmetric, variability)):
+            out[lo:hi] = block
+
+    with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, blocks)) as executor:
+        list(executor.map(draw_block, rngs, bounds[:-1], bounds[1:]))
+    return multipliers
+
+
+def _simulate_trajectories_vectorized(cashflows: np.ndarray, returns: np.ndarray, initial_net_worth: float) -> np.ndarray:
+    """Net worth paths (num_sims, num_years): each year nw += cashflow + nw * return, all paths at once."""
+    # Step through year-major copies so each year's slice is contiguous
+    cashflows_by_year = np.ascontiguousarray(cashflows.T)
+    returns_by_year = np.ascontiguousarray(returns.T)
+    trajectories = np.empty(cashflows_by_year.shape)
+    net_worth = np.full(cashflows.shape[0], initial_net_worth)
+    for j in range(cashflows_by_year.shape[0]):
+        net_worth = net_worth + cashflows_by_year[j] + net_worth * returns_by_year[j]
+        trajectories[j] = net_worth
+    return trajectories.T
+
+
+def _simulate_trajectories_threaded(cashflows: np.ndarray, returns: np.ndarray, initial_net_worth: float) -> np.ndarray:
+    """_simulate_trajectories_vectorized with the paths split across CPU cores (NumPy releases the GIL)."""
+    num_sims = cashflows.shape[0]
+    workers = min(os.cpu_count() or 1, num_sims // MC_PATHS_PER_WORKER)
+    if workers < 2:
+        return _simulate_trajectories_vectorized(cashflows, returns, initial_net_worth)
+    bounds = np.linspace(0, num_sims, workers + 1).astype(int)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        chunks = executor.map(lambda lo, hi: _simulate_trajectories_vectorized(cashflows[lo:hi], returns[lo:hi], initial_net_worth),
+                              bounds[:-1], bounds[1:])
+        return np.vstack(list(chunks))
+
+
+if NUMBA_AVAILABLE:
+    _simulate_trajectories = mc_kernels.simulate_trajectories
+else:
+    _simulate_trajectories = _simulate_trajectories_threaded
+
+
+def run_monte_carlo_simulation(num_sims: int, use_asymmetric: bool = True, seed: Optional[int] = None) -> dict:
+    """
+    Monte Carlo net worth projection for the current plan.
+
+    Income and expense components are projected once per year; all random
+    draws are made up front as (num_sims, num_years) arrays (in blocks across
+    worker threads), and net worth is advanced for every simulated path at
+    once. Pass a seed for reproducible draws.
+
+    Returns:
+        dict: years, percentiles, scenario and all_simulations (the layout
+        stored in st.session_state.mc_results); all_simulations is a
+        (num_sims, num_years) float32 array of net worth paths, downcast
+        after the percentiles are taken at full precision
+    """
+    scenario = st.session_state.economic_params
+    start_year = st.session_state.mc_start_year
+    num_years = st.session_state.mc_years
+    if num_sims < 1 or num_years < 1:
+        raise ValueError("Monte Carlo needs at least one simulation and one projection year")
+    size = (num_sims, num_years)
+    components = _monte_carlo_year_components(start_year, num_years)
+
+    # Variability multipliers for employment income, total expenses and the investment return
+    if use_asymmetric:
+        variability = [(st.session_state[f"mc_{name}_variability_positive"], st.session_state[f"mc_{name}_variability_negative"])
+                       for name in ('income', 'expense', 'return')]
     else:
-        st.warning("⚠️ No cashflow data calculated yet. Click the button above to generate your lifetime cashflow analysis.")
+        variability = [(st.session_state[f"mc_{name}_variability"],) * 2 for name in ('income', 'expense', 'return')]
+    # The multiplier buffers are fresh each run, so the (num_sims, num_years) terms below
+    # are built in place in them rather than allocating a new array per operation
+    income_mult, expense_mult, return_mult = _draw_multipliers_threaded(seed, size, use_asymmetric, variability)
+    returns = return_mult
+    returns *= scenario.investment_return
+
+    shared_expenses = (components['family_expenses'] + components['children_expenses']
+                       + components['recurring_expenses'] + components['major_purchases']
+                       + components['healthcare_expenses'] + components['house_expenses'])
+    base_total_expenses = components['parentX_expenses'] + components['parentY_expenses'] + shared_expenses
+    total_expenses = expense_mult
+    total_expenses *= base_total_expenses
+
+    if st.session_state.get('finance_mode', 'Pooled') == "Separate":
+        # Each parent carries their own expenses plus their split of shared costs,
+        # scaled by the same expense variability
+        split = st.session_state.get('shared_expense_split_pct', 50) / 100.0
+        variability_factor = np.where(base_total_expenses > 0,
+                                      total_expenses / np.maximum(base_total_expenses, 1), 1.0)
+        p1_cashflow = components['parent1_income'] - (components['parentX_expenses'] + shared_expenses * split) * variability_factor
+        p2_cashflow = components['parent2_income'] - (components['parentY_expenses'] + shared_expenses * (1 - split)) * variability_factor
+        trajectories = _simulate_trajectories(p1_cashflow, returns, float(st.session_state.parentX_net_worth))
+        trajectories += _simulate_trajectories(p2_cashflow, returns, float(st.session_state.parentY_net_worth))
+    else:
+        cashflow = income_mult
+        cashflow *= components['employment_income']
+        cashflow += components['ss_income']
+        cashflow -= total_expenses
+        trajectories = _simulate_trajectories(cashflow, returns, float(st.session_state.parentX_net_worth + st.session_state.parentY_net_worth))
+
+    if st.session_state.mc_normalize_to_today_dollars:
+        trajectories /= growth_factors(scenario.inflation_rate, 0, num_years)
+
+    percentile_values = np.percentile(trajectories, [10, 25, 50, 75, 90], axis=0)
+    return {
+        'years': list(range(start_year, start_year + num_years)),
+        'percentiles': {label: values.tolist() for label, values in zip(('10th', '25th', '50th', '75th', '90th'), percentile_values)},
+        'scenario': scenario,
+        'all_simulations': trajectories.astype(np.float32)
+    }
+
+
+def _mc_fan_chart(mc_data: dict) -> go.Figure:
+    """Percentile fan chart for Monte Carlo results (the layout stored in st.session_state.mc_results)."""
+    fig = go.Figure()
+
+    years = mc_data['years']
+    percentiles = mc_data['percentiles']
+
+    # Add percentile bands
+    fig.add_trace(go.Scatter(x=years, y=percentiles['90th'], mode='lines', name='90th Percentile', line=dict(color='rgba(0,100,255,0.2)', width=1)))
+    fig.add_trace(go.Scatter(x=years, y=percentiles['75th'], mode='lines', name='75th Percentile', line=dict(color='rgba(0,150,255,0.3)', width=1), fill='tonexty', fillcolor='rgba(0,100,255,0.1)'))
+    fig.add_trace(go.Scatter(x=years, y=percentiles['50th'], mode='lines', name='50th Percentile (Median)', line=dict(color='blue', width=3)))
+    fig.add_trace(go.Scatter(x=years, y=percentiles['25th'], mode='lines', name='25th Percentile', line=dict(color='rgba(255,150,0,0.3)', width=1), fill='tonexty', fillcolor='rgba(100,150,255,0.1)'))
+    fig.add_trace(go.Scatter(x=years, y=percentiles['10th'], mode='lines', name='10th Percentile', line=dict(color='rgba(255,0,0,0.3)', width=1), fill='tonexty', fillcolor='rgba(255,100,0,0.1)'))
 
+    # Add zero line
+    fig.add_hline(y=0, line_dash="dash", line_color="red", annotation_text="Broke", annotation_position="right")
+
+    fig.update_layout(
+        title=f"Net Worth Trajectories: Monte Carlo Simulation ({len(mc_data.get('all_simulations', []))} simulations)",
+        xaxis_title="Year",
+        yaxis_title="Net Worth ($)" + (" - Today's Dollars" if st.session_state.mc_normalize_to_today_dollars else ""),
+        height=600,
+        hovermode='x unified'
+    )
+    return fig
 
 
 def monte_carlo_simulation_tab():
@@ -15192,311 +15497,70 @@ def monte_carlo_simulation_tab():
     """)
 
     st.subheader("⚙️ Simulation Settings")
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        st.session_state.mc_start_year = st.number_input("Start Year", min_value=st.session_state.current_year, max_value=2100, value=int(st.session_state.mc_start_year), key="mc_start_v071")
-        st.number_input("Projection Years", min_value=1, max_value=80, value=int(st.session_state.mc_years), key="mc_years_v071")
-
-    with col2:
-        st.session_state.mc_simulations = st.number_input("Number of Simulations", min_value=100, max_value=10000, value=int(st.session_state.mc_simulations), step=100, key="mc_sims_v071")
-        st.session_state.mc_use_historical = st.checkbox("Use Historical Returns", value=st.session_state.mc_use_historical, help="Use actual historical S&P 500 returns instead of random generation", key="mc_hist_v071")
-
-    with col3:
-        st.session_state.mc_normalize_to_today_dollars = st.checkbox(
-            "Normalize to Today's Dollars",
-            value=st.session_state.mc_normalize_to_today_dollars,
-            help="Adjusts all future values to reflect today's purchasing power by removing the effect of inflation. This reveals your actual wealth accumulation over time — if the line goes up, you're genuinely getting wealthier, not just keeping pace with rising prices. For example, $1M in 2050 might look impressive, but normalized to today's dollars shows what that money can actually buy in current terms.",
-            key="mc_norm_v071"
-        )
-
-    st.markdown("---")
-    st.subheader("📊 Variability Settings")
+    # Decides which variability inputs the form shows, so it stays outside the form
     use_asymmetric = st.checkbox("Use Asymmetric Variability", value=True, help="Set different positive and negative variability ranges", key="mc_asym_v071")
 
-    if use_asymmetric:
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.markdown("**Income Variability**")
-            st.session_state.mc_income_variability_positive = st.number_input("Positive (%)", min_value=0.0, max_value=100.0, value=float(st.session_state.mc_income_variability_positive), step=1.0, key="income_var_pos_v071")
-            st.session_state.mc_income_variability_negative = st.number_input("Negative (%)", min_value=0.0, max_value=100.0, value=float(st.session_state.mc_income_variability_negative), step=1.0, key="income_var_neg_v071")
-        with col2:
-            st.markdown("**Expense Variability**")
-            st.session_state.mc_expense_variability_positive = st.number_input("Positive (%)", min_value=0.0, max_value=100.0, value=float(st.session_state.mc_expense_variability_positive), step=1.0, key="expense_var_pos_v071")
-            st.session_state.mc_expense_variability_negative = st.number_input("Negative (%)", min_value=0.0, max_value=100.0, value=float(st.session_state.mc_expense_variability_negative), step=1.0, key="expense_var_neg_v071")
-        with col3:
-            st.markdown("**Return Variability**")
-            st.session_state.mc_return_variability_positive = st.number_input("Positive (%)", min_value=0.0, max_value=100.0, value=float(st.session_state.mc_return_variability_positive), step=1.0, key="return_var_pos_v071")
-            st.session_state.mc_return_variability_negative = st.number_input("Negative (%)", min_value=0.0, max_value=100.0, value=float(st.session_state.mc_return_variability_negative), step=1.0, key="return_var_neg_v071")
-    else:
+    # Settings are submitted together with the run button: editing them doesn't rerun the app
+    with st.form("mc_settings_form", border=False):
         col1, col2, col3 = st.columns(3)
-        with col1:
-            st.session_state.mc_income_variability = st.slider("Income Variability (%)", 0.0, 100.0, 10.0, key="income_var_v071")
-        with col2:
-            st.session_state.mc_expense_variability = st.slider("Expense Variability (%)", 0.0, 100.0, 5.0, key="expense_var_v071")
-        with col3:
-            st.session_state.mc_return_variability = st.slider("Return Variability (%)", 0.0, 100.0, 15.0, key="return_var_v071")
-
-    # Run Monte Carlo Simulation Button
-    if st.button("🎲 Run Monte Carlo Simulation", type="primary", use_container_width=True, key="run_mc_v071"):
-        with st.spinner("Running Monte Carlo simulation... This may take a minute."):
-            # Get economic parameters
-            scenario = st.session_state.economic_params
-
-            num_sims = min(st.session_state.mc_simulations, 1000)
-            all_sim_results = []
-
-            initial_net_worth = st.session_state.parentX_net_worth + st.session_state.parentY_net_worth
-            mc_finance_mode = st.session_state.get('finance_mode', 'Pooled')
-            mc_split = st.session_state.get('shared_expense_split_pct', 50) / 100.0
-            expense_inflation = 1 + st.session_state.economic_params.inflation_rate
-
-            progress_bar = st.progress(0)
-
-            for sim in range(num_sims):
-                sim_net_worth = []
-                net_worth = initial_net_worth
-                if mc_finance_mode == "Separate":
-                    mc_nw_p1 = st.session_state.parentX_net_worth
-                    mc_nw_p2 = st.session_state.parentY_net_worth
-
-                for year_offset in range(st.session_state.mc_years):
-                    year = st.session_state.mc_start_year + year_offset
-
-                    # Calculate base income (same as deterministic)
-                    parentX_working = (year - (st.session_state.current_year - st.session_state.parentX_age)) < st.session_state.parentX_retirement_age
-                    parentY_working = (year - (st.session_state.current_year - st.session_state.parentY_age)) < st.session_state.parentY_retirement_age
-
-                    mc_p1_income = 0
-                    mc_p2_income = 0
-                    if parentX_working:
-                        if st.session_state.get('parentX_career_phases'):
-                            comp = get_career_income_for_year(
-                                st.session_state.parentX_career_phases,
-                                st.session_state.parentX_age,
-                                st.session_state.current_year,
-                                year
-                            )
-                            mc_p1_income = comp['total_employment_income']
-                        else:
-                            mc_p1_income = get_income_for_year(st.session_state.parentX_income, st.session_state.parentX_raise, st.session_state.parentX_job_changes, st.session_state.current_year, year)
-                    else:
-                        ss_benefit = st.session_state.parentX_ss_benefit * 12
-                        if st.session_state.ss_insolvency_enabled and year >= 2034:
-                            ss_benefit *= (1 - st.session_state.ss_shortfall_percentage / 100)
-                        mc_p1_income += ss_benefit
-
-                    if parentY_working:
-                        if st.session_state.get('parentY_career_phases'):
-                            comp = get_career_income_for_year(
-                                st.session_state.parentY_career_phases,
-                                st.session_state.parentY_age,
-                                st.session_state.current_year,
-                                year
-                            )
-                            mc_p2_income = comp['total_employment_income']
-                        else:
-                            mc_p2_income = get_income_for_year(st.session_state.parentY_income, st.session_state.parentY_raise, st.session_state.parentY_job_changes, st.session_state.current_year, year)
-                    else:
-                        ss_benefit = st.session_state.parentY_ss_benefit * 12
-                        if st.session_state.ss_insolvency_enabled and year >= 2034:
-                            ss_benefit *= (1 - st.session_state.ss_shortfall_percentage / 100)
-                        mc_p2_income += ss_benefit
-
-                    # Separate employment income from SS (SS is fixed, not varied)
-                    employment_income = 0
-                    ss_total = 0
-                    if parentX_working:
-                        employment_income += mc_p1_income
-                    else:
-                        ss_total += mc_p1_income  # This is SS benefit
-                    if parentY_working:
-                        employment_income += mc_p2_income
-                    else:
-                        ss_total += mc_p2_income  # This is SS benefit
-
-                    # Add variability to employment income ONLY (not Social Security)
-                    if use_asymmetric:
-                        if np.random.random() > 0.5:
-                            employment_income *= (1 + np.random.uniform(0, st.session_state.mc_income_variability_positive / 100))
-                        else:
-                            employment_income *= (1 - np.random.uniform(0, st.session_state.mc_income_variability_negative / 100))
-                    else:
-                        employment_income *= (1 + np.random.uniform(-st.session_state.mc_income_variability / 100, st.session_state.mc_income_variability / 100))
-
-                    income = employment_income + ss_total  # Combine after variability
-
-                    # Calculate base expenses (Parent X + Parent Y + Family)
-                    years_from_now = year - st.session_state.current_year
-
-                    # Parent X + Parent Y + Family expenses (with inflation)
-                    parentX_total = sum(st.session_state.parentX_expenses.values()) * (expense_inflation ** years_from_now)
-                    parentY_total = sum(st.session_state.parentY_expenses.values()) * (expense_inflation ** years_from_now)
-                    # Check if living in owned house → skip rent
-                    mc_family = dict(st.session_state.family_shared_expenses)
-                    mc_lives_owned = False
-                    if 'houses' in st.session_state:
-                        for house in st.session_state.houses:
-                            status, _ = house.get_status_for_year(year)
-                            if status == "Own_Live":
-                                mc_lives_owned = True
-                                break
-                    if mc_lives_owned:
-                        mc_family['Mortgage/Rent'] = 0.0
-                    family_total = sum(mc_family.values()) * (expense_inflation ** years_from_now)
-                    base_expenses = parentX_total + parentY_total + family_total
-
-                    # Children expenses (same calculation as deterministic cashflow)
-                    children_expenses = 0
-                    for child in st.session_state.children_list:
-                        child_exp = get_child_expenses(child, year, st.session_state.current_year)
-                        child_total = sum(child_exp.values())
-                        children_expenses += child_total
-
-                    # Recurring expenses
-                    recurring_expenses_total = 0
-                    for recurring in st.session_state.recurring_expenses:
-                        if year >= recurring.start_year:
-                            if recurring.end_year is None or year <= recurring.end_year:
-                                years_since_start = year - recurring.start_year
-                                if years_since_start % recurring.frequency_years == 0:
-                                    expense_amount = recurring.amount
-                                    if recurring.inflation_adjust:
-                                        expense_amount *= (expense_inflation ** years_from_now)
-                                    recurring_expenses_total += expense_amount
-
-                    # One-time major purchases
-                    major_purchase_expenses = 0
-                    for purchase in st.session_state.major_purchases:
-                        if purchase.year == year:
-                            major_purchase_expenses += purchase.amount
-
-                    # Healthcare costs
-                    healthcare_expenses = 0
-                    parent1_age = st.session_state.parentX_age + (year - st.session_state.current_year)
-                    parent2_age = st.session_state.parentY_age + (year - st.session_state.current_year)
-
-                    if 'health_insurances' in st.session_state:
-                        for insurance in st.session_state.health_insurances:
-                            if insurance.covered_by in ["Parent 1", "Both", "Family"] and insurance.start_age <= parent1_age <= insurance.end_age:
-                                healthcare_expenses += insurance.monthly_premium * 12
-                            elif insurance.covered_by == "Parent 2" and insurance.start_age <= parent2_age <= insurance.end_age:
-                                healthcare_expenses += insurance.monthly_premium * 12
-                            elif insurance.covered_by in ["Both", "Family"]:
-                                if (insurance.start_age <= parent1_age <= insurance.end_age) or (insurance.start_age <= parent2_age <= insurance.end_age):
-                                    healthcare_expenses += insurance.monthly_premium * 12
-
-                    # Medicare costs (age 65+)
-                    medicare_expenses = 0
-                    if 'medicare_part_b_premium' in st.session_state:
-                        if parent1_age >= 65:
-                            medicare_expenses += st.session_state.medicare_part_b_premium * 12
-                            medicare_expenses += st.session_state.get('medicare_part_d_premium', 55.0) * 12
-                            medicare_expenses += st.session_state.get('medigap_premium', 150.0) * 12
-                        if parent2_age >= 65:
-                            medicare_expenses += st.session_state.medicare_part_b_premium * 12
-                            medicare_expenses += st.session_state.get('medicare_part_d_premium', 55.0) * 12
-                            medicare_expenses += st.session_state.get('medigap_premium', 150.0) * 12
-                    healthcare_expenses += medicare_expenses
-
-                    # Long-term care insurance premiums
-                    if 'ltc_insurances' in st.session_state:
-                        for ltc in st.session_state.ltc_insurances:
-                            if ltc.covered_person == "Parent 1" and parent1_age >= ltc.start_age:
-                                healthcare_expenses += ltc.monthly_premium * 12
-                            elif ltc.covered_person == "Parent 2" and parent2_age >= ltc.start_age:
-                                healthcare_expenses += ltc.monthly_premium * 12
-
-                    # Housing expenses (property tax, insurance, maintenance, upkeep)
-                    house_expenses = 0
-                    if 'houses' in st.session_state:
-                        for house in st.session_state.houses:
-                            status, _rental = house.get_status_for_year(year)
-                            if status in ("Own_Live", "Own_Rent"):
-                                mc_appr = 1 + getattr(house, 'appreciation_rate', 3.0) / 100
-                                current_house_value = house.current_value * (mc_appr ** years_from_now)
-                                house_expenses += current_house_value * house.property_tax_rate
-                                house_expenses += house.home_insurance * (expense_inflation ** years_from_now)
-                                house_expenses += current_house_value * house.maintenance_rate
-                                house_expenses += house.upkeep_costs * (expense_inflation ** years_from_now)
-
-                    total_expenses = base_expenses + children_expenses + recurring_expenses_total + major_purchase_expenses + healthcare_expenses + house_expenses
-
-                    # Add variability to expenses
-                    if use_asymmetric:
-                        if np.random.random() > 0.5:
-                            total_expenses *= (1 + np.random.uniform(0, st.session_state.mc_expense_variability_positive / 100))
-                        else:
-                            total_expenses *= (1 - np.random.uniform(0, st.session_state.mc_expense_variability_negative / 100))
-                    else:
-                        total_expenses *= (1 + np.random.uniform(-st.session_state.mc_expense_variability / 100, st.session_state.mc_expense_variability / 100))
 
-                    # Calculate return
-                    if use_asymmetric:
-                        if np.random.random() > 0.5:
-                            investment_return = scenario.investment_return * (1 + np.random.uniform(0, st.session_state.mc_return_variability_positive / 100))
-                        else:
-                            investment_return = scenario.investment_return * (1 - np.random.uniform(0, st.session_state.mc_return_variability_negative / 100))
-                    else:
-                        investment_return = scenario.investment_return * (1 + np.random.uniform(-st.session_state.mc_return_variability / 100, st.session_state.mc_return_variability / 100))
-
-                    # Update net worth
-                    if mc_finance_mode == "Separate":
-                        # Split shared costs (everything except per-parent base expenses)
-                        shared_mc = (family_total + children_expenses + recurring_expenses_total
-                                     + major_purchase_expenses + healthcare_expenses + house_expenses)
-                        # Apply expense variability equally to both
-                        variability_factor = total_expenses / max(base_expenses + children_expenses + recurring_expenses_total + major_purchase_expenses + healthcare_expenses + house_expenses, 1) if (base_expenses + children_expenses + recurring_expenses_total + major_purchase_expenses + healthcare_expenses + house_expenses) > 0 else 1
-                        p1_mc_exp = (parentX_total + shared_mc * mc_split) * variability_factor
-                        p2_mc_exp = (parentY_total + shared_mc * (1 - mc_split)) * variability_factor
-
-                        mc_nw_p1 = mc_nw_p1 + (mc_p1_income - p1_mc_exp) + (mc_nw_p1 * investment_return)
-                        mc_nw_p2 = mc_nw_p2 + (mc_p2_income - p2_mc_exp) + (mc_nw_p2 * investment_return)
-                        net_worth = mc_nw_p1 + mc_nw_p2
-                    else:
-                        cashflow = income - total_expenses
-                        net_worth = net_worth + cashflow + (net_worth * investment_return)
+        with col1:
+            st.session_state.mc_start_year = st.number_input("Start Year", min_value=st.session_state.current_year, max_value=2100, value=int(st.session_state.mc_start_year), key="mc_start_v071")
+            st.number_input("Projection Years", min_value=1, max_value=80, value=int(st.session_state.mc_years), key="mc_years_v071")
 
-                    # Normalize if requested
-                    if st.session_state.mc_normalize_to_today_dollars:
-                        inflation_factor = (1 + scenario.inflation_rate) ** year_offset
-                        sim_net_worth.append(net_worth / inflation_factor)
-                    else:
-                        sim_net_worth.append(net_worth)
+        with col2:
+            st.session_state.mc_simulations = st.number_input("Number of Simulations", min_value=100, max_value=10000, value=int(st.session_state.mc_simulations), step=100, key="mc_sims_v071")
+            st.session_state.mc_use_historical = st.checkbox("Use Historical Returns", value=st.session_state.mc_use_historical, help="Use actual historical S&P 500 returns instead of random generation", key="mc_hist_v071")
 
-                all_sim_results.append(sim_net_worth)
-                progress_bar.progress((sim + 1) / num_sims)
+        with col3:
+            st.session_state.mc_normalize_to_today_dollars = st.checkbox(
+                "Normalize to Today's Dollars",
+                value=st.session_state.mc_normalize_to_today_dollars,
+                help="Adjusts all future values to reflect today's purchasing power by removing the effect of inflation. This reveals your actual wealth accumulation over time — if the line goes up, you're genuinely getting wealthier, not just keeping pace with rising prices. For example, $1M in 2050 might look impressive, but normalized to today's dollars shows what that money can actually buy in current terms.",
+                key="mc_norm_v071"
+            )
 
-            progress_bar.empty()
+        st.markdown("---")
+        st.subheader("📊 Variability Settings")
 
-            # Calculate percentiles
-            years_array = list(range(st.session_state.mc_start_year, st.session_state.mc_start_year + st.session_state.mc_years))
-            percentiles_data = {
-                '10th': [],
-                '25th': [],
-                '50th': [],
-                '75th': [],
-                '90th': []
-            }
+        if use_asymmetric:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.markdown("**Income Variability**")
+                st.session_state.mc_income_variability_positive = st.number_input("Positive (%)", min_value=0.0, max_value=100.0, value=float(st.session_state.mc_income_variability_positive), step=1.0, key="income_var_pos_v071")
+                st.session_state.mc_income_variability_negative = st.number_input("Negative (%)", min_value=0.0, max_value=100.0, value=float(st.session_state.mc_income_variability_negative), step=1.0, key="income_var_neg_v071")
+            with col2:
+                st.markdown("**Expense Variability**")
+                st.session_state.mc_expense_variability_positive = st.number_input("Positive (%)", min_value=0.0, max_value=100.0, value=float(st.session_state.mc_expense_variability_positive), step=1.0, key="expense_var_pos_v071")
+                st.session_state.mc_expense_variability_negative = st.number_input("Negative (%)", min_value=0.0, max_value=100.0, value=float(st.session_state.mc_expense_variability_negative), step=1.0, key="expense_var_neg_v071")
+            with col3:
+                st.markdown("**Return Variability**")
+                st.session_state.mc_return_variability_positive = st.number_input("Positive (%)", min_value=0.0, max_value=100.0, value=float(st.session_state.mc_return_variability_positive), step=1.0, key="return_var_pos_v071")
+                st.session_state.mc_return_variability_negative = st.number_input("Negative (%)", min_value=0.0, max_value=100.0, value=float(st.session_state.mc_return_variability_negative), step=1.0, key="return_var_neg_v071")
+        else:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.session_state.mc_income_variability = st.slider("Income Variability (%)", 0.0, 100.0, 10.0, key="income_var_v071")
+            with col2:
+                st.session_state.mc_expense_variability = st.slider("Expense Variability (%)", 0.0, 100.0, 5.0, key="expense_var_v071")
+            with col3:
+                st.session_state.mc_return_variability = st.slider("Return Variability (%)", 0.0, 100.0, 15.0, key="return_var_v071")
 
-            for year_idx in range(st.session_state.mc_years):
-                year_values = [sim[year_idx] for sim in all_sim_results]
-                percentiles_data['10th'].append(np.percentile(year_values, 10))
-                percentiles_data['25th'].append(np.percentile(year_values, 25))
-                percentiles_data['50th'].append(np.percentile(year_values, 50))
-                percentiles_data['75th'].append(np.percentile(year_values, 75))
-                percentiles_data['90th'].append(np.percentile(year_values, 90))
-
-            # Store results
-            st.session_state.mc_results = {
-                'years': years_array,
-                'percentiles': percentiles_data,
-                'scenario': scenario,
-                'all_simulations': all_sim_results
-            }
+        # Run Monte Carlo Simulation Button
+        run_clicked = st.form_submit_button("🎲 Run Monte Carlo Simulation", type="primary", use_container_width=True)
 
-            st.success("✅ Monte Carlo simulation complete! Results below.")
-            st.rerun()
+    if run_clicked:
+        with st.spinner("Running Monte Carlo simulation..."):
+            # One handler around the whole run; the traceback is only formatted with LOG_LEVEL=DEBUG
+            try:
+                st.session_state.mc_results = run_monte_carlo_simulation(st.session_state.mc_simulations, use_asymmetric)
+            except Exception as e:
+                logger.debug("Monte Carlo simulation failed", exc_info=True)
+                st.error(f"Error running Monte Carlo simulation: {str(e)}")
+            else:
+                # The results below render from the fresh data in this same run
+                st.session_state.mc_fan_chart = _mc_fan_chart(st.session_state.mc_results)
+                st.success("✅ Monte Carlo simulation complete! Results below.")
 
     # Display Monte Carlo Results
     if 'mc_results' in st.session_state and st.session_state.mc_results:
@@ -15504,35 +15568,15 @@ def monte_carlo_simulation_tab():
 
         st.markdown("### Monte Carlo Results: Net Worth Trajectories")
 
-        # Create percentile fan chart
-        fig = go.Figure()
-
-        years = mc_data['years']
-        percentiles = mc_data['percentiles']
-
-        # Add percentile bands
-        fig.add_trace(go.Scatter(x=years, y=percentiles['90th'], mode='lines', name='90th Percentile', line=dict(color='rgba(0,100,255,0.2)', width=1)))
-        fig.add_trace(go.Scatter(x=years, y=percentiles['75th'], mode='lines', name='75th Percentile', line=dict(color='rgba(0,150,255,0.3)', width=1), fill='tonexty', fillcolor='rgba(0,100,255,0.1)'))
-        fig.add_trace(go.Scatter(x=years, y=percentiles['50th'], mode='lines', name='50th Percentile (Median)', line=dict(color='blue', width=3)))
-        fig.add_trace(go.Scatter(x=years, y=percentiles['25th'], mode='lines', name='25th Percentile', line=dict(color='rgba(255,150,0,0.3)', width=1), fill='tonexty', fillcolor='rgba(100,150,255,0.1)'))
-        fig.add_trace(go.Scatter(x=years, y=percentiles['10th'], mode='lines', name='10th Percentile', line=dict(color='rgba(255,0,0,0.3)', width=1), fill='tonexty', fillcolor='rgba(255,100,0,0.1)'))
-
-        # Add zero line
-        fig.add_hline(y=0, line_dash="dash", line_color="red", annotation_text="Broke", annotation_position="right")
-
-        fig.update_layout(
-            title=f"Net Worth Trajectories: Monte Carlo Simulation ({len(mc_data.get('all_simulations', []))} simulations)",
-            xaxis_title="Year",
-            yaxis_title="Net Worth ($)" + (" - Today's Dollars" if st.session_state.mc_normalize_to_today_dollars else ""),
-            height=600,
-            hovermode='x unified'
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
+        # The chart only changes when a new simulation runs, so it is built with the results
+        if 'mc_fan_chart' not in st.session_state:
+            st.session_state.mc_fan_chart = _mc_fan_chart(mc_data)
+        st.plotly_chart(st.session_state.mc_fan_chart, use_container_width=True)
 
         # Calculate success probability
-        final_year_values = [sim[-1] for sim in mc_data.get('all_simulations', [])]
-        success_rate = sum(1 for v in final_year_values if v > 0) / len(final_year_values) * 100 if final_year_values else 0
+        percentiles = mc_data['percentiles']
+        all_simulations = np.asarray(mc_data.get('all_simulations', []))
+        success_rate = (all_simulations[:, -1] > 0).mean() * 100 if all_simulations.ndim == 2 and all_simulations.size else 0
 
         st.markdown("### 📊 Probability Analysis")
         col1, col2, col3 = st.columns(3)
@@ -15554,6 +15598,49 @@ def monte_carlo_simulation_tab():
     else:
         st.info("⏸️ Click 'Run Monte Carlo Simulation' above to see probabilistic outcomes and success rates.")
 
+def _event_final_net_worths_vectorized(pct_values: np.ndarray, start_multiplier: float, first_offset: int,
+                                       shocks: np.ndarray, investment_return: float, num_starts: int) -> np.ndarray:
+    """
+    Final net worth of a percentile trajectory when an event starts in each of its first num_starts years.
+
+    Each path starts from pct_values[start] * start_multiplier and is replayed
+    from year start + first_offset with the trajectory's implied cashflow,
+    less shocks[k] in the k-th year after the start (never in the last year).
+    All start years are stepped together, one year at a time.
+    """
+    num_years = len(pct_values)
+    implied = np.zeros(num_years)
+    implied[:-1] = (pct_values[1:] - pct_values[:-1]) - pct_values[:-1] * investment_return
+    starts = np.arange(num_starts)
+    net_worth = pct_values[:num_starts] * start_multiplier
+    for year_idx in range(first_offset, num_years):
+        offsets = year_idx - starts
+        cashflow = np.full(num_starts, implied[year_idx])
+        if year_idx < num_years - 1 and len(shocks):
+            in_event = (offsets >= 0) & (offsets < len(shocks))
+            cashflow -= np.where(in_event, shocks[np.clip(offsets, 0, len(shocks) - 1)], 0.0)
+        net_worth = np.where(offsets >= first_offset, net_worth + cashflow + net_worth * investment_return, net_worth)
+    return net_worth
+
+
+if NUMBA_AVAILABLE:
+    _event_final_net_worths = mc_kernels.event_final_net_worths
+else:
+    _event_final_net_worths = _event_final_net_worths_vectorized
+
+
+def _worst_event_start(pct_values, years, start_multiplier=1.0, first_offset=0, shocks=(), investment_return=0.0, num_starts=None):
+    """(worst final net worth, start year) over every start year of an event; (inf, None) if it fits nowhere."""
+    if num_starts is None:
+        num_starts = len(years)
+    if num_starts <= 0:
+        return float('inf'), None
+    final_net_worths = _event_final_net_worths(np.asarray(pct_values, dtype=float), float(start_multiplier), first_offset,
+                                               np.asarray(shocks, dtype=float), float(investment_return), num_starts)
+    worst = int(np.argmin(final_net_worths))
+    return float(final_net_worths[worst]), years[worst]
+
+
 def test_net_worth_loss_scenario(percentiles_data, config):
     """
     Test net worth loss scenario with configurable loss percentage.
@@ -15576,32 +15663,10 @@ def test_net_worth_loss_scenario(percentiles_data, config):
     event_results = {'event': f'{loss_percent}% Net Worth Loss (Worst Year)'}
 
     for pct_name in percentile_names:
-        pct_values = percentiles[pct_name]
-        worst_final_nw = float('inf')
-        worst_year = None
-
-        # Try each year as the crash year
-        for crash_idx in range(len(years)):
-            # Simulate from crash year forward
-            net_worth = pct_values[crash_idx] * loss_multiplier
-
-            # Continue simulation from crash year to end
-            final_nw = net_worth
-            for future_idx in range(crash_idx + 1, len(years)):
-                return_rate = scenario.investment_return
-                investment_return = final_nw * return_rate
-
-                # Implied cashflow from percentile trajectory
-                if future_idx < len(pct_values) - 1:
-                    implied_cashflow = (pct_values[future_idx + 1] - pct_values[future_idx]) - (pct_values[future_idx] * scenario.investment_return)
-                    final_nw = final_nw + implied_cashflow + investment_return
-                else:
-                    final_nw = final_nw + investment_return
-
-            # Track worst case
-            if final_nw < worst_final_nw:
-                worst_final_nw = final_nw
-                worst_year = years[crash_idx]
+        # Try each year as the crash year, continuing from the year after it
+        worst_final_nw, worst_year = _worst_event_start(
+            percentiles[pct_name], years, start_multiplier=loss_multiplier, first_offset=1,
+            investment_return=scenario.investment_return)
 
         # Store result
         status = "✅" if worst_final_nw > 0 else "❌"
@@ -15644,20 +15709,12 @@ def test_disabled_child_scenario(percentiles_data, config):
             continue
 
         birth_idx = years.index(child_birth_year)
-        net_worth = pct_values[birth_idx]
 
-        for future_idx in range(birth_idx + 1, len(years)):
-            year_offset = future_idx - birth_idx
-
-            # Reduced cashflow due to lost income
-            if future_idx < len(pct_values) - 1:
-                normal_cashflow = (pct_values[future_idx + 1] - pct_values[future_idx]) - (pct_values[future_idx] * scenario.investment_return)
-                reduced_cashflow = normal_cashflow - (st.session_state.parentY_income * (1 + scenario.inflation_rate) ** year_offset)
-            else:
-                reduced_cashflow = 0
-
-            investment_return = net_worth * scenario.investment_return
-            net_worth = net_worth + reduced_cashflow + investment_return
+        # Replay from the birth year, losing parent 2's inflation-grown income every year after it
+        lost_income = st.session_state.parentY_income * (1 + scenario.inflation_rate) ** np.arange(len(years) - birth_idx)
+        net_worth, _ = _worst_event_start(
+            pct_values[birth_idx:], years[birth_idx:], first_offset=1, shocks=lost_income,
+            investment_return=scenario.investment_return, num_starts=1)
 
         status = "✅" if net_worth > 0 else "❌"
         event_results[pct_name] = {
@@ -15741,39 +15798,14 @@ def test_unemployment_scenario(percentiles_data, config):
 
     event_results = {'event': f'{parent_name} Unemployed {duration_years} Years (Worst Year)'}
 
-    for pct_name in percentile_names:
-        pct_values = percentiles[pct_name]
-        worst_final_nw = float('inf')
-        worst_year = None
-
-        # Try each year as the unemployment start
-        for unemp_start_idx in range(len(years) - duration_years):
-            net_worth = pct_values[unemp_start_idx]
-
-            # Simulate unemployment period plus recovery
-            for future_idx in range(unemp_start_idx, len(years)):
-                year_offset = future_idx - unemp_start_idx
-
-                # Calculate cashflow impact
-                if future_idx < len(pct_values) - 1:
-                    normal_cashflow = (pct_values[future_idx + 1] - pct_values[future_idx]) - (pct_values[future_idx] * scenario.investment_return)
+    # During unemployment, lose this parent's (inflating) income
+    income_losses = parent_income * (1 + scenario.inflation_rate) ** np.arange(duration_years)
 
-                    # During unemployment, lose this parent's income
-                    if year_offset < duration_years:
-                        income_loss = parent_income * ((1 + scenario.inflation_rate) ** year_offset)
-                        reduced_cashflow = normal_cashflow - income_loss
-                    else:
-                        reduced_cashflow = normal_cashflow
-                else:
-                    reduced_cashflow = 0
-
-                investment_return = net_worth * scenario.investment_return
-                net_worth = net_worth + reduced_cashflow + investment_return
-
-            # Track worst case
-            if net_worth < worst_final_nw:
-                worst_final_nw = net_worth
-                worst_year = years[unemp_start_idx]
+    for pct_name in percentile_names:
+        # Try each year as the unemployment start, simulating the unemployment period plus recovery
+        worst_final_nw, worst_year = _worst_event_start(
+            percentiles[pct_name], years, shocks=income_losses,
+            investment_return=scenario.investment_return, num_starts=len(years) - duration_years)
 
         status = "✅" if worst_final_nw > 0 else "❌"
         event_results[pct_name] = {
@@ -15806,40 +15838,15 @@ def test_hyperinflation_scenario(percentiles_data, config):
 
     event_results = {'event': f'Hyperinflation: {int(inflation_rate*100)}% for {inflation_years} Years (Worst Year)'}
 
-    for pct_name in percentile_names:
-        pct_values = percentiles[pct_name]
-        worst_final_nw = float('inf')
-        worst_year = None
-
-        # Try each year as the hyperinflation start
-        for inflation_start_idx in range(len(years) - inflation_years):
-            net_worth = pct_values[inflation_start_idx]
-
-            # Simulate hyperinflation period plus recovery
-            for future_idx in range(inflation_start_idx, len(years)):
-                year_offset = future_idx - inflation_start_idx
-
-                # Calculate cashflow impact
-                if future_idx < len(pct_values) - 1:
-                    normal_cashflow = (pct_values[future_idx + 1] - pct_values[future_idx]) - (pct_values[future_idx] * scenario.investment_return)
-
-                    # During hyperinflation, expenses increase dramatically
-                    if year_offset < inflation_years:
-                        # Expenses increase with hyperinflation, income may lag
-                        expense_increase = (st.session_state.parentX_income + st.session_state.parentY_income) * 0.3 * ((1 + inflation_rate) ** year_offset)
-                        reduced_cashflow = normal_cashflow - expense_increase
-                    else:
-                        reduced_cashflow = normal_cashflow
-                else:
-                    reduced_cashflow = 0
-
-                investment_return = net_worth * scenario.investment_return
-                net_worth = net_worth + reduced_cashflow + investment_return
+    # During hyperinflation, expenses increase dramatically; income may lag
+    expense_increases = ((st.session_state.parentX_income + st.session_state.parentY_income) * 0.3
+                         * (1 + inflation_rate) ** np.arange(inflation_years))
 
-            # Track worst case
-            if net_worth < worst_final_nw:
-                worst_final_nw = net_worth
-                worst_year = years[inflation_start_idx]
+    for pct_name in percentile_names:
+        # Try each year as the hyperinflation start, simulating the hyperinflation period plus recovery
+        worst_final_nw, worst_year = _worst_event_start(
+            percentiles[pct_name], years, shocks=expense_increases,
+            investment_return=scenario.investment_return, num_starts=len(years) - inflation_years)
 
         status = "✅" if worst_final_nw > 0 else "❌"
         event_results[pct_name] = {
@@ -16089,6 +16096,9 @@ def stress_test_tab():
 
                 event_results = {'event': event_name}
 
+                # Inflation growth of lost income by years since the event started, computed once
+                inflation_growth = growth_factors(scenario.inflation_rate, 0, len(years))
+
                 # Run compound simulation for each percentile
                 for pct_name in percentile_names:
                     pct_values = percentiles[pct_name]
@@ -16140,12 +16150,12 @@ def stress_test_tab():
 
                                 # Apply unemployment income loss
                                 if include_unemployment and year_offset < compound_unemployment_years:
-                                    income_loss = unemployment_parent_income * ((1 + scenario.inflation_rate) ** year_offset)
+                                    income_loss = unemployment_parent_income * inflation_growth[year_offset]
                                     normal_cashflow -= income_loss
 
                                 # Apply disabled child income loss (parent retires permanently)
                                 if include_disabled_child:
-                                    income_loss = disabled_child_parent_income * ((1 + scenario.inflation_rate) ** year_offset)
+                                    income_loss = disabled_child_parent_income * inflation_growth[year_offset]
                                     normal_cashflow -= income_loss
 
                                 reduced_cashflow = normal_cashflow
@@ -16257,61 +16267,65 @@ def stress_test_tab():
         st.error("❌ **High Risk** - Your plan is vulnerable to stress test scenarios. Significant adjustments recommended.")
 
 
+def get_plan_data() -> dict:
+    """Snapshot of the plan in session state as plain JSON-compatible data (the save_data layout)"""
+    return {
+        'current_year': st.session_state.current_year,
+        'parent1_name': st.session_state.parent1_name,
+        'parent1_emoji': st.session_state.parent1_emoji,
+        'parent2_name': st.session_state.parent2_name,
+        'parent2_emoji': st.session_state.parent2_emoji,
+        'marriage_year': st.session_state.marriage_year,
+        'finance_mode': st.session_state.get('finance_mode', 'Pooled'),
+        'shared_expense_split_pct': st.session_state.get('shared_expense_split_pct', 50),
+        'parentX_age': st.session_state.parentX_age,
+        'parentX_net_worth': st.session_state.parentX_net_worth,
+        'parentX_income': st.session_state.parentX_income,
+        'parentX_raise': st.session_state.parentX_raise,
+        'parentX_retirement_age': st.session_state.parentX_retirement_age,
+        'parentX_ss_benefit': st.session_state.parentX_ss_benefit,
+        'parentX_death_age': st.session_state.get('parentX_death_age', 100),
+        'parentX_job_changes': st.session_state.parentX_job_changes.to_dict('records') if hasattr(st.session_state.get('parentX_job_changes', None), 'to_dict') else [],
+        'parentX_career_phases': [asdict(cp) for cp in st.session_state.get('parentX_career_phases', [])],
+        'parentX_expenses': st.session_state.get('parentX_expenses', {}),
+        'parentX_expense_location': st.session_state.get('parentX_expense_location', 'Seattle'),
+        'parentX_expense_strategy': st.session_state.get('parentX_expense_strategy', 'Moderate'),
+        'parentX_use_template': st.session_state.get('parentX_use_template', True),
+        'parentY_age': st.session_state.parentY_age,
+        'parentY_net_worth': st.session_state.parentY_net_worth,
+        'parentY_income': st.session_state.parentY_income,
+        'parentY_raise': st.session_state.parentY_raise,
+        'parentY_retirement_age': st.session_state.parentY_retirement_age,
+        'parentY_ss_benefit': st.session_state.parentY_ss_benefit,
+        'parentY_death_age': st.session_state.get('parentY_death_age', 100),
+        'parentY_job_changes': st.session_state.parentY_job_changes.to_dict('records') if hasattr(st.session_state.get('parentY_job_changes', None), 'to_dict') else [],
+        'parentY_career_phases': [asdict(cp) for cp in st.session_state.get('parentY_career_phases', [])],
+        'parentY_expenses': st.session_state.get('parentY_expenses', {}),
+        'parentY_expense_location': st.session_state.get('parentY_expense_location', 'Seattle'),
+        'parentY_expense_strategy': st.session_state.get('parentY_expense_strategy', 'Moderate'),
+        'parentY_use_template': st.session_state.get('parentY_use_template', True),
+        'expenses': st.session_state.expenses,
+        'family_shared_expenses': st.session_state.get('family_shared_expenses', {}),
+        'children_list': st.session_state.children_list,
+        'houses': [asdict(h) for h in st.session_state.houses],
+        'major_purchases': [asdict(mp) for mp in st.session_state.major_purchases],
+        'recurring_expenses': [asdict(re_exp) for re_exp in st.session_state.recurring_expenses],
+        'state_timeline': [asdict(st_entry) for st_entry in st.session_state.state_timeline],
+        'economic_params': asdict(st.session_state.economic_params),
+        'ss_insolvency_enabled': st.session_state.ss_insolvency_enabled,
+        'ss_shortfall_percentage': st.session_state.ss_shortfall_percentage,
+        'health_insurances': [asdict(hi) for hi in st.session_state.get('health_insurances', [])],
+        'ltc_insurances': [asdict(li) for li in st.session_state.get('ltc_insurances', [])],
+        'health_expenses': [asdict(he) for he in st.session_state.get('health_expenses', [])],
+        'hsa_balance': st.session_state.get('hsa_balance', 0.0),
+        'hsa_contribution': st.session_state.get('hsa_contribution', 0.0),
+    }
+
+
 def save_data():
     """Serialize all session state to a JSON string"""
     try:
-        data = {
-            'current_year': st.session_state.current_year,
-            'parent1_name': st.session_state.parent1_name,
-            'parent1_emoji': st.session_state.parent1_emoji,
-            'parent2_name': st.session_state.parent2_name,
-            'parent2_emoji': st.session_state.parent2_emoji,
-            'marriage_year': st.session_state.marriage_year,
-            'finance_mode': st.session_state.get('finance_mode', 'Pooled'),
-            'shared_expense_split_pct': st.session_state.get('shared_expense_split_pct', 50),
-            'parentX_age': st.session_state.parentX_age,
-            'parentX_net_worth': st.session_state.parentX_net_worth,
-            'parentX_income': st.session_state.parentX_income,
-            'parentX_raise': st.session_state.parentX_raise,
-            'parentX_retirement_age': st.session_state.parentX_retirement_age,
-            'parentX_ss_benefit': st.session_state.parentX_ss_benefit,
-            'parentX_death_age': st.session_state.get('parentX_death_age', 100),
-            'parentX_job_changes': st.session_state.parentX_job_changes.to_dict('records') if hasattr(st.session_state.get('parentX_job_changes', None), 'to_dict') else [],
-            'parentX_career_phases': [asdict(cp) for cp in st.session_state.get('parentX_career_phases', [])],
-            'parentX_expenses': st.session_state.get('parentX_expenses', {}),
-            'parentX_expense_location': st.session_state.get('parentX_expense_location', 'Seattle'),
-            'parentX_expense_strategy': st.session_state.get('parentX_expense_strategy', 'Moderate'),
-            'parentX_use_template': st.session_state.get('parentX_use_template', True),
-            'parentY_age': st.session_state.parentY_age,
-            'parentY_net_worth': st.session_state.parentY_net_worth,
-            'parentY_income': st.session_state.parentY_income,
-            'parentY_raise': st.session_state.parentY_raise,
-            'parentY_retirement_age': st.session_state.parentY_retirement_age,
-            'parentY_ss_benefit': st.session_state.parentY_ss_benefit,
-            'parentY_death_age': st.session_state.get('parentY_death_age', 100),
-            'parentY_job_changes': st.session_state.parentY_job_changes.to_dict('records') if hasattr(st.session_state.get('parentY_job_changes', None), 'to_dict') else [],
-            'parentY_career_phases': [asdict(cp) for cp in st.session_state.get('parentY_career_phases', [])],
-            'parentY_expenses': st.session_state.get('parentY_expenses', {}),
-            'parentY_expense_location': st.session_state.get('parentY_expense_location', 'Seattle'),
-            'parentY_expense_strategy': st.session_state.get('parentY_expense_strategy', 'Moderate'),
-            'parentY_use_template': st.session_state.get('parentY_use_template', True),
-            'expenses': st.session_state.expenses,
-            'family_shared_expenses': st.session_state.get('family_shared_expenses', {}),
-            'children_list': st.session_state.children_list,
-            'houses': [asdict(h) for h in st.session_state.houses],
-            'major_purchases': [asdict(mp) for mp in st.session_state.major_purchases],
-            'recurring_expenses': [asdict(re_exp) for re_exp in st.session_state.recurring_expenses],
-            'state_timeline': [asdict(st_entry) for st_entry in st.session_state.state_timeline],
-            'economic_params': asdict(st.session_state.economic_params),
-            'ss_insolvency_enabled': st.session_state.ss_insolvency_enabled,
-            'ss_shortfall_percentage': st.session_state.ss_shortfall_percentage,
-            'health_insurances': [asdict(hi) for hi in st.session_state.get('health_insurances', [])],
-            'ltc_insurances': [asdict(li) for li in st.session_state.get('ltc_insurances', [])],
-            'health_expenses': [asdict(he) for he in st.session_state.get('health_expenses', [])],
-            'hsa_balance': st.session_state.get('hsa_balance', 0.0),
-            'hsa_contribution': st.session_state.get('hsa_contribution', 0.0),
-        }
-        return json.dumps(data, indent=2)
+        return json.dumps(get_plan_data(), indent=2)
     except Exception as e:
         st.error(f"Error saving data: {str(e)}")
         return None
@@ -16321,7 +16335,7 @@ def load_data(json_data):
     """Load session state from a JSON string. Returns True on success."""
     try:
         if isinstance(json_data, str):
-            data = json.loads(json_data)
+            data = _parse_json(json_data)
         else:
             data = json_data
 
@@ -16379,6 +16393,38 @@ def load_data(json_data):
         return False
 
 
+# Loading a plan replaces much of session state, including values behind widgets. The load
+# buttons do it in on_click callbacks, which run before the next script run draws anything,
+# so the page is drawn once with the loaded plan instead of being drawn with the old values
+# and then forced through st.rerun().
+def _load_household_plan_into_session():
+    """Load Plan from Household button callback; leaves its message for the tab to show."""
+    plan_data = load_household_plan(st.session_state.household_id)
+    if not plan_data:
+        st.session_state['_load_household_plan_result'] = ('info', "No saved plan found. Save your current plan first.")
+    elif load_data(plan_data):
+        st.session_state['_load_household_plan_result'] = ('success', "Plan loaded from household storage!")
+
+
+def _load_saved_scenario():
+    """Scenario library Load button callback; leaves its message for the tab to show."""
+    name = st.session_state.saved_scenario_choice
+    if load_data(st.session_state.saved_scenarios[name]):
+        st.session_state['_load_saved_scenario_result'] = ('success', f"✅ Loaded scenario '{name}'")
+
+
+def _import_scenario_file():
+    """JSON import uploader callback: loads a newly chosen file once; leaves its message for the tab to show."""
+    uploaded_file = st.session_state.import_scenario_file
+    if uploaded_file is None:
+        return
+    try:
+        if load_data(uploaded_file.read().decode('utf-8')):
+            st.session_state['_import_scenario_result'] = ('success', "✅ Successfully imported scenario!")
+    except Exception as e:
+        st.session_state['_import_scenario_result'] = ('error', f"❌ Error importing file: {str(e)}")
+
+
 def save_load_tab():
     """Save and load scenarios tab"""
     st.header("💾 Save & Load Scenarios")
@@ -16400,14 +16446,8 @@ def save_load_tab():
                     st.success("Plan saved to household! All members will see these changes.")
 
         with col_h2:
-            if st.button("📂 Load Plan from Household", key="load_household_plan_btn"):
-                plan_data = load_household_plan(st.session_state.household_id)
-                if plan_data:
-                    if load_data(plan_data):
-                        st.success("Plan loaded from household storage!")
-                        st.rerun()
-                else:
-                    st.info("No saved plan found. Save your current plan first.")
+            st.button("📂 Load Plan from Household", key="load_household_plan_btn", on_click=_load_household_plan_into_session)
+            _show_load_result('_load_household_plan_result')
 
         household_info = get_household_info(st.session_state.household_id)
         if household_info.get('last_saved'):
@@ -16452,26 +16492,30 @@ def save_load_tab():
     if st.session_state.saved_scenarios:
         st.markdown("**Saved Scenarios:**")
 
-        for name in list(st.session_state.saved_scenarios.keys()):
-            col1, col2, col3 = st.columns([3, 1, 1])
+        # One picker with a single Load/Delete pair rather than a button row per scenario
+        col1, col2, col3 = st.columns([3, 1, 1])
 
-            with col1:
-                st.text(f"📋 {name}")
+        with col1:
+            name = st.selectbox(
+                "Saved scenario",
+                options=list(st.session_state.saved_scenarios.keys()),
+                format_func=lambda scenario: f"📋 {scenario}",
+                key="saved_scenario_choice",
+                label_visibility="collapsed"
+            )
 
-            with col2:
-                if st.button("📥 Load", key=f"load_{name}"):
-                    scenario_data = st.session_state.saved_scenarios[name]
-                    if load_data(scenario_data):
-                        st.success(f"✅ Loaded scenario '{name}'")
-                        st.rerun()
+        with col2:
+            st.button("📥 Load", key="load_saved_scenario", use_container_width=True, on_click=_load_saved_scenario)
 
-            with col3:
-                if st.button("🗑️ Delete", key=f"delete_{name}"):
-                    del st.session_state.saved_scenarios[name]
-                    if st.session_state.get('authenticated') and st.session_state.get('household_id'):
-                        save_household_scenarios(st.session_state.household_id, st.session_state.saved_scenarios)
-                    st.success(f"🗑️ Deleted scenario '{name}'")
-                    st.rerun()
+        with col3:
+            if st.button("🗑️ Delete", key="delete_saved_scenario", use_container_width=True):
+                del st.session_state.saved_scenarios[name]
+                if st.session_state.get('authenticated') and st.session_state.get('household_id'):
+                    save_household_scenarios(st.session_state.household_id, st.session_state.saved_scenarios)
+                st.success(f"🗑️ Deleted scenario '{name}'")
+                st.rerun()
+
+        _show_load_result('_load_saved_scenario_result')
     else:
         st.info("No scenarios saved yet. Save your first scenario above!")
 
@@ -16500,8 +16544,10 @@ def save_load_tab():
 
         if st.button("Compare", type="primary", key="compare_plans_btn"):
             try:
-                data_a = json.loads(st.session_state.saved_scenarios[plan_a]) if isinstance(st.session_state.saved_scenarios[plan_a], str) else st.session_state.saved_scenarios[plan_a]
-                data_b = json.loads(st.session_state.saved_scenarios[plan_b]) if isinstance(st.session_state.saved_scenarios[plan_b], str) else st.session_state.saved_scenarios[plan_b]
+                data_a, data_b = (
+                    _parse_json(saved) if isinstance(saved, str) else saved
+                    for saved in (st.session_state.saved_scenarios[plan_a], st.session_state.saved_scenarios[plan_b])
+                )
 
                 def _get_val(d, key, default=0):
                     return d.get(key, default)
@@ -16628,17 +16674,9 @@ def save_load_tab():
     with col2:
         st.markdown("**Import from JSON File**")
 
-        uploaded_file = st.file_uploader("Choose a JSON file", type=['json'])
-
-        if uploaded_file is not None:
-            try:
-                import_data = uploaded_file.read().decode('utf-8')
-                if load_data(import_data):
-                    st.success("✅ Successfully imported scenario!")
-                    st.rerun()
-
-            except Exception as e:
-                st.error(f"❌ Error importing file: {str(e)}")
+        # on_change fires once per newly chosen file, not on every rerun while it stays selected
+        st.file_uploader("Choose a JSON file", type=['json'], key="import_scenario_file", on_change=_import_scenario_file)
+        _show_load_result('_import_scenario_result')
 
 
 # NEW TAB 1: Healthcare & Insurance
@@ -16696,8 +16734,8 @@ def healthcare_insurance_tab():
     # Health Insurance Plans
     st.subheader("🏥 Health Insurance Plans")
 
-    if st.button("➕ Add Health Insurance Plan"):
-        new_insurance = HealthInsurance(
+    def _new_health_insurance():
+        return HealthInsurance(
             name="New Health Plan",
             type="Employer",
             monthly_premium=500.0,
@@ -16709,8 +16747,9 @@ def healthcare_insurance_tab():
             start_age=0,
             end_age=65
         )
-        st.session_state.health_insurances.append(new_insurance)
-        st.rerun()
+
+    st.button("➕ Add Health Insurance Plan", on_click=_append_list_item,
+              args=("health_insurances", _new_health_insurance))
 
     for idx, insurance in enumerate(st.session_state.health_insurances):
         with st.expander(f"📋 {insurance.name}"):
@@ -16758,9 +16797,8 @@ def healthcare_insurance_tab():
                 )
 
             with col3:
-                if st.button(f"🗑️ Delete##{idx}_insurance"):
-                    st.session_state.health_insurances.pop(idx)
-                    st.rerun()
+                st.button(f"🗑️ Delete##{idx}_insurance", on_click=_remove_list_item,
+                          args=("health_insurances", idx))
 
             st.session_state.health_insurances[idx] = insurance
 
@@ -16795,8 +16833,8 @@ def healthcare_insurance_tab():
     # Long-Term Care Insurance
     st.subheader("🏨 Long-Term Care Insurance")
 
-    if st.button("➕ Add LTC Insurance Policy"):
-        new_ltc = LongTermCareInsurance(
+    def _new_ltc_insurance():
+        return LongTermCareInsurance(
             name="LTC Policy",
             monthly_premium=300.0,
             daily_benefit=200.0,
@@ -16806,8 +16844,9 @@ def healthcare_insurance_tab():
             start_age=55,
             inflation_protection=0.03
         )
-        st.session_state.ltc_insurances.append(new_ltc)
-        st.rerun()
+
+    st.button("➕ Add LTC Insurance Policy", on_click=_append_list_item,
+              args=("ltc_insurances", _new_ltc_insurance))
 
     for idx, ltc in enumerate(st.session_state.ltc_insurances):
         _ltc_person_display = st.session_state.parent1_name if ltc.covered_person == "Parent 1" else st.session_state.parent2_name
@@ -16855,9 +16894,8 @@ def healthcare_insurance_tab():
                 )
 
             with col3:
-                if st.button(f"🗑️ Delete##ltc{idx}"):
-                    st.session_state.ltc_insurances.pop(idx)
-                    st.rerun()
+                st.button(f"🗑️ Delete##ltc{idx}", on_click=_remove_list_item,
+                          args=("ltc_insurances", idx))
 
             st.session_state.ltc_insurances[idx] = ltc
 
@@ -17312,16 +17350,29 @@ def report_export_tab():
 
                         cashflow_proj = report_data['cashflow_projections']
 
-                        # Calculate key metrics
+                        # Calculate key metrics in a single pass over the projection
                         final_year = cashflow_proj[-1]
-                        retirement_years = [y for y in cashflow_proj if y['parent1_age'] >= st.session_state.parentX_retirement_age or y['parent2_age'] >= st.session_state.parentY_retirement_age]
-
-                        min_net_worth_year = min(cashflow_proj, key=lambda x: x['net_worth'])
-                        max_net_worth_year = max(cashflow_proj, key=lambda x: x['net_worth'])
-
-                        avg_income_working = sum(y['total_income'] for y in cashflow_proj if y['parent1_age'] < st.session_state.parentX_retirement_age or y['parent2_age'] < st.session_state.parentY_retirement_age) / len([y for y in cashflow_proj if y['parent1_age'] < st.session_state.parentX_retirement_age or y['parent2_age'] < st.session_state.parentY_retirement_age]) if len([y for y in cashflow_proj if y['parent1_age'] < st.session_state.parentX_retirement_age or y['parent2_age'] < st.session_state.parentY_retirement_age]) > 0 else 0
-
-                        avg_expenses = sum(y['total_expenses'] for y in cashflow_proj) / len(cashflow_proj)
+                        p1_retirement_age = st.session_state.parentX_retirement_age
+                        p2_retirement_age = st.session_state.parentY_retirement_age
+                        min_net_worth_year = max_net_worth_year = cashflow_proj[0]
+                        retirement_year_count = 0
+                        working_income = 0
+                        working_year_count = 0
+                        lifetime_expenses = 0
+                        for y in cashflow_proj:
+                            if y['net_worth'] < min_net_worth_year['net_worth']:
+                                min_net_worth_year = y
+                            if y['net_worth'] > max_net_worth_year['net_worth']:
+                                max_net_worth_year = y
+                            if y['parent1_age'] >= p1_retirement_age or y['parent2_age'] >= p2_retirement_age:
+                                retirement_year_count += 1
+                            if y['parent1_age'] < p1_retirement_age or y['parent2_age'] < p2_retirement_age:
+                                working_income += y['total_income']
+                                working_year_count += 1
+                            lifetime_expenses += y['total_expenses']
+
+                        avg_income_working = working_income / working_year_count if working_year_count > 0 else 0
+                        avg_expenses = lifetime_expenses / len(cashflow_proj)
 
                         summary_text = f"""
                         <b>Planning Horizon:</b> {cashflow_proj[0]['year']} - {final_year['year']} ({len(cashflow_proj)} years)<br/>
@@ -17330,7 +17381,7 @@ def report_export_tab():
                         <b>Maximum Net Worth:</b> ${max_net_worth_year['net_worth']:,.0f} (Year {max_net_worth_year['year']})<br/>
                         <b>Average Annual Income (Working Years):</b> ${avg_income_working:,.0f}<br/>
                         <b>Average Annual Expenses (Lifetime):</b> ${avg_expenses:,.0f}<br/>
-                        <b>Retirement Years Covered:</b> {len(retirement_years)} years
+                        <b>Retirement Years Covered:</b> {retirement_year_count} years
                         """
                         elements.append(Paragraph(summary_text, styles['Normal']))
                         elements.append(Spacer(1, 12))
@@ -17342,13 +17393,10 @@ def report_export_tab():
 
                         # Generate and add cashflow chart
                         try:
-                            years = [d['year'] for d in cashflow_proj]
-                            income = [d['total_income'] for d in cashflow_proj]
-                            expenses = [d['total_expenses'] for d in cashflow_proj]
-                            net_worth = [d['net_worth'] for d in cashflow_proj]
+                            years, income, expenses, net_worth = _cashflow_columns(
+                                cashflow_proj, 'year', 'total_income', 'total_expenses', 'net_worth')
 
                             # Create cashflow chart with dual y-axis
-                            from plotly.subplots import make_subplots
                             cashflow_fig = make_subplots(
                                 specs=[[{"secondary_y": True}]]
                             )
@@ -17621,7 +17669,9 @@ def report_export_tab():
                         st.success("✅ Excel report generated successfully!")
 
                 elif report_format == "JSON (Data Export)":
-                    json_str = json.dumps(report_data, indent=2, default=str)
+                    # Monte Carlo paths are a NumPy array; export them as nested lists
+                    json_str = json.dumps(report_data, indent=2,
+                                          default=lambda obj: obj.tolist() if isinstance(obj, np.ndarray) else str(obj))
 
                     # Show file save dialog
                     if TKINTER_AVAILABLE:
@@ -1,4 +1,5 @@
 import os
+import socket
 import sys
 import webbrowser
 import time
@@ -7,10 +8,31 @@ import threading
 #Use this command in terminal to compile the program 
 #pyinstaller --onefile --console --icon=icons8-piggy-bank-64.ico --add-data "FinancialApp_V14.py;." --collect-all=streamlit --name "FinancialPlanner" launcher.py
 
-def open_browser():
-    time.sleep(4)
+PORT = 8501
+URL = f'http://localhost:{PORT}'
+
+# Set once Streamlit has exited so a still-polling open_browser gives up instead of
+# opening a page for a server that is gone
+_browser_cancel = threading.Event()
+
+
+def open_browser(url, port, timeout=30):
+    """Open the browser as soon as Streamlit accepts connections on port, giving up after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    backoff = 0.05
+    while time.monotonic() < deadline:
+        with socket.socket() as s:
+            s.settimeout(0.2)
+            if s.connect_ex(('127.0.0.1', port)) == 0:
+                break
+        if _browser_cancel.wait(backoff):
+            return
+        backoff = min(backoff * 1.5, 0.5)
+    else:
+        print(f"Streamlit didn't start within {timeout}s - open {url} manually.")
+        return
     try:
-        webbrowser.open('http://localhost:8501')
+        webbrowser.open(url)
     except:
         pass
 
@@ -34,16 +56,23 @@ def main():
         input("Press Enter to exit...")
         return
 
-    print("Browser will open at: http://localhost:8501")
+    print(f"Browser will open at: {URL}")
 
-    # Change to app directory and start browser
+    # Change to app directory and start browser. Daemon via the constructor kwarg
+    # (setDaemon() is deprecated) so the opener can never keep the launcher alive.
     os.chdir(app_dir)
-    browser_thread = threading.Thread(target=open_browser, daemon=True)
+    browser_thread = threading.Thread(target=open_browser, args=(URL, PORT), daemon=True)
     browser_thread.start()
 
     # Run streamlit using os.system (this works with PyInstaller)
-    cmd = f'streamlit run "{app_file}" --server.headless true --browser.gatherUsageStats false'
-    os.system(cmd)
+    cmd = f'streamlit run "{app_file}" --server.port {PORT} --server.headless true --browser.gatherUsageStats false'
+    try:
+        os.system(cmd)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        _browser_cancel.set()
+        browser_thread.join(timeout=0.1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,41 @@
+"""
+Numba-compiled kernels for the Monte Carlo and stress-test tabs of FinancialPlanner_v0_8.py.
+
+They live in their own module because Streamlit re-runs the app script as __main__
+on every rerun, and numba's on-disk cache has to re-import the module that defined
+a kernel. Importing this module raises ImportError when numba is not installed;
+the app then falls back to its NumPy versions of the same loops.
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def simulate_trajectories(cashflows, returns, initial_net_worth):
+    """Net worth paths (num_sims, num_years): each year nw += cashflow + nw * return, one path at a time."""
+    num_sims, num_years = cashflows.shape
+    trajectories = np.empty((num_sims, num_years))
+    for i in range(num_sims):
+        net_worth = initial_net_worth
+        for j in range(num_years):
+            net_worth = net_worth + cashflows[i, j] + net_worth * returns[i, j]
+            trajectories[i, j] = net_worth
+    return trajectories
+
+
+@njit(cache=True)
+def event_final_net_worths(pct_values, start_multiplier, first_offset, shocks, investment_return, num_starts):
+    """Final net worth of a percentile trajectory with an event starting in each of its first num_starts years."""
+    num_years = len(pct_values)
+    final_net_worths = np.empty(num_starts)
+    for start in range(num_starts):
+        net_worth = pct_values[start] * start_multiplier
+        for year_idx in range(start + first_offset, num_years):
+            cashflow = 0.0
+            if year_idx < num_years - 1:
+                cashflow = (pct_values[year_idx + 1] - pct_values[year_idx]) - pct_values[year_idx] * investment_return
+                if year_idx - start < len(shocks):
+                    cashflow -= shocks[year_idx - start]
+            net_worth = net_worth + cashflow + net_worth * investment_return
+        final_net_worths[start] = net_worth
+    return final_net_worths
@@ -5,10 +5,12 @@ Injects custom CSS that:
 1. Replaces the initial boot skeleton/loading screen with a branded spinner
 2. Hides the sports-themed running icons in the top-right rerun indicator
 """
-import streamlit
+import importlib.util
 import os
 
-static_dir = os.path.join(os.path.dirname(streamlit.__file__), 'static')
+# find_spec locates the installed package without running streamlit/__init__.py,
+# which would import much of Streamlit just to tell us where its files are
+static_dir = os.path.join(os.path.dirname(importlib.util.find_spec('streamlit').origin), 'static')
 index_path = os.path.join(static_dir, 'index.html')
 
 CUSTOM_STYLES = """
@@ -0,0 +1,77 @@
+"""Test the compiled Monte Carlo kernels and the orjson paths against their fallbacks"""
+import hashlib
+import json
+import sys
+sys.path.insert(0, "/app")
+import numpy as np
+import FinancialPlanner_v0_8 as fp
+import mc_kernels
+
+assert fp.NUMBA_AVAILABLE, "numba is in requirements.txt but could not be imported"
+assert fp._simulate_trajectories is mc_kernels.simulate_trajectories
+assert fp._event_final_net_worths is mc_kernels.event_final_net_worths
+print("[PASS] Compiled kernels in use")
+
+rng = np.random.default_rng(7)
+
+# Trajectories: same recurrence, same order of operations, so bitwise equal
+cashflows = rng.normal(10000, 5000, (500, 40))
+returns = rng.normal(0.06, 0.15, (500, 40))
+compiled = mc_kernels.simulate_trajectories(cashflows, returns, 100000.0)
+assert np.array_equal(compiled, fp._simulate_trajectories_vectorized(cashflows, returns, 100000.0)), "Trajectories differ"
+assert np.array_equal(compiled, fp._simulate_trajectories_threaded(cashflows, returns, 100000.0)), "Threaded trajectories differ"
+print(f"[PASS] Trajectories: {compiled.shape[0]} paths x {compiled.shape[1]} years match")
+
+# Event replay: every start year, with and without shocks and a delayed first year
+pct_values = np.cumsum(rng.normal(20000, 10000, 40)) + 100000
+for start_multiplier, first_offset, shocks, num_starts in [
+    (1.0, 0, np.array([]), 40),
+    (0.8, 1, np.array([30000.0, 20000.0, 10000.0]), 30),
+    (0.5, 2, np.full(45, 5000.0), 40),
+    (1.0, 0, np.array([50000.0]), 1),
+]:
+    compiled = mc_kernels.event_final_net_worths(pct_values, start_multiplier, first_offset, shocks, 0.05, num_starts)
+    fallback = fp._event_final_net_worths_vectorized(pct_values, start_multiplier, first_offset, shocks, 0.05, num_starts)
+    assert np.allclose(compiled, fallback, rtol=1e-12, atol=1e-6), \
+        f"Event replay differs (offset {first_offset}, {len(shocks)} shocks)"
+print("[PASS] Event replay matches for 4 event shapes")
+
+# Worst start year picked through the compiled kernel
+worst, worst_year = fp._worst_event_start(pct_values, list(range(2026, 2066)), 0.8, 1, [30000.0, 20000.0], 0.05)
+fallback = fp._event_final_net_worths_vectorized(pct_values, 0.8, 1, np.array([30000.0, 20000.0]), 0.05, 40)
+assert worst_year == 2026 + int(np.argmin(fallback)), f"Worst start year {worst_year} differs"
+print(f"[PASS] Worst event start: {worst_year}")
+
+# JSON parsing: orjson and json agree, and stdlib-only NaN/Infinity falls back to json
+assert fp.ORJSON_AVAILABLE, "orjson is in requirements.txt but could not be imported"
+plan = {"parent1_name": "Alex", "net_worth": 90000.5, "children": [{"name": "Sam", "birth_year": 2020}], "notes": None}
+raw = json.dumps(plan)
+assert fp._parse_json(raw) == fp._parse_json(raw.encode()) == json.loads(raw), "orjson parse differs"
+nan_plan = fp._parse_json(json.dumps({"rate": float("nan"), "cap": float("inf")}))
+assert np.isnan(nan_plan["rate"]) and nan_plan["cap"] == float("inf"), "NaN/Infinity fallback failed"
+try:
+    fp._parse_json("{not json")
+    assert False, "Invalid JSON should raise"
+except json.JSONDecodeError:
+    pass
+fp.ORJSON_AVAILABLE = False
+assert fp._parse_json(raw) == json.loads(raw), "json parse differs"
+fp.ORJSON_AVAILABLE = True
+print("[PASS] JSON parsing: orjson, NaN/Infinity fallback, errors, json only")
+
+# Fingerprints: stable for equal data whatever the key order, different for changed data,
+# and plans orjson can't encode (integers wider than 64 bits) fall back to json
+fingerprint = fp._json_fingerprint(plan)
+assert fingerprint == fp._json_fingerprint(dict(reversed(list(plan.items())))), "Key order changed the fingerprint"
+assert fingerprint != fp._json_fingerprint({**plan, "net_worth": 90001.5}), "Changed data kept the fingerprint"
+assert fp._json_fingerprint({"rates": np.array([0.05, 0.07]), 2030: "year"}) == \
+    fp._json_fingerprint({2030: "year", "rates": np.array([0.05, 0.07])}), "numpy/int-key plan not stable"
+huge = {"balance": 2 ** 70}
+assert fp._json_fingerprint(huge) == hashlib.sha256(json.dumps(huge, sort_keys=True).encode()).hexdigest(), \
+    "Wide integer did not fall back to json"
+fp.ORJSON_AVAILABLE = False
+assert fp._json_fingerprint(plan) == hashlib.sha256(json.dumps(plan, sort_keys=True, default=str).encode()).hexdigest()
+fp.ORJSON_AVAILABLE = True
+print("[PASS] Fingerprints: orjson, wide-integer fallback, json only")
+
+print("\nALL 6 TESTS PASSED")
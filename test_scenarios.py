@@ -153,20 +153,26 @@ print("\n=== TEST: Expense Templates ===")
 # Extract ADULT_EXPENSE_TEMPLATES from source
 import re
 
+_BRACES = re.compile(r'[{}]')
+
+
+def dict_literal(start):
+    """Source text from start through the close of the first {...} literal after it.
+
+    The regex jumps straight from brace to brace, so only the braces are visited
+    rather than every character of the literal.
+    """
+    depth = 0
+    for m in _BRACES.finditer(source, start):
+        depth += 1 if m.group() == '{' else -1
+        if depth == 0:
+            return source[start:m.end()]
+    raise ValueError(f"Unbalanced braces after offset {start}")
+
+
 # Parse state templates
 state_template_start = source.index('STATE_EXPENSE_TEMPLATES = {')
-# Find matching closing brace
-brace_count = 0
-pos = state_template_start
-for i in range(state_template_start, len(source)):
-    if source[i] == '{':
-        brace_count += 1
-    elif source[i] == '}':
-        brace_count -= 1
-        if brace_count == 0:
-            pos = i + 1
-            break
-state_template_code = source[state_template_start:pos]
+state_template_code = dict_literal(state_template_start)
 state_ns = {}
 exec(state_template_code, state_ns)
 STATE_EXPENSE_TEMPLATES = state_ns['STATE_EXPENSE_TEMPLATES']
@@ -199,32 +205,14 @@ sea_avg_start = source.index('"Seattle": {') + len('"Seattle": {')
 sea_avg_idx = source.index('"Average (statistical)":', sea_avg_start)
 # Extract the dict
 brace_start = source.index('{', sea_avg_idx + 20)
-brace_count = 0
-for i in range(brace_start, brace_start + 2000):
-    if source[i] == '{':
-        brace_count += 1
-    elif source[i] == '}':
-        brace_count -= 1
-        if brace_count == 0:
-            sea_avg_end = i + 1
-            break
-sea_avg_code = source[brace_start:sea_avg_end]
+sea_avg_code = dict_literal(brace_start)
 sea_avg = eval(sea_avg_code)
 sea_avg_total = sum(sea_avg.values())
 
 # Seattle Conservative
 sea_con_idx = source.index('"Conservative (statistical)":', source.index('"Seattle": {'))
 brace_start = source.index('{', sea_con_idx + 20)
-brace_count = 0
-for i in range(brace_start, brace_start + 2000):
-    if source[i] == '{':
-        brace_count += 1
-    elif source[i] == '}':
-        brace_count -= 1
-        if brace_count == 0:
-            sea_con_end = i + 1
-            break
-sea_con_code = source[brace_start:sea_con_end]
+sea_con_code = dict_literal(brace_start)
 sea_con = eval(sea_con_code)
 sea_con_total = sum(sea_con.values())
 
@@ -243,16 +231,7 @@ print(f"  Family shared defaults: ${family_total:,.0f}")
 # Houston Conservative
 hou_con_idx = source.index('"Conservative (statistical)":', source.index('"Houston": {', source.index('ADULT_EXPENSE_TEMPLATES')))
 brace_start = source.index('{', hou_con_idx + 20)
-brace_count = 0
-for i in range(brace_start, brace_start + 2000):
-    if source[i] == '{':
-        brace_count += 1
-    elif source[i] == '}':
-        brace_count -= 1
-        if brace_count == 0:
-            hou_con_end = i + 1
-            break
-hou_con = eval(source[brace_start:hou_con_end])
+hou_con = eval(dict_literal(brace_start))
 hou_con_total = sum(hou_con.values())
 print(f"  Houston Conservative adult: ${hou_con_total:,.0f}")
 
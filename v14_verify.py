@@ -49,28 +49,18 @@ employment_income = parentX_income_emp + parentY_income_emp  # 0
 
 # With the FIX: gross = employment * multiplier + ss
 # Since employment is 0, gross should always equal ss_income regardless of multiplier
-results = []
-for _ in range(1000):
-    income_var = 0.10
-    income_multiplier = 1 + np.random.normal(0, income_var)
-    gross = employment_income * income_multiplier + ss_income
-    results.append(gross)
-
-results = np.array(results)
+# 1000 trial multipliers for one year's gross income, drawn as one array (same values as 1000 scalar draws)
+income_var = 0.10
+income_multiplier = 1 + np.random.normal(0, income_var, 1000)
+results = employment_income * income_multiplier + ss_income
 test("Retired: gross income always equals SS",
      np.all(results == ss_income),
      f"Min: {np.min(results):.2f}, Max: {np.max(results):.2f}, Expected: {ss_income}")
 
 # With the OLD BUG: gross = (employment + ss) * multiplier
 # SS would vary, which is wrong
-results_buggy = []
-for _ in range(1000):
-    income_var = 0.10
-    income_multiplier = 1 + np.random.normal(0, income_var)
-    gross_buggy = (employment_income + ss_income) * income_multiplier
-    results_buggy.append(gross_buggy)
-
-results_buggy = np.array(results_buggy)
+income_multiplier = 1 + np.random.normal(0, income_var, 1000)
+results_buggy = (employment_income + ss_income) * income_multiplier
 test("Old bug would have varied SS (confirming fix is different)",
      np.std(results_buggy) > 1000,
      f"Buggy std: {np.std(results_buggy):.2f}")
@@ -82,14 +72,8 @@ parentY_emp = 85000
 ss = 0  # Not retired yet
 emp = parentX_emp + parentY_emp
 
-varied_results = []
-for _ in range(1000):
-    income_var = 0.10
-    mult = 1 + np.random.normal(0, income_var)
-    gross = emp * mult + ss
-    varied_results.append(gross)
-
-varied_arr = np.array(varied_results)
+mult = 1 + np.random.normal(0, income_var, 1000)
+varied_arr = emp * mult + ss
 test("Working: employment income varies correctly",
      np.std(varied_arr) > 10000,
      f"Std: {np.std(varied_arr):.2f}")